@@ -1,58 +1,179 @@
-"""설문 문항별 원그래프 - Streamlit 앱"""
+"""설문 문항별 원그래프 - Streamlit 앱
+
+업로더가 먼저 뜨도록 pandas/pyarrow(데이터)와 matplotlib(시각화) 스택은
+필요해지는 단계에서 임포트한다. 모듈은 프로세스당 한 번만 로드되므로
+재실행 시 추가 비용은 없다.
+"""
 import streamlit as st
 
-from survey_viewer.config.settings import configure_matplotlib, configure_streamlit
-from survey_viewer.data.loader import ExcelDataLoader
-from survey_viewer.data.preprocessor import TestResponseFilter
-from survey_viewer.data.question_parser import QuestionParser
-from survey_viewer.visualization.factory import create_default_factory
-from survey_viewer.ui.sidebar import SidebarUI
-from survey_viewer.ui.main_content import MainContentUI
-from survey_viewer.ui.participant_view import ParticipantView
+from survey_viewer.config.constants import PROFILE_LOG_PATH, STREAMING_FILE_BYTES
+from survey_viewer.config.settings import (
+    configure_matplotlib, configure_streamlit, configure_warnings
+)
+from survey_viewer.profiling import Profiler, profile_run, profile_stage, profiling_requested
+
+
+# 세션이 보유한 공유 데이터셋 참조 (세션 종료로 수거되면 참조 반납)
+DATASET_LEASE_KEY = "dataset_lease"
+WAVE_LEASES_KEY = "wave_leases"
+
+# 세션의 증분 집계 계보 (세션 종료로 수거되면 누적 상태 제거)
+INCREMENTAL_SESSION_KEY = "incremental_session"
 
 
 def main():
     # 설정 초기화
-    configure_matplotlib()
+    configure_warnings()
     configure_streamlit()
 
+    # 프로파일링 (환경 변수 또는 ?profile=1 일 때만)
+    profiler = None
+    if profiling_requested() or st.query_params.get("profile") == "1":
+        profiler = Profiler()
+
+    with profile_run(profiler):
+        render_app()
+
+    if profiler is not None:
+        from survey_viewer.ui.debug_panel import DebugPanel
+        DebugPanel(profiler).render()
+        if PROFILE_LOG_PATH:
+            profiler.append_to(PROFILE_LOG_PATH)
+
+
+def render_app():
     # 파일 업로드
-    file = st.file_uploader("xlsx 업로드", type=["xlsx"])
+    file = st.file_uploader(
+        "xlsx 또는 스냅샷(arrow/parquet) 업로드",
+        type=["xlsx", "arrow", "parquet"]
+    )
     if not file:
         st.stop()
 
-    # 데이터 로딩
-    loader = ExcelDataLoader(file)
-    sheet = st.selectbox("시트 선택", loader.get_sheet_names())
-    df = loader.load_sheet(sheet)
+    # 데이터 스택 로드 (업로드 이후)
+    from survey_viewer.data.cache import compute_content_hash, get_default_cache
+    from survey_viewer.data.loader import (
+        ChunkedExcelDataLoader, ExcelDataLoader, SnapshotDataLoader
+    )
+
+    # 데이터 로딩 (스냅샷은 XML 파싱 없이 바로 로드, xlsx는 파싱 캐시 사용,
+    # 큰 xlsx는 원본 시트 전체를 캐시에 두지 않고 청크 단위로 읽음)
+    if file.name.lower().endswith(".xlsx"):
+        if file.size >= STREAMING_FILE_BYTES:
+            loader = ChunkedExcelDataLoader(file)
+        else:
+            loader = ExcelDataLoader(file, cache=get_default_cache())
+        content_hash = loader.content_hash
+    else:
+        loader = SnapshotDataLoader(file)
+        content_hash = compute_content_hash(file)
+    sheet_names = loader.get_sheet_names()
+    sheet = st.selectbox("시트 선택", sheet_names)
+
+    # 분석/시각화 스택 로드 (시트 선택 이후, 폰트 확인은 프로세스당 1회)
+    from survey_viewer.analysis.dataset import acquire_dataset
+    from survey_viewer.analysis.incremental import IncrementalSession, get_incremental_aggregator
+    from survey_viewer.analysis.segments import get_segment_index
+    from survey_viewer.visualization.factory import create_default_factory
+    from survey_viewer.ui.sidebar import SidebarUI
+    from survey_viewer.ui.main_content import MainContentUI
+    from survey_viewer.ui.participant_view import ParticipantView
+    from survey_viewer.ui.crosstab_view import CrosstabView
+    from survey_viewer.ui.change_report import ChangeReportView
+    from survey_viewer.ui.wave_comparison import WaveComparisonView
+    configure_matplotlib()
 
-    # 전처리
-    preprocessor = TestResponseFilter()
-    df = preprocessor.process(df)
+    # 로딩 → 테스트 응답 제외 → 문항 파싱 → 인코딩 → 집계
+    # (같은 파일/시트는 모든 세션이 한 벌을 공유, 세션은 참조만 보유)
+    lease = st.session_state.get(DATASET_LEASE_KEY)
+    if lease is None or lease.key != (content_hash, sheet):
+        if lease is not None:
+            lease.release()
+        lease = acquire_dataset(content_hash, loader, sheet)
+        st.session_state[DATASET_LEASE_KEY] = lease
+    dataset = lease.value
+    df = dataset.df
+    questions = dataset.question_list
     st.caption(f"분석에 포함된 응답 수: {len(df)} (테스트 응답 제외 적용)")
 
-    # 문항 파싱
-    parser = QuestionParser()
-    questions = parser.parse(df)
+    # 사이드바 렌더링 (세그먼트 조건은 데이터셋별 비트맵 색인 사용)
+    segment_index = get_segment_index(df, questions, dataset.aggregates)
+    sidebar = SidebarUI(questions, segment_index)
+    options = sidebar.render()
+
+    # 같은 설문 재업로드 시 새/변경 응답만 반영 (기본은 공유 데이터셋의 집계 사용)
+    aggregates = dataset.aggregates
+    if options.incremental:
+        session = st.session_state.get(INCREMENTAL_SESSION_KEY)
+        if session is None:
+            session = IncrementalSession(get_incremental_aggregator())
+            st.session_state[INCREMENTAL_SESSION_KEY] = session
+        with profile_stage("aggregate_incremental", rows=len(df)):
+            aggregates, report = session.update(df, questions)
+        ChangeReportView(report, questions).render()
+
+    # 세그먼트 안의 문항별 응답 수 (비트셋 교집합 popcount)
+    if options.segment:
+        with profile_stage("segment", rows=len(df)):
+            rows = segment_index.evaluate(options.segment)
+            aggregates = segment_index.aggregate(rows, options.segment)
+        st.caption(
+            f"세그먼트 응답자 수: {segment_index.count(rows)} / {len(df)} "
+            "(문항별 분석의 객관식 집계에 적용)"
+        )
 
     # 차트 팩토리
     chart_factory = create_default_factory()
 
-    # 사이드바 렌더링
-    sidebar = SidebarUI(questions)
-    options = sidebar.render()
-
-    # 탭 UI
-    tab1, tab2 = st.tabs(["문항별 분석", "참여자별 응답"])
+    # 탭 UI (시트가 여러 개인 워크북은 차수 비교 탭 추가)
+    compare_waves = isinstance(loader, ExcelDataLoader) and len(sheet_names) > 1
+    tab_names = ["문항별 분석", "참여자별 응답", "교차 분석"]
+    if compare_waves:
+        tab_names.append("차수 비교")
+    tab1, tab2, tab3, *tab4 = st.tabs(tab_names)
 
-    with tab1:
-        main_content = MainContentUI(df, questions, chart_factory, options)
+    with tab1, profile_stage("render_questions", rows=len(df)):
+        main_content = MainContentUI(df, questions, chart_factory, options, aggregates)
         main_content.render()
 
-    with tab2:
+    with tab2, profile_stage("render_participants", rows=len(df)):
         participant_view = ParticipantView(df, questions)
         participant_view.render()
 
+    with tab3, profile_stage("render_crosstab", rows=len(df)):
+        crosstab_view = CrosstabView(df, questions, aggregates, chart_factory, options)
+        crosstab_view.render()
+
+    if compare_waves:
+        with tab4[0], profile_stage("render_waves"):
+            selected = st.multiselect(
+                "비교할 차수(시트)",
+                sheet_names,
+                key="wave_sheets",
+                help="선택한 시트 중 아직 읽지 않은 시트를 한 번에 읽어 비교합니다.",
+            )
+            waves = acquire_session_waves(content_hash, loader, selected)
+            WaveComparisonView(waves, options.include_blank).render()
+
+
+def acquire_session_waves(content_hash, loader, sheet_names):
+    """세션이 보유한 차수별 데이터셋 참조 갱신 (선택에서 빠진 시트는 반납)"""
+    from survey_viewer.analysis.dataset import acquire_datasets
+
+    leases = st.session_state.get(WAVE_LEASES_KEY, {})
+    kept = {}
+    for name, lease in leases.items():
+        if name in sheet_names and lease.key == (content_hash, name):
+            kept[name] = lease
+        else:
+            lease.release()
+
+    missing = [name for name in sheet_names if name not in kept]
+    if len(sheet_names) > 1 and missing:
+        kept.update(acquire_datasets(content_hash, loader, missing))
+    st.session_state[WAVE_LEASES_KEY] = kept
+    return {name: kept[name].value for name in sheet_names if name in kept}
+
 
 if __name__ == "__main__":
     main()
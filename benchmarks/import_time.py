@@ -0,0 +1,123 @@
+"""임포트 시간 벤치마크 - 콜드 스타트 및 재실행 오버헤드 측정
+
+사용법:
+    python benchmarks/import_time.py                      # 측정 결과 출력
+    python benchmarks/import_time.py --save base.json     # 기준값 저장
+    python benchmarks/import_time.py --baseline base.json # 기준값과 비교
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 콜드 스타트 측정 대상 (새 프로세스에서 임포트)
+COLD_TARGETS = [
+    "app",
+    "survey_viewer.data.loader",
+    "survey_viewer.analysis",
+    "survey_viewer.visualization",
+    "survey_viewer.ui",
+]
+
+# 업로더 표시 전에 로드되면 안 되는 모듈
+DEFERRED_MODULES = ["matplotlib", "survey_viewer.visualization", "survey_viewer.analysis"]
+
+# 비교 시 회귀로 판단할 증가율
+REGRESSION_THRESHOLD = 1.2
+
+
+def _run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return result.stderr
+
+
+def measure_cold_import(module: str, repeat: int) -> float:
+    """새 프로세스에서 module 임포트 누적 시간(ms)의 중앙값"""
+    samples = []
+    for _ in range(repeat):
+        stderr = _run_python(f"import {module}")
+        for line in stderr.splitlines():
+            parts = [p.strip() for p in line.split("|")]
+            if len(parts) == 3 and parts[2] == module:
+                samples.append(int(parts[1]) / 1000)
+    return statistics.median(samples)
+
+
+def check_deferred() -> List[str]:
+    """app 임포트 시점에 로드된 지연 대상 모듈 목록"""
+    code = (
+        "import sys, app; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def measure_rerun_overhead(repeat: int) -> Dict[str, float]:
+    """재실행마다 호출되는 설정 함수의 첫 호출/반복 호출 시간(ms)"""
+    sys.path.insert(0, ROOT)
+    from survey_viewer.config.settings import configure_matplotlib
+
+    start = time.perf_counter()
+    configure_matplotlib()
+    first = (time.perf_counter() - start) * 1000
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        configure_matplotlib()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return {"configure_matplotlib.first": first, "configure_matplotlib.rerun": statistics.median(samples)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="결과를 JSON 기준값으로 저장")
+    parser.add_argument("--baseline", help="비교할 기준값 JSON")
+    args = parser.parse_args()
+
+    results = {f"cold.{m}": measure_cold_import(m, args.repeat) for m in COLD_TARGETS}
+    results.update(measure_rerun_overhead(args.repeat * 20))
+
+    for name, value in results.items():
+        print(f"{name:45s} {value:10.2f} ms")
+
+    loaded = check_deferred()
+    if loaded:
+        print(f"경고: app 임포트 시 지연 대상 모듈이 로드됨: {', '.join(loaded)}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = [
+            name for name, value in results.items()
+            if name in baseline and value > baseline[name] * REGRESSION_THRESHOLD
+        ]
+        for name in regressions:
+            print(f"회귀: {name} {baseline[name]:.2f} -> {results[name]:.2f} ms")
+        if regressions:
+            return 1
+
+    return 1 if loaded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
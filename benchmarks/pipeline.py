@@ -0,0 +1,187 @@
+"""파이프라인 벤치마크 - 로더/전처리/유형 감지/집계/렌더링 단계별 시간 측정
+
+합성 설문(benchmarks/synthetic.py)을 규모별로 생성해 각 단계의 중앙값 시간을
+측정한다. 결과 이름은 "단계@행수" 형식이며 기준값 JSON과 비교할 수 있다.
+
+사용법:
+    python benchmarks/pipeline.py                                  # 1k/10k/100k
+    python benchmarks/pipeline.py --scales 1000,10000,100000,1000000
+    python benchmarks/pipeline.py --save base.json                 # 기준값 저장
+    python benchmarks/pipeline.py --baseline base.json             # 기준값과 비교
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib  # noqa: E402
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+from benchmarks.synthetic import SurveySpec, generate_survey, write_workbook  # noqa: E402
+from survey_viewer.analysis.aggregators import (  # noqa: E402
+    MultiSelectAggregator, SingleSelectAggregator
+)
+from survey_viewer.analysis.detectors import QuestionType, detect_question_type  # noqa: E402
+from survey_viewer.analysis.encoding import AnswerEncoder  # noqa: E402
+from survey_viewer.analysis.profile import profile_column  # noqa: E402
+from survey_viewer.data.loader import ExcelDataLoader  # noqa: E402
+from survey_viewer.data.preprocessor import TestResponseFilter  # noqa: E402
+from survey_viewer.data.question_parser import QuestionParser  # noqa: E402
+from survey_viewer.visualization.base import ChartOptions  # noqa: E402
+from survey_viewer.visualization.charts.pie_chart import PieChartRenderer  # noqa: E402
+
+
+DEFAULT_SCALES = [1_000, 10_000, 100_000]
+
+# xlsx 쓰기/읽기가 분 단위로 걸리는 규모는 기본적으로 로더 측정 생략
+DEFAULT_MAX_LOAD_ROWS = 200_000
+
+# 비교 시 회귀로 판단할 증가율
+REGRESSION_THRESHOLD = 1.2
+
+
+def _median_ms(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _detect_all(df, columns: List[str]) -> Dict[str, QuestionType]:
+    """캐시 없이 컬럼별 프로파일 계산 + 유형 감지"""
+    return {col: detect_question_type(col, df[col], profile_column(df[col])) for col in columns}
+
+
+def _aggregate_all(aggregator, df, columns: List[str]) -> None:
+    for col in columns:
+        aggregator.aggregate(df[col], include_blank=False)
+        aggregator.aggregate(df[col], include_blank=True)
+
+
+def _render_all(renderer: PieChartRenderer, counts: list, options: ChartOptions) -> None:
+    for value_counts in counts:
+        fig, _ = renderer.render(value_counts, options)
+        if fig is not None:
+            plt.close(fig)
+
+
+def bench_scale(
+    rows: int,
+    repeat: int,
+    data_dir: str,
+    max_load_rows: int
+) -> Dict[str, float]:
+    """한 규모의 단계별 시간(ms)"""
+    # 큰 규모는 한 번만 측정
+    repeat = repeat if rows <= 100_000 else 1
+    spec = SurveySpec(respondents=rows)
+    raw = generate_survey(spec)
+    results = {}
+
+    if rows <= max_load_rows:
+        path = os.path.join(data_dir, f"survey_{rows}_{spec.seed}.xlsx")
+        if not os.path.exists(path):
+            write_workbook([raw], path)
+
+        def load():
+            with open(path, "rb") as f:
+                return ExcelDataLoader(f).load_sheet("Sheet1")
+
+        results["load_sheet"] = _median_ms(load, repeat)
+
+    preprocessor = TestResponseFilter()
+    results["filter"] = _median_ms(lambda: preprocessor.process(raw), repeat)
+    df = preprocessor.process(raw)
+
+    questions = QuestionParser().parse(df)
+    columns = [q.column_name for q in questions]
+    results["detect"] = _median_ms(lambda: _detect_all(df, columns), repeat)
+    types = _detect_all(df, columns)
+    single = [c for c in columns if types[c] == QuestionType.SINGLE_SELECT]
+    multi = [c for c in columns if types[c] == QuestionType.MULTI_SELECT]
+
+    results["aggregate.single"] = _median_ms(
+        lambda: _aggregate_all(SingleSelectAggregator(), df, single), repeat
+    )
+    results["aggregate.multi"] = _median_ms(
+        lambda: _aggregate_all(MultiSelectAggregator(), df, multi), repeat
+    )
+
+    encoder = AnswerEncoder(questions)
+    results["encode"] = _median_ms(lambda: encoder.process(df), repeat)
+    encoded = encoder.process(df)
+    results["aggregate.single.encoded"] = _median_ms(
+        lambda: _aggregate_all(SingleSelectAggregator(), encoded, single), repeat
+    )
+    results["aggregate.multi.encoded"] = _median_ms(
+        lambda: _aggregate_all(MultiSelectAggregator(), encoded, multi), repeat
+    )
+
+    # 렌더링 비용은 보기 수에 좌우되므로 규모와 무관하게 문항 수만큼 측정
+    options = ChartOptions()
+    counts = [SingleSelectAggregator().aggregate(df[c]) for c in single]
+    counts += [MultiSelectAggregator().aggregate(df[c]) for c in multi]
+    renderer = PieChartRenderer()
+    results["render.pie"] = _median_ms(lambda: _render_all(renderer, counts, options), repeat)
+
+    return {f"{name}@{rows}": value for name, value in results.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scales", default=",".join(str(s) for s in DEFAULT_SCALES),
+        help="측정할 응답 수 목록 (쉼표 구분)"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--max-load-rows", type=int, default=DEFAULT_MAX_LOAD_ROWS,
+        help="이 행 수를 넘는 규모는 xlsx 로딩 측정 생략"
+    )
+    parser.add_argument("--data-dir", help="생성한 워크북 보관 경로 (기본: 임시 디렉터리)")
+    parser.add_argument("--save", help="결과를 JSON 기준값으로 저장")
+    parser.add_argument("--baseline", help="비교할 기준값 JSON")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s]
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="survey_bench_")
+    os.makedirs(data_dir, exist_ok=True)
+
+    results = {}
+    for rows in scales:
+        scale_results = bench_scale(rows, args.repeat, data_dir, args.max_load_rows)
+        for name, value in scale_results.items():
+            print(f"{name:45s} {value:10.2f} ms")
+        results.update(scale_results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = [
+            name for name, value in results.items()
+            if name in baseline and value > baseline[name] * REGRESSION_THRESHOLD
+        ]
+        for name in regressions:
+            print(f"회귀: {name} {baseline[name]:.2f} -> {results[name]:.2f} ms")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""합성 설문 데이터 생성기 - 벤치마크용 현실적인 설문 응답 워크북
+
+detect_question_type이 사용하는 규칙을 따른다.
+    - 복수 선택: 제목에 "최대" 포함, 응답은 " | "로 구분
+    - 서술형: 제목에 서술형 힌트("적어" 등) 포함, 응답은 80자 이상 문장
+    - 메타 컬럼: 응답일시, 참여자 (+ 테스트 응답 판별용 연락처 컬럼)
+
+사용법:
+    python benchmarks/synthetic.py out.xlsx --respondents 10000
+    python benchmarks/synthetic.py out.xlsx --respondents 1000 --multi 4 --blank-rate 0.3
+"""
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from survey_viewer.config.constants import (  # noqa: E402
+    CONTACT_COL, DATE_COL, EXCLUDE_CONTACT_KEYWORDS, PARTICIPANT_COL
+)
+
+
+# 서술형 응답 문장 재료
+TEXT_WORDS = [
+    "모임", "이벤트", "진행", "안내", "시간", "장소", "주차", "공간", "직원", "친절",
+    "서비스", "가격", "만족", "불편", "개선", "필요", "좋았습니다", "아쉬웠습니다",
+    "다음에도", "참여하고", "싶어요", "예약", "과정이", "복잡했어요", "음식", "분위기",
+]
+
+# 보기 문구 재료
+OPTION_WORDS = ["매우", "조금", "보통", "그렇다", "아니다", "만족", "불만족", "자주", "가끔", "전혀"]
+
+
+@dataclass
+class SurveySpec:
+    """합성 설문 구성"""
+    respondents: int = 1000
+    single_questions: int = 6       # 단일 선택 문항 수
+    multi_questions: int = 3        # 복수 선택 문항 수
+    text_questions: int = 2         # 서술형 문항 수
+    option_count: int = 6           # 문항별 보기 수
+    blank_rate: float = 0.1         # 무응답 비율
+    max_selections: int = 3         # 복수 선택 최대 선택 수
+    test_response_rate: float = 0.01   # 테스트 응답(연락처에 제외 키워드) 비율
+    seed: int = 0
+
+
+def _options(rng: np.random.Generator, question: int, count: int) -> np.ndarray:
+    words = rng.choice(OPTION_WORDS, size=(count, 2))
+    return np.array([f"{a} {b} {question}-{i + 1}" for i, (a, b) in enumerate(words)], dtype=object)
+
+
+def _single_column(rng: np.random.Generator, spec: SurveySpec, question: int) -> np.ndarray:
+    options = _options(rng, question, spec.option_count)
+    # 보기별 선택 확률은 치우치게 (실제 설문처럼 일부 보기에 응답이 몰림)
+    weights = rng.dirichlet(np.ones(spec.option_count))
+    values = options[rng.choice(spec.option_count, size=spec.respondents, p=weights)]
+    values[rng.random(spec.respondents) < spec.blank_rate] = np.nan
+    return values
+
+
+def _multi_column(rng: np.random.Generator, spec: SurveySpec, question: int) -> np.ndarray:
+    options = _options(rng, question, spec.option_count)
+    n = spec.respondents
+    k = min(spec.max_selections, spec.option_count)
+
+    # 응답자별 선택 수(1..k)만큼 보기를 중복 없이 선택 (난수 정렬 후 앞에서부터)
+    picks = np.argsort(rng.random((n, spec.option_count)), axis=1)[:, :k]
+    counts = rng.integers(1, k + 1, size=n)
+    selected = np.where(np.arange(k) < counts[:, None], options[picks], "")
+
+    joined = pd.Series([" | ".join(row[row != ""]) for row in selected], dtype=object)
+    values = joined.to_numpy()
+    values[rng.random(n) < spec.blank_rate] = np.nan
+    return values
+
+
+def _text_column(rng: np.random.Generator, spec: SurveySpec) -> np.ndarray:
+    n = spec.respondents
+    lengths = rng.integers(15, 45, size=n)
+    words = rng.choice(TEXT_WORDS, size=(n, lengths.max()))
+    values = np.array([" ".join(row[:length]) for row, length in zip(words, lengths)], dtype=object)
+    values[rng.random(n) < spec.blank_rate] = np.nan
+    return values
+
+
+def generate_survey(spec: SurveySpec) -> pd.DataFrame:
+    """합성 설문 응답 DataFrame 생성 (pd.read_excel 결과와 같은 컬럼 구성)"""
+    rng = np.random.default_rng(spec.seed)
+    n = spec.respondents
+
+    columns = {
+        DATE_COL: pd.Timestamp("2025-01-01") + pd.to_timedelta(
+            np.sort(rng.integers(0, 60 * 24 * 30, size=n)), unit="m"
+        ),
+        PARTICIPANT_COL: np.array([f"참여자{i:07d}" for i in range(n)], dtype=object),
+    }
+
+    question = 1
+    for _ in range(spec.single_questions):
+        columns[f"Q{question}. 가장 만족스러운 항목은 무엇인가요?"] = _single_column(rng, spec, question)
+        question += 1
+    for _ in range(spec.multi_questions):
+        columns[f"Q{question}. 관심 있는 항목을 선택해주세요 (최대 {spec.max_selections}개)"] = (
+            _multi_column(rng, spec, question)
+        )
+        question += 1
+    for _ in range(spec.text_questions):
+        columns[f"Q{question}. 개선이 필요한 점을 자유롭게 적어주세요"] = _text_column(rng, spec)
+        question += 1
+
+    contacts = np.array([f"user{i}@example.com" for i in range(n)], dtype=object)
+    is_test = rng.random(n) < spec.test_response_rate
+    contacts[is_test] = rng.choice(EXCLUDE_CONTACT_KEYWORDS, size=int(is_test.sum()))
+    columns[CONTACT_COL] = contacts
+
+    return pd.DataFrame(columns)
+
+
+def write_workbook(frames: List[pd.DataFrame], path: str, sheet_names: List[str] = None) -> str:
+    """DataFrame들을 시트별로 xlsx에 저장"""
+    sheet_names = sheet_names or [f"Sheet{i + 1}" for i in range(len(frames))]
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        for df, sheet_name in zip(frames, sheet_names):
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help="저장할 xlsx 경로")
+    parser.add_argument("--respondents", type=int, default=SurveySpec.respondents)
+    parser.add_argument("--single", type=int, default=SurveySpec.single_questions)
+    parser.add_argument("--multi", type=int, default=SurveySpec.multi_questions)
+    parser.add_argument("--text", type=int, default=SurveySpec.text_questions)
+    parser.add_argument("--options", type=int, default=SurveySpec.option_count)
+    parser.add_argument("--blank-rate", type=float, default=SurveySpec.blank_rate)
+    parser.add_argument("--max-selections", type=int, default=SurveySpec.max_selections)
+    parser.add_argument("--seed", type=int, default=SurveySpec.seed)
+    args = parser.parse_args()
+
+    spec = SurveySpec(
+        respondents=args.respondents,
+        single_questions=args.single,
+        multi_questions=args.multi,
+        text_questions=args.text,
+        option_count=args.options,
+        blank_rate=args.blank_rate,
+        max_selections=args.max_selections,
+        seed=args.seed,
+    )
+    write_workbook([generate_survey(spec)], args.output)
+    print(f"{args.output}: {spec.respondents} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,22 @@
 """분석 모듈 - 집계 및 문항 유형 감지"""
-from .aggregators import Aggregator, SingleSelectAggregator, MultiSelectAggregator
+from .aggregators import (
+    Aggregator, SingleSelectAggregator, MultiSelectAggregator, ChunkAccumulator
+)
+from .crosstab import CrosstabEngine, crosstab_encoded, encode_answers, get_crosstab_engine
+from .encoding import AnswerEncoder, encode_answers_frame, encode_choice_column
 from .detectors import QuestionType, detect_question_type
+from .profile import ColumnProfile, ProfileCache, get_column_profiles, profile_column
+from .sketch import TopKAggregator, TopKChunkAccumulator, TopKSketch
+from .aggregate_store import (
+    AggregateStore, DatasetAggregates, QuestionAggregate, get_aggregate_store
+)
+from .dataset import (
+    SurveyDataset, acquire_dataset, acquire_datasets, build_dataset, build_dataset_from_frame
+)
+from .incremental import (
+    ChangeReport, IncrementalAggregator, IncrementalSession, compute_row_keys,
+    get_incremental_aggregator
+)
+from .segments import Segment, SegmentCondition, SegmentIndex, get_segment_index
+from .waves import compare_waves
+from .text_index import SearchResult, TextIndex, get_text_index
@@ -0,0 +1,154 @@
+"""집계 저장소 - 데이터셋별 문항 집계 결과를 한 번만 계산해 보관"""
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .aggregators import get_aggregator
+from .detectors import QuestionType, detect_question_type
+from .profile import get_column_profiles
+from .sketch import TOP_K_DISTINCT_THRESHOLD, TopKAggregator, TopKSketch
+from ..data.cache import LRUCache
+from ..data.fingerprint import get_fingerprint
+from ..data.question_parser import Question
+from ..profiling import profile_stage
+from ..utils import process_singleton
+
+
+# 집계 결과를 보관할 최대 데이터셋 수
+AGGREGATE_STORE_MAX_DATASETS = 8
+
+# 로딩 중 미리 만든 문항별 요약 (무응답 제외, 무응답 포함)
+SketchPair = Tuple[TopKSketch, TopKSketch]
+
+
+@dataclass(frozen=True)
+class QuestionAggregate:
+    """문항별 집계 결과 (무응답 포함/제외 모두 보관)
+
+    고유 응답이 많은 문항은 상위 K 요약만 보관하고, 정확한 집계는 exact로
+    처음 요청될 때 계산해 둔다.
+    """
+    question_type: QuestionType
+    counts: Optional[pd.Series] = None              # 무응답 제외
+    counts_with_blank: Optional[pd.Series] = None   # 무응답(Blank) 포함
+    sketch: Optional[TopKSketch] = None             # 상위 K 요약 (고유 응답이 많은 문항)
+    sketch_with_blank: Optional[TopKSketch] = None
+    exact: Optional[Callable[[bool], pd.Series]] = field(default=None, compare=False, repr=False)
+    _exact_counts: Dict[bool, pd.Series] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+
+    def get_counts(self, include_blank: bool) -> Optional[pd.Series]:
+        """옵션에 맞는 정확한 집계 결과 반환 (서술형은 None)"""
+        counts = self.counts_with_blank if include_blank else self.counts
+        if counts is None and self.exact is not None:
+            counts = self._exact_counts.get(include_blank)
+            if counts is None:
+                counts = self._exact_counts[include_blank] = self.exact(include_blank)
+        return counts
+
+    def get_display_counts(self, include_blank: bool) -> Optional[pd.Series]:
+        """화면 표시용 집계 (요약한 문항은 상위 K 요약, 나머지는 정확한 집계)"""
+        sketch = self.get_sketch(include_blank)
+        return sketch.to_counts() if sketch is not None else self.get_counts(include_blank)
+
+    def get_sketch(self, include_blank: bool) -> Optional[TopKSketch]:
+        """상위 K 요약 (요약하지 않은 문항은 None)"""
+        return self.sketch_with_blank if include_blank else self.sketch
+
+
+@dataclass(frozen=True)
+class DatasetAggregates:
+    """데이터셋 전체 문항의 집계 결과"""
+    fingerprint: str
+    questions: Dict[str, QuestionAggregate]
+
+    def __getitem__(self, column_name: str) -> QuestionAggregate:
+        return self.questions[column_name]
+
+    def question_type(self, column_name: str) -> QuestionType:
+        return self.questions[column_name].question_type
+
+    def get_counts(self, column_name: str, include_blank: bool) -> Optional[pd.Series]:
+        return self.questions[column_name].get_counts(include_blank)
+
+    def get_display_counts(self, column_name: str, include_blank: bool) -> Optional[pd.Series]:
+        return self.questions[column_name].get_display_counts(include_blank)
+
+    def get_sketch(self, column_name: str, include_blank: bool) -> Optional[TopKSketch]:
+        return self.questions[column_name].get_sketch(include_blank)
+
+
+def compute_aggregates(
+    df: pd.DataFrame,
+    questions: List[Question],
+    sketches: Optional[Dict[str, SketchPair]] = None
+) -> DatasetAggregates:
+    """모든 문항의 유형 감지 및 무응답 포함/제외 집계를 일괄 계산
+
+    고유 응답이 많은 문항은 정확한 집계 대신 청크 단위 상위 K 요약을 만든다.
+    sketches에 로딩 중 만든 단일 선택 요약이 있으면 그대로 쓴다.
+    """
+    columns = [q.column_name for q in questions]
+    sketches = sketches or {}
+    with profile_stage("profile", rows=len(df)):
+        profiles = get_column_profiles(df, columns)
+
+    results = {}
+    for col in columns:
+        series = df[col]
+        question_type = detect_question_type(col, series, profiles[col])
+        if question_type == QuestionType.TEXT:
+            results[col] = QuestionAggregate(question_type)
+            continue
+
+        aggregator = get_aggregator(question_type == QuestionType.MULTI_SELECT)
+        with profile_stage("aggregate_question", question=col, rows=len(series)):
+            if profiles[col].distinct_count <= TOP_K_DISTINCT_THRESHOLD:
+                results[col] = QuestionAggregate(
+                    question_type=question_type,
+                    counts=aggregator.aggregate(series, include_blank=False),
+                    counts_with_blank=aggregator.aggregate(series, include_blank=True),
+                )
+                continue
+
+            # 로딩 중 만든 요약은 응답을 그대로 나눠 센 것이므로 단일 선택 문항에만 사용
+            sketch_pair = sketches.get(col) if question_type == QuestionType.SINGLE_SELECT else None
+            if sketch_pair is None:
+                topk = TopKAggregator(aggregator)
+                sketch_pair = (topk.sketch_series(series, False), topk.sketch_series(series, True))
+            results[col] = QuestionAggregate(
+                question_type=question_type,
+                sketch=sketch_pair[0],
+                sketch_with_blank=sketch_pair[1],
+                exact=partial(aggregator.aggregate, series),
+            )
+
+    return DatasetAggregates(get_fingerprint(df), results)
+
+
+class AggregateStore:
+    """데이터셋 지문 기준 집계 결과 저장소 (LRU)"""
+
+    def __init__(self, max_datasets: int = AGGREGATE_STORE_MAX_DATASETS):
+        self._entries = LRUCache(max_datasets, lambda _: 1)
+
+    def build(self, df: pd.DataFrame, questions: List[Question]) -> DatasetAggregates:
+        """저장된 집계 결과 반환 (없으면 계산 후 저장)"""
+        key = (get_fingerprint(df), tuple(q.column_name for q in questions))
+        aggregates = self._entries.get(key)
+        if aggregates is None:
+            aggregates = compute_aggregates(df, questions)
+            self._entries.put(key, aggregates)
+        return aggregates
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@process_singleton
+def get_aggregate_store() -> AggregateStore:
+    """프로세스 전역 집계 저장소 반환 (Streamlit 재실행 간 유지)"""
+    return AggregateStore()
@@ -1,7 +1,9 @@
 """집계 로직 - 단일/복수 선택 응답 집계"""
 import re
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -16,11 +18,32 @@ class Aggregator(ABC):
         """응답 집계 수행"""
         pass
 
+    def aggregate_chunks(
+        self,
+        chunks: Iterable[pd.Series],
+        include_blank: bool = False
+    ) -> pd.Series:
+        """청크 단위로 나뉜 응답을 순차 집계 후 합산"""
+        total = None
+        for chunk in chunks:
+            total = merge_counts(total, self.aggregate(chunk, include_blank))
+        return finalize_counts(total)
+
 
 class SingleSelectAggregator(Aggregator):
     """단일 선택 응답 집계"""
 
     def aggregate(self, series: pd.Series, include_blank: bool = False) -> pd.Series:
+        if is_encoded(series):
+            # 인코딩된 컬럼은 문자열 처리 없이 정수 코드 bincount
+            _, codes, labels = categorical_choice_codes(series, include_blank)
+            counts = np.bincount(codes, minlength=len(labels))
+            return pd.Series(
+                counts,
+                index=pd.Index(labels, dtype=object, name=series.name),
+                name="count"
+            ).sort_values(ascending=False)
+
         s = series.copy()
 
         if include_blank:
@@ -36,19 +59,30 @@ class MultiSelectAggregator(Aggregator):
     """복수 선택 응답 집계 (| 구분자)"""
 
     def aggregate(self, series: pd.Series, include_blank: bool = False) -> pd.Series:
-        tokens = []
+        codes, uniques, tokens = factorize_pipe(series)
+        if len(codes) == 0:
+            return pd.Series(dtype=int)
 
-        for v in series.tolist():
-            parts = self._split_pipe(v)
-            if not parts and include_blank:
-                tokens.append("Blank")
-            else:
-                tokens.extend(parts)
+        # 고유 응답별 등장 횟수를 토큰 가중치로 사용
+        unique_counts = np.bincount(codes, minlength=len(uniques))
 
-        if not tokens:
+        if include_blank:
+            blank_codes = np.setdiff1d(np.arange(len(uniques)), tokens.index.to_numpy())
+            if len(blank_codes):
+                blanks = pd.Series("Blank", index=blank_codes, dtype=object)
+                tokens = pd.concat([tokens, blanks]).sort_index(kind="stable")
+
+        if tokens.empty:
             return pd.Series(dtype=int)
 
-        return pd.Series(tokens).value_counts()
+        # 고유 응답 등장 순서 = 토큰 첫 등장 순서이므로 value_counts와 동일한 결과
+        weights = pd.Series(unique_counts[tokens.index.to_numpy()])
+        counts = weights.groupby(tokens.to_numpy(), sort=False).sum()
+        return pd.Series(
+            counts.to_numpy(),
+            index=pd.Index(counts.index.to_numpy(), dtype=object),
+            name="count"
+        ).sort_values(ascending=False)
 
     def _split_pipe(self, value) -> list:
         """파이프(|) 구분자로 분리"""
@@ -62,6 +96,124 @@ class MultiSelectAggregator(Aggregator):
         return [x.strip() for x in re.split(PIPE_SPLIT, s) if x and x.strip()]
 
 
+def factorize_pipe(series: pd.Series) -> Tuple[np.ndarray, np.ndarray, pd.Series]:
+    """복수 선택 응답을 고유값 코드로 인코딩하고 고유값만 토큰 분리
+
+    MultiSelectAggregator._split_pipe와 같은 규칙을 따르되, 문자열 분리는
+    행 전체가 아니라 고유 응답에 대해서만 벡터 연산으로 수행한다.
+
+    Returns:
+        (행별 고유값 코드, 고유 응답 배열, 고유값 코드를 인덱스로 갖는 토큰 Series)
+    """
+    if is_encoded(series):
+        codes, uniques = _factorize_categorical(series)
+    else:
+        values = series.astype(object)
+        text = values.astype(str)
+        # None은 str() 결과가 "None"이지만 무응답으로 취급
+        text = text.where(~(values.isna() & (text == "None")), "")
+        codes, uniques = pd.factorize(text.to_numpy())
+
+    stripped = pd.Series(uniques, dtype=object).str.strip()
+    blank = (stripped == "") | (stripped.str.lower() == "nan") | (stripped == ".")
+    answered = stripped[~blank]
+    if answered.empty:
+        return codes, uniques, pd.Series(dtype=object)
+
+    # 앞뒤 공백을 제거한 뒤 "|"로 나누고 토큰을 strip하면 PIPE_SPLIT 분리와 같음
+    parts = answered.str.split("|", regex=False).explode().str.strip()
+    return codes, uniques, parts[parts != ""]
+
+
+def is_encoded(series: pd.Series) -> bool:
+    """AnswerEncoder로 인코딩된(Categorical) 컬럼인지 여부"""
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def _factorize_categorical(series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Categorical 코드를 pd.factorize와 같은 첫 등장 순서 코드로 변환 (결측은 빈 문자열)"""
+    cat_codes = series.cat.codes.to_numpy()
+    categories = np.append(np.asarray(series.cat.categories, dtype=object), "")
+    cat_codes = np.where(cat_codes < 0, len(categories) - 1, cat_codes)
+    codes, first = pd.factorize(cat_codes)
+    return codes, categories[first]
+
+
+def categorical_choice_codes(
+    series: pd.Series,
+    include_blank: bool = False
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """인코딩된 단일 선택 응답을 (포함 행 위치, 라벨 코드, 라벨)로 변환
+
+    SingleSelectAggregator와 같은 무응답 규칙을 따르며, 라벨은 첫 등장 순서다.
+    """
+    codes = series.cat.codes.to_numpy().astype(np.int64)
+    categories = np.asarray(series.cat.categories, dtype=object)
+
+    if include_blank:
+        labels = np.append(np.where(categories == "", "Blank", categories), "Blank")
+        codes = np.where(codes < 0, len(categories), codes)
+        rows = np.arange(len(codes))
+    else:
+        keep = codes >= 0
+        keep[keep] = categories[codes[keep]] != ""
+        rows = np.flatnonzero(keep)
+        codes = codes[keep]
+        labels = categories
+
+    # 같은 라벨(예: "Blank")은 하나로 묶고 첫 등장 순서로 다시 코딩
+    label_codes, label_uniques = pd.factorize(labels.astype(object))
+    codes, first = pd.factorize(label_codes[codes])
+    return rows, codes.astype(np.int64), np.asarray(label_uniques, dtype=object)[first]
+
+
+def merge_counts(total: Optional[pd.Series], counts: pd.Series) -> pd.Series:
+    """누적 집계에 청크 집계 결과를 더함"""
+    if total is None:
+        return counts
+    if counts.empty:
+        return total
+    return total.add(counts, fill_value=0)
+
+
+def finalize_counts(total: Optional[pd.Series]) -> pd.Series:
+    """누적 집계를 value_counts와 같은 형태(정수, 빈도 내림차순)로 정리"""
+    if total is None or total.empty:
+        return pd.Series(dtype=int)
+    return total.astype(int).sort_values(ascending=False, kind="stable")
+
+
+class ChunkAccumulator:
+    """DataFrame 청크를 받아 여러 문항을 한 번의 순회로 집계"""
+
+    def __init__(self, aggregators: Dict[str, Aggregator], include_blank: bool = False):
+        self.aggregators = aggregators
+        self.include_blank = include_blank
+        self._totals: Dict[str, Optional[pd.Series]] = {col: None for col in aggregators}
+        self.row_count = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """청크 하나를 누적 집계에 반영"""
+        self.row_count += len(chunk)
+        for col, aggregator in self.aggregators.items():
+            counts = aggregator.aggregate(chunk[col], self.include_blank)
+            self._totals[col] = merge_counts(self._totals[col], counts)
+
+    def result(self, column: str) -> pd.Series:
+        """문항별 최종 집계 결과"""
+        return finalize_counts(self._totals[column])
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.aggregators)
+
+
+def collect_text_responses(series: pd.Series) -> pd.Series:
+    """서술형 응답 정리 (결측/빈 문자열/"." 제외, 앞뒤 공백 제거)"""
+    s = series.dropna().astype(str).str.strip()
+    return s[(s != "") & (s != ".")]
+
+
 def get_aggregator(is_multi_select: bool) -> Aggregator:
     """문항 유형에 맞는 집계기 반환"""
     if is_multi_select:
@@ -0,0 +1,170 @@
+"""교차 분석 - 객관식 문항 쌍의 분할표 계산"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .aggregators import categorical_choice_codes, factorize_pipe, is_encoded
+from .detectors import QuestionType, detect_question_type
+from .profile import get_column_profiles
+from ..data.cache import LRUCache
+from ..data.fingerprint import get_fingerprint
+from ..utils import process_singleton
+
+
+# 메모이즈할 최대 분할표 / 인코딩 수
+CROSSTAB_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class EncodedAnswers:
+    """문항 응답의 (행 위치, 보기 코드) 목록
+
+    단일 선택은 행마다 최대 1개, 복수 선택은 행마다 선택한 보기 수만큼의
+    항목을 가지며, rows는 오름차순이다.
+    """
+    rows: np.ndarray
+    codes: np.ndarray
+    labels: np.ndarray
+    row_count: int
+
+    def counts(self) -> np.ndarray:
+        """보기별 응답 수"""
+        return np.bincount(self.codes, minlength=len(self.labels))
+
+
+def encode_single(series: pd.Series, include_blank: bool = False) -> EncodedAnswers:
+    """단일 선택 응답 인코딩 (SingleSelectAggregator와 같은 무응답 규칙)"""
+    if is_encoded(series):
+        rows, codes, labels = categorical_choice_codes(series, include_blank)
+        return EncodedAnswers(rows, codes, labels, len(series))
+
+    values = series.astype(object)
+    text = values.astype(str).str.strip()
+    blank = (values.isna() | (text == "")).to_numpy()
+
+    if include_blank:
+        labels_text = text.where(~blank, "Blank")
+        rows = np.arange(len(values))
+    else:
+        labels_text = text[~blank]
+        rows = np.flatnonzero(~blank)
+
+    codes, labels = pd.factorize(labels_text.to_numpy())
+    return EncodedAnswers(rows, codes.astype(np.int64), np.asarray(labels, dtype=object), len(values))
+
+
+def encode_multi(series: pd.Series, include_blank: bool = False) -> EncodedAnswers:
+    """복수 선택 응답 인코딩 (MultiSelectAggregator와 같은 분리/무응답 규칙)"""
+    unique_codes, uniques, tokens = factorize_pipe(series)
+    n_uniques = len(uniques)
+
+    # 고유 응답별 토큰 목록 (unique 코드 순으로 정렬되어 있음)
+    token_owner = tokens.index.to_numpy(dtype=np.int64)
+    token_codes, labels = pd.factorize(tokens.to_numpy())
+    labels = list(labels)
+
+    if include_blank:
+        blank_uniques = np.setdiff1d(np.arange(n_uniques), token_owner)
+        if len(blank_uniques):
+            blank_code = labels.index("Blank") if "Blank" in labels else len(labels)
+            if blank_code == len(labels):
+                labels.append("Blank")
+            order = np.argsort(np.concatenate([token_owner, blank_uniques]), kind="stable")
+            token_owner = np.concatenate([token_owner, blank_uniques])[order]
+            token_codes = np.concatenate([
+                token_codes, np.full(len(blank_uniques), blank_code)
+            ])[order]
+
+    # 행 -> 고유 응답 -> 토큰 목록으로 펼침
+    per_unique = np.bincount(token_owner, minlength=n_uniques)
+    unique_start = np.cumsum(per_unique) - per_unique
+    rows, token_index = _expand(unique_codes, per_unique, unique_start)
+
+    return EncodedAnswers(
+        rows, token_codes[token_index].astype(np.int64),
+        np.asarray(labels, dtype=object), len(series)
+    )
+
+
+def _expand(keys: np.ndarray, lengths: np.ndarray, starts: np.ndarray):
+    """keys[i]마다 lengths[keys[i]]개 항목을 펼쳐 (i, starts + 오프셋) 배열 반환"""
+    reps = lengths[keys]
+    owners = np.repeat(np.arange(len(keys)), reps)
+    offsets = np.arange(reps.sum()) - np.repeat(np.cumsum(reps) - reps, reps)
+    return owners, np.repeat(starts[keys], reps) + offsets
+
+
+def crosstab_encoded(a: EncodedAnswers, b: EncodedAnswers) -> pd.DataFrame:
+    """인코딩된 두 문항의 분할표 (같은 행의 모든 보기 쌍을 bincount)"""
+    per_row_b = np.bincount(b.rows, minlength=b.row_count)
+    row_start_b = np.cumsum(per_row_b) - per_row_b
+
+    a_index, b_index = _expand(a.rows, per_row_b, row_start_b)
+    ka, kb = len(a.labels), len(b.labels)
+    pair_codes = a.codes[a_index] * kb + b.codes[b_index]
+    table = np.bincount(pair_codes, minlength=ka * kb).reshape(ka, kb)
+
+    # 보기 순서는 각 문항의 응답 수 내림차순 (value_counts와 같은 순서)
+    row_order = np.argsort(-a.counts(), kind="stable")
+    col_order = np.argsort(-b.counts(), kind="stable")
+    return pd.DataFrame(
+        table[np.ix_(row_order, col_order)],
+        index=pd.Index(a.labels[row_order], dtype=object),
+        columns=pd.Index(b.labels[col_order], dtype=object),
+    )
+
+
+def encode_answers(series: pd.Series, is_multi: bool, include_blank: bool = False) -> EncodedAnswers:
+    """문항 유형에 맞게 응답 인코딩"""
+    if is_multi:
+        return encode_multi(series, include_blank)
+    return encode_single(series, include_blank)
+
+
+class CrosstabEngine:
+    """데이터셋 지문 기준으로 인코딩과 분할표를 메모이즈하는 교차 분석기"""
+
+    def __init__(self, max_size: int = CROSSTAB_CACHE_SIZE):
+        self._encodings = LRUCache(max_size, lambda _: 1)
+        self._tables = LRUCache(max_size, lambda _: 1)
+
+    def crosstab(
+        self,
+        df: pd.DataFrame,
+        column_a: str,
+        column_b: str,
+        include_blank: bool = False
+    ) -> pd.DataFrame:
+        """column_a(행) x column_b(열) 분할표"""
+        key = (get_fingerprint(df), column_a, column_b, include_blank)
+        table = self._tables.get(key)
+        if table is None:
+            table = crosstab_encoded(
+                self._encode(df, column_a, include_blank),
+                self._encode(df, column_b, include_blank),
+            )
+            self._tables.put(key, table)
+        return table
+
+    def _encode(self, df: pd.DataFrame, column: str, include_blank: bool) -> EncodedAnswers:
+        key = (get_fingerprint(df), column, include_blank)
+        encoded = self._encodings.get(key)
+        if encoded is None:
+            series = df[column]
+            profile = get_column_profiles(df, [column])[column]
+            question_type = detect_question_type(column, series, profile)
+            if question_type == QuestionType.TEXT:
+                raise ValueError(f"Text question cannot be cross-tabulated: {column}")
+
+            encoded = encode_answers(
+                series, question_type == QuestionType.MULTI_SELECT, include_blank
+            )
+            self._encodings.put(key, encoded)
+        return encoded
+
+
+@process_singleton
+def get_crosstab_engine() -> CrosstabEngine:
+    """프로세스 전역 교차 분석기 반환 (Streamlit 재실행 간 유지)"""
+    return CrosstabEngine()
@@ -0,0 +1,168 @@
+"""공유 데이터셋 - 로딩부터 집계까지의 결과를 세션 간 한 벌만 보관"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .aggregate_store import DatasetAggregates, SketchPair, compute_aggregates
+from .aggregators import get_aggregator
+from .encoding import AnswerEncoder
+from .sketch import TopKChunkAccumulator
+from ..config.constants import SHEET_LOAD_WORKERS
+from ..data.loader import ChunkedExcelDataLoader, DataLoader, ExcelDataLoader
+from ..data.preprocessor import TestResponseFilter
+from ..data.question_parser import Question, QuestionParser
+from ..data.registry import DatasetLease, get_dataset_registry
+from ..profiling import profile_stage
+
+
+@dataclass(frozen=True)
+class SurveyDataset:
+    """한 시트의 전처리/인코딩된 응답, 문항 목록, 집계 결과
+
+    레지스트리를 통해 여러 세션이 같은 객체를 공유하므로 df와 집계 결과는
+    제자리 수정하지 않는다 (변경이 필요하면 복사본을 만든다).
+    """
+    df: pd.DataFrame
+    questions: Tuple[Question, ...]
+    aggregates: DatasetAggregates
+
+    @property
+    def question_list(self) -> List[Question]:
+        """UI 컴포넌트용 문항 리스트 (새 리스트)"""
+        return list(self.questions)
+
+
+def build_dataset(loader: DataLoader, sheet_name: str) -> SurveyDataset:
+    """시트 로딩 → 테스트 응답 제외 → 문항 파싱 → 인코딩 → 집계"""
+    if isinstance(loader, ChunkedExcelDataLoader):
+        return build_dataset_streaming(loader, sheet_name)
+
+    with profile_stage("load") as stage:
+        df = loader.load_sheet(sheet_name)
+        stage.rows = len(df)
+    return build_dataset_from_frame(df)
+
+
+def build_dataset_from_frame(df: pd.DataFrame) -> SurveyDataset:
+    """로드된 시트로 데이터셋 생성 (테스트 응답 제외 → 문항 파싱 → 인코딩 → 집계)"""
+    with profile_stage("filter", rows=len(df)):
+        df = TestResponseFilter().process(df)
+    return build_filtered_dataset(df)
+
+
+def build_dataset_streaming(loader: ChunkedExcelDataLoader, sheet_name: str) -> SurveyDataset:
+    """큰 xlsx용 - 청크 단위로 읽으면서 테스트 응답을 제외한 뒤 파싱/인코딩/집계
+
+    원본 시트 전체를 한 번에 DataFrame으로 만들지 않고 남길 행만 모은다.
+    읽는 동안 문항별 상위 K 요약도 청크마다 쌓아 고유 응답이 많은 문항의 집계에 쓴다.
+    """
+    sketcher = _ChunkSketcher()
+    with profile_stage("load") as stage:
+        df = loader.load_sheet(sheet_name, preprocessor=TestResponseFilter(), on_chunk=sketcher.update)
+        stage.rows = len(df)
+    return build_filtered_dataset(df, sketcher.sketches(df))
+
+
+def build_filtered_dataset(
+    df: pd.DataFrame,
+    sketches: Optional[Dict[str, SketchPair]] = None
+) -> SurveyDataset:
+    """테스트 응답을 제외한 시트로 데이터셋 생성 (문항 파싱 → 인코딩 → 집계)"""
+    with profile_stage("parse", rows=len(df)):
+        questions = QuestionParser().parse(df)
+
+    # 레지스트리가 결과를 보관하므로 인코딩/집계 캐시를 거치지 않음
+    with profile_stage("encode", rows=len(df)):
+        df = AnswerEncoder(questions).process(df)
+
+    with profile_stage("aggregate", rows=len(df)):
+        aggregates = compute_aggregates(df, questions, sketches)
+
+    return SurveyDataset(df, tuple(questions), aggregates)
+
+
+class _ChunkSketcher:
+    """스트리밍 로딩 중 문항별 단일 선택 상위 K 요약 (무응답 제외/포함)"""
+
+    def __init__(self):
+        self._accumulators: Dict[bool, TopKChunkAccumulator] = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if not self._accumulators:
+            # 문항 파싱은 컬럼명만 보므로 첫 청크로 충분
+            aggregators = {q.column_name: get_aggregator(False) for q in QuestionParser().parse(chunk)}
+            self._accumulators = {
+                include_blank: TopKChunkAccumulator(aggregators, include_blank)
+                for include_blank in (False, True)
+            }
+        for accumulator in self._accumulators.values():
+            accumulator.update(chunk)
+
+    def sketches(self, df: pd.DataFrame) -> Dict[str, SketchPair]:
+        """합친 시트에서 청크와 같은 값으로 남은 (object) 컬럼의 요약만 반환
+
+        숫자 컬럼은 청크를 합치며 정수가 실수로 바뀔 수 있어 라벨이 달라진다.
+        """
+        if not self._accumulators:
+            return {}
+        without_blank, with_blank = self._accumulators[False], self._accumulators[True]
+        return {
+            col: (without_blank.sketch(col), with_blank.sketch(col))
+            for col in without_blank.aggregators
+            if col in df.columns and df[col].dtype == object
+        }
+
+
+def acquire_dataset(
+    content_hash: str,
+    loader: DataLoader,
+    sheet_name: str
+) -> DatasetLease[SurveyDataset]:
+    """프로세스 전역 레지스트리에서 데이터셋 참조 획득
+
+    같은 파일/시트를 여러 세션이 동시에 처음 열어도 build_dataset은 한 번만 실행된다.
+    데이터셋은 레지스트리가 보관하므로 만든 뒤 파싱 캐시의 원본 시트는 놓아 준다.
+    """
+    def build() -> SurveyDataset:
+        dataset = build_dataset(loader, sheet_name)
+        if isinstance(loader, ExcelDataLoader):
+            loader.release_sheet(sheet_name)
+        return dataset
+
+    return get_dataset_registry().acquire((content_hash, sheet_name), build)
+
+
+def acquire_datasets(
+    content_hash: str,
+    loader: ExcelDataLoader,
+    sheet_names: Sequence[str],
+    max_workers: int = SHEET_LOAD_WORKERS
+) -> Dict[str, DatasetLease[SurveyDataset]]:
+    """여러 시트의 데이터셋 참조를 한 번에 획득
+
+    레지스트리에 없는 시트만 load_sheets로 한꺼번에 읽은 뒤 각각 등록한다.
+    """
+    registry = get_dataset_registry()
+    missing = [name for name in sheet_names if (content_hash, name) not in registry]
+    frames: Dict[str, pd.DataFrame] = {}
+    if missing:
+        with profile_stage("load_sheets") as stage:
+            frames = loader.load_sheets(missing, max_workers=max_workers)
+            stage.rows = sum(len(df) for df in frames.values())
+
+    def builder(sheet_name: str) -> Callable[[], SurveyDataset]:
+        def build() -> SurveyDataset:
+            if sheet_name in frames:
+                dataset = build_dataset_from_frame(frames.pop(sheet_name))
+            else:
+                # 확인 직후 유휴 제거된 경우 시트 하나만 다시 로드
+                dataset = build_dataset(loader, sheet_name)
+            loader.release_sheet(sheet_name)
+            return dataset
+        return build
+
+    return {
+        sheet_name: registry.acquire((content_hash, sheet_name), builder(sheet_name))
+        for sheet_name in sheet_names
+    }
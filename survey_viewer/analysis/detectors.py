@@ -1,9 +1,11 @@
 """문항 유형 감지 - 서술형/객관식 판별"""
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
+from .profile import ColumnProfile, profile_column
+
 
 class QuestionType(Enum):
     """문항 유형"""
@@ -16,7 +18,7 @@ class QuestionType(Enum):
 TEXT_HINTS = ["적어", "순서대로", "떠올려", "사례", "문의/불만", "기준", "어떻게"]
 
 
-def is_text_question(title: str, series: pd.Series) -> bool:
+def is_text_question(title: str, profile: ColumnProfile) -> bool:
     """서술형 문항 여부 판별"""
     # 연락처 문항
     if "연락처" in title:
@@ -27,30 +29,35 @@ def is_text_question(title: str, series: pd.Series) -> bool:
         return True
 
     # 평균 글자수가 길면 서술형으로 가정
-    s = series.dropna().astype(str).str.strip()
-    if len(s) == 0:
+    if profile.non_null_count == 0:
         return False
 
-    return s.str.len().mean() > 80
+    return profile.mean_length > 80
 
 
-def is_multi_select(title: str, series: pd.Series) -> bool:
+def is_multi_select(title: str, profile: ColumnProfile) -> bool:
     """복수 선택 문항 여부 판별"""
     # 문항 제목에 "최대" 포함
     if "최대" in title:
         return True
 
     # 응답에 파이프(|) 포함
-    s_str = series.dropna().astype(str)
-    return s_str.str.contains(r"\|").any()
+    return profile.has_pipe
+
 
+def detect_question_type(
+    title: str,
+    series: pd.Series,
+    profile: Optional[ColumnProfile] = None
+) -> QuestionType:
+    """문항 유형 감지 (profile이 있으면 원본 Series를 다시 스캔하지 않음)"""
+    if profile is None:
+        profile = profile_column(series)
 
-def detect_question_type(title: str, series: pd.Series) -> QuestionType:
-    """문항 유형 감지"""
-    if is_text_question(title, series):
+    if is_text_question(title, profile):
         return QuestionType.TEXT
 
-    if is_multi_select(title, series):
+    if is_multi_select(title, profile):
         return QuestionType.MULTI_SELECT
 
     return QuestionType.SINGLE_SELECT
@@ -0,0 +1,98 @@
+"""응답 인코딩 - 객관식 문항 컬럼을 Categorical로 정규화"""
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from .aggregators import is_encoded
+from .detectors import QuestionType, detect_question_type
+from .profile import get_column_profiles
+from ..data.cache import LRUCache
+from ..data.fingerprint import get_fingerprint, propagate_fingerprint
+from ..data.preprocessor import DataPreprocessor
+from ..data.question_parser import Question
+from ..profiling import profile_stage
+from ..utils import process_singleton
+
+
+# 인코딩 결과를 보관할 최대 데이터셋 수
+ENCODED_FRAME_MAX_DATASETS = 8
+
+
+def encode_choice_column(series: pd.Series) -> pd.Series:
+    """객관식 컬럼을 strip한 문자열 Categorical로 변환 (결측은 결측 유지)
+
+    집계기가 매번 수행하던 str() 변환 + strip을 한 번만 수행하고, 이후에는
+    정수 코드로 집계한다. 빈 문자열/"." 등 무응답 판정은 집계기가 그대로 수행한다.
+    """
+    values = series.astype(object)
+    answered = values.notna().to_numpy()
+    text = values[answered].astype(str).str.strip()
+
+    label_codes, categories = pd.factorize(text.to_numpy())
+    codes = np.full(len(values), -1, dtype=label_codes.dtype)
+    codes[answered] = label_codes
+
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=pd.Index(categories, dtype=object)),
+        index=series.index,
+        name=series.name,
+    )
+
+
+class AnswerEncoder(DataPreprocessor):
+    """문항 파싱 이후 객관식(단일/복수 선택) 컬럼을 Categorical로 변환
+
+    서술형과 메타 컬럼은 그대로 둔다. 복수 선택 컬럼은 응답 조합 단위로
+    인코딩되며, 집계 시 고유 조합만 토큰 분리한 뒤 코드 빈도로 가중한다.
+    """
+
+    def __init__(self, questions: List[Question]):
+        self.columns = [q.column_name for q in questions]
+
+    def process(self, df: pd.DataFrame) -> pd.DataFrame:
+        profiles = get_column_profiles(df, self.columns)
+
+        encoded = []
+        result = df.copy(deep=False)
+        for col in self.columns:
+            series = df[col]
+            if is_encoded(series):
+                continue
+            if detect_question_type(col, series, profiles[col]) == QuestionType.TEXT:
+                continue
+            with profile_stage("encode_question", question=col, rows=len(series)):
+                result[col] = encode_choice_column(series)
+            encoded.append(col)
+
+        if not encoded:
+            return df
+        return propagate_fingerprint(df, result, "encode", *encoded)
+
+
+class EncodedFrameCache:
+    """데이터셋 지문 기준 인코딩 결과 캐시 (Streamlit 재실행 시 재인코딩 방지)"""
+
+    def __init__(self, max_datasets: int = ENCODED_FRAME_MAX_DATASETS):
+        self._entries = LRUCache(max_datasets, lambda _: 1)
+
+    def get(self, df: pd.DataFrame, questions: List[Question]) -> pd.DataFrame:
+        key = (get_fingerprint(df), tuple(q.column_name for q in questions))
+        encoded = self._entries.get(key)
+        if encoded is None:
+            encoded = AnswerEncoder(questions).process(df)
+            self._entries.put(key, encoded)
+        return encoded
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@process_singleton
+def _default_cache() -> EncodedFrameCache:
+    return EncodedFrameCache()
+
+
+def encode_answers_frame(df: pd.DataFrame, questions: List[Question]) -> pd.DataFrame:
+    """프로세스 전역 캐시를 사용해 객관식 컬럼을 인코딩한 DataFrame 반환"""
+    return _default_cache().get(df, questions)
@@ -0,0 +1,480 @@
+"""증분 집계 - 같은 설문의 누적 export 재업로드 시 변경된 행만 반영"""
+import hashlib
+import os
+import pickle
+import threading
+import uuid
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .aggregate_store import DatasetAggregates, QuestionAggregate
+from .aggregators import finalize_counts, get_aggregator, merge_counts
+from .detectors import QuestionType, detect_question_type
+from .profile import ColumnProfile
+from ..config.constants import DATE_COL, INCREMENTAL_STATE_DIR, PARTICIPANT_COL
+from ..data.fingerprint import get_fingerprint
+from ..data.question_parser import Question
+from ..utils import process_singleton
+
+
+# 행 식별 키 컬럼 (둘 다 있으면 사용, 없으면 행 전체 해시)
+ROW_KEY_COLS = (DATE_COL, PARTICIPANT_COL)
+
+# 저장된 상태 형식 버전 (형식이 다른 이전 상태 파일은 무시하고 전체 재집계)
+STATE_VERSION = 2
+
+
+def compute_row_keys(df: pd.DataFrame) -> np.ndarray:
+    """행 식별 키 (응답일시 + 참여자, 없으면 행 전체 해시)
+
+    같은 키가 여러 번 나오면 등장 순번을 함께 해시해 행마다 고유하게 만든다.
+    """
+    key_cols = [c for c in ROW_KEY_COLS if c in df.columns]
+    if len(key_cols) < len(ROW_KEY_COLS):
+        key_cols = list(df.columns)
+
+    hashes = pd.util.hash_pandas_object(df[key_cols], index=False).to_numpy()
+    occurrence = pd.Series(hashes).groupby(hashes, sort=False).cumcount().to_numpy()
+    if not occurrence.any():
+        return hashes
+    return pd.util.hash_pandas_object(
+        pd.DataFrame({"key": hashes, "occurrence": occurrence}), index=False
+    ).to_numpy()
+
+
+def compute_content_hashes(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """문항 컬럼 기준 행 내용 해시 (변경 행 판별용)"""
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+def column_dtypes(df: pd.DataFrame, columns: List[str]) -> pd.Series:
+    """컬럼 dtype 이름 (Categorical은 보기 목록과 무관하게 같은 이름)"""
+    return df[columns].dtypes.astype(str)
+
+
+@dataclass(frozen=True)
+class ProfileStats:
+    """가산적으로 갱신할 수 있는 컬럼 프로파일 통계 (결측 제외, 문자열 변환 + strip 기준)
+
+    고유 응답 수는 행 단위 증감으로 유지할 수 없으므로 추적하지 않는다
+    (유형 감지에는 사용되지 않음).
+    """
+    non_null_count: int = 0
+    length_sum: int = 0
+    pipe_count: int = 0
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "ProfileStats":
+        text = series.dropna().astype(str).str.strip()
+        return cls(
+            non_null_count=len(text),
+            length_sum=int(text.str.len().sum()),
+            pipe_count=int(text.str.contains("|", regex=False).sum()),
+        )
+
+    def __add__(self, other: "ProfileStats") -> "ProfileStats":
+        return ProfileStats(
+            self.non_null_count + other.non_null_count,
+            self.length_sum + other.length_sum,
+            self.pipe_count + other.pipe_count,
+        )
+
+    def __sub__(self, other: "ProfileStats") -> "ProfileStats":
+        return ProfileStats(
+            self.non_null_count - other.non_null_count,
+            self.length_sum - other.length_sum,
+            self.pipe_count - other.pipe_count,
+        )
+
+    @classmethod
+    def from_text_rows(cls, lengths: np.ndarray, pipes: np.ndarray) -> "ProfileStats":
+        """행별 길이(결측은 -1)와 구분자 포함 여부로 계산 (서술형 문항 보관 행용)"""
+        present = lengths >= 0
+        return cls(
+            non_null_count=int(present.sum()),
+            length_sum=int(lengths[present].sum()),
+            pipe_count=int(pipes.sum()),
+        )
+
+    def to_profile(self) -> ColumnProfile:
+        """유형 감지용 ColumnProfile (profile_column과 같은 판정 결과)"""
+        if self.non_null_count == 0:
+            return ColumnProfile(0, 0.0, False, 0)
+        return ColumnProfile(
+            non_null_count=self.non_null_count,
+            mean_length=float(self.length_sum / self.non_null_count),
+            has_pipe=self.pipe_count > 0,
+            distinct_count=0,
+        )
+
+
+def text_row_stats(series: pd.Series) -> pd.DataFrame:
+    """서술형 문항의 행별 통계 (length: strip 후 길이, 결측은 -1 / pipe: 구분자 포함 여부)
+
+    서술형 응답 원문 대신 이 값만 보관해도 삭제/변경 행을 ProfileStats에서 뺄 수 있다.
+    """
+    present = series.notna().to_numpy()
+    text = series.astype(str).str.strip()
+    return pd.DataFrame({
+        "length": np.where(present, text.str.len().to_numpy(), -1).astype(np.int32),
+        "pipe": present & text.str.contains("|", regex=False).to_numpy(),
+    }, index=series.index)
+
+
+def apply_delta(
+    total: Optional[pd.Series],
+    added: Optional[pd.Series],
+    removed: Optional[pd.Series]
+) -> Optional[pd.Series]:
+    """누적 집계에 추가분을 더하고 삭제분을 뺌 (0이 된 항목은 제거)"""
+    if added is not None and not added.empty:
+        total = merge_counts(total, added)
+    if total is not None and removed is not None and not removed.empty:
+        total = total.sub(removed, fill_value=0)
+        total = total[total != 0]
+    if total is None:
+        return None
+    return total.astype("int64")
+
+
+def count_delta(
+    added: Optional[pd.Series],
+    removed: Optional[pd.Series]
+) -> Optional[pd.Series]:
+    """응답별 증감 (추가분 - 삭제분, 0인 항목은 제거하고 감소분은 음수로 유지)"""
+    empty = pd.Series(dtype="int64")
+    added = added if added is not None else empty
+    removed = removed if removed is not None else empty
+    delta = added.sub(removed, fill_value=0)
+    delta = delta[delta != 0]
+    if delta.empty:
+        return None
+    return delta.astype("int64")
+
+
+@dataclass
+class ColumnState:
+    """문항별 누적 상태"""
+    question_type: QuestionType
+    stats: ProfileStats = ProfileStats()            # 유형 감지용 통계
+    counts: Optional[pd.Series] = None              # 무응답 제외 집계
+    counts_with_blank: Optional[pd.Series] = None   # 무응답 포함 집계
+
+
+@dataclass
+class IncrementalState:
+    """설문별 증분 집계 상태
+
+    rows는 행 키를 인덱스로 하는 객관식 문항 값으로, 변경/삭제된 행의 이전 값을
+    집계에서 빼기 위해 보관한다. 서술형 문항은 원문 대신 행별 통계(text_row_stats)만
+    text_rows에 문항별로 보관한다.
+    """
+    columns: List[str]
+    dtypes: pd.Series
+    rows: pd.DataFrame
+    text_rows: Dict[str, pd.DataFrame]
+    content_hashes: pd.Series
+    column_states: Dict[str, ColumnState]
+    fingerprint: str = ""
+    version: int = STATE_VERSION
+
+
+@dataclass(frozen=True)
+class ChangeReport:
+    """재업로드 변경 내역"""
+    added: int = 0              # 새 응답 수
+    changed: int = 0            # 내용이 바뀐 응답 수
+    removed: int = 0            # 사라진 응답 수
+    unchanged: int = 0          # 그대로인 응답 수
+    full_rebuild: bool = False  # 이전 상태 없이 전체 집계했는지 여부
+    type_changes: Dict[str, Tuple[QuestionType, QuestionType]] = field(default_factory=dict)
+    count_deltas: Dict[str, pd.Series] = field(default_factory=dict)   # 문항별 응답 수 증감
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def _aggregate_rows(
+    question_type: QuestionType,
+    series: pd.Series,
+    stats: Optional[ProfileStats] = None
+) -> ColumnState:
+    """행 묶음의 문항 집계 (누적 상태에 더하거나 뺄 단위)"""
+    state = ColumnState(question_type, stats=stats or ProfileStats.from_series(series))
+    if question_type != QuestionType.TEXT:
+        aggregator = get_aggregator(question_type == QuestionType.MULTI_SELECT)
+        state.counts = aggregator.aggregate(series, include_blank=False)
+        state.counts_with_blank = aggregator.aggregate(series, include_blank=True)
+    return state
+
+
+def _detect(column: str, stats: ProfileStats) -> QuestionType:
+    return detect_question_type(column, pd.Series(dtype=object), stats.to_profile())
+
+
+def _stored_rows(
+    df: pd.DataFrame,
+    keys: np.ndarray,
+    column_states: Dict[str, ColumnState]
+) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """보관할 행 (객관식 문항 값, 서술형 문항별 행 통계)"""
+    choice_cols = [c for c, s in column_states.items() if s.question_type != QuestionType.TEXT]
+    rows = df[choice_cols].set_axis(keys, axis=0)
+    text_rows = {
+        col: text_row_stats(df[col]).set_axis(keys, axis=0)
+        for col, s in column_states.items() if s.question_type == QuestionType.TEXT
+    }
+    return rows, text_rows
+
+
+def _replace_rows(stored: pd.DataFrame, outgoing: pd.Index, incoming: pd.DataFrame) -> pd.DataFrame:
+    """보관 행에서 삭제/변경 행을 빼고 새 값 추가"""
+    kept = stored.drop(index=outgoing)
+    return pd.concat([kept, incoming]) if len(incoming) else kept
+
+
+class IncrementalAggregator:
+    """설문 ID별 누적 상태를 유지하며 새 export에서 바뀐 행만 집계에 반영
+
+    행은 응답일시 + 참여자(없으면 행 전체 해시)로 식별하고, 문항 컬럼 내용
+    해시로 변경 여부를 판별한다. 키 해시는 전체 행에 대해 계산하지만 집계는
+    새 행/변경 행/삭제 행에 대해서만 수행한다.
+    """
+
+    def __init__(self, state_dir: Optional[str] = INCREMENTAL_STATE_DIR):
+        self.state_dir = state_dir
+        self._states: Dict[str, IncrementalState] = {}
+        self._results: Dict[str, Tuple[DatasetAggregates, ChangeReport]] = {}
+        self._lock = threading.Lock()
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+
+    def update(
+        self,
+        df: pd.DataFrame,
+        questions: List[Question],
+        survey_id: Optional[str] = None
+    ) -> Tuple[DatasetAggregates, ChangeReport]:
+        """새 export를 반영한 집계 결과와 변경 내역 반환
+
+        Args:
+            df: 전처리된 DataFrame
+            questions: 문항 목록
+            survey_id: 설문 식별자 (없으면 문항 컬럼 구성으로 생성)
+        """
+        columns = [q.column_name for q in questions]
+        survey_id = survey_id or survey_key(columns)
+        fingerprint = get_fingerprint(df)
+
+        with self._lock:
+            # 같은 데이터셋 재실행은 이전 결과 재사용
+            cached = self._results.get(survey_id)
+            if cached is not None and cached[0].fingerprint == fingerprint:
+                return cached
+
+            state = self._states.get(survey_id) or self._load_state(survey_id)
+            # 문항 구성이나 컬럼 dtype이 바뀌면 응답 문자열 표현이 달라지므로 전체 재집계
+            if (
+                state is None
+                or state.columns != columns
+                or not state.dtypes.equals(column_dtypes(df, columns))
+            ):
+                state, report = self._build(df, columns), ChangeReport(
+                    added=len(df), full_rebuild=True
+                )
+            else:
+                report = self._apply(state, df)
+            state.fingerprint = fingerprint
+
+            result = (self._to_aggregates(state), report)
+            self._states[survey_id] = state
+            self._results[survey_id] = result
+            self._save_state(survey_id, state)
+            return result
+
+    def reset(self, survey_id: Optional[str] = None) -> None:
+        """누적 상태 제거 (survey_id가 없으면 전체)"""
+        with self._lock:
+            ids = [survey_id] if survey_id else list(self._states)
+            for key in ids:
+                self._states.pop(key, None)
+                self._results.pop(key, None)
+                if self.state_dir and os.path.exists(self._state_path(key)):
+                    os.remove(self._state_path(key))
+
+    def _build(self, df: pd.DataFrame, columns: List[str]) -> IncrementalState:
+        """이전 상태가 없을 때 전체 집계"""
+        keys = compute_row_keys(df)
+
+        column_states = {}
+        for col in columns:
+            stats = ProfileStats.from_series(df[col])
+            column_states[col] = _aggregate_rows(_detect(col, stats), df[col], stats)
+
+        rows, text_rows = _stored_rows(df, keys, column_states)
+        return IncrementalState(
+            columns=columns,
+            dtypes=column_dtypes(df, columns),
+            rows=rows,
+            text_rows=text_rows,
+            content_hashes=pd.Series(compute_content_hashes(df, columns), index=keys),
+            column_states=column_states,
+        )
+
+    def _apply(self, state: IncrementalState, df: pd.DataFrame) -> ChangeReport:
+        """이전 상태와 비교해 새 행/변경 행/삭제 행만 집계에 반영"""
+        keys = compute_row_keys(df)
+        hashes = compute_content_hashes(df, state.columns)
+
+        # 이전 상태에서의 위치 (키는 행마다 고유)
+        positions = state.content_hashes.index.get_indexer(keys)
+        is_new = positions < 0
+        is_changed = np.zeros(len(keys), dtype=bool)
+        is_changed[~is_new] = state.content_hashes.to_numpy()[positions[~is_new]] != hashes[~is_new]
+
+        is_removed = np.ones(len(state.content_hashes), dtype=bool)
+        is_removed[positions[~is_new]] = False
+        removed_keys = state.content_hashes.index[is_removed]
+
+        incoming_mask = is_new | is_changed
+        incoming = df.loc[incoming_mask, state.columns].set_axis(keys[incoming_mask], axis=0)
+        outgoing = pd.Index(np.concatenate([keys[is_changed], removed_keys.to_numpy()]))
+
+        type_changes = {}
+        count_deltas = {}
+        for col in state.columns:
+            col_state = state.column_states[col]
+            added = _aggregate_rows(col_state.question_type, incoming[col])
+            if col_state.question_type == QuestionType.TEXT:
+                removed_stats = state.text_rows[col].loc[outgoing]
+                dropped = ColumnState(col_state.question_type, stats=ProfileStats.from_text_rows(
+                    removed_stats["length"].to_numpy(), removed_stats["pipe"].to_numpy()
+                ))
+            else:
+                dropped = _aggregate_rows(col_state.question_type, state.rows.loc[outgoing, col])
+
+            stats = col_state.stats + added.stats - dropped.stats
+            question_type = _detect(col, stats)
+
+            if question_type != col_state.question_type:
+                # 유형이 바뀐 문항만 전체 컬럼으로 재집계
+                type_changes[col] = (col_state.question_type, question_type)
+                new_state = _aggregate_rows(question_type, df[col], stats)
+            else:
+                new_state = ColumnState(
+                    question_type,
+                    stats=stats,
+                    counts=apply_delta(col_state.counts, added.counts, dropped.counts),
+                    counts_with_blank=apply_delta(
+                        col_state.counts_with_blank,
+                        added.counts_with_blank,
+                        dropped.counts_with_blank
+                    ),
+                )
+                if question_type != QuestionType.TEXT:
+                    delta = count_delta(added.counts, dropped.counts)
+                    if delta is not None:
+                        count_deltas[col] = finalize_counts(delta)
+            state.column_states[col] = new_state
+
+        # 보관 행 갱신 (유형이 바뀐 문항이 있으면 보관 대상이 달라지므로 새로 만듦)
+        if type_changes:
+            state.rows, state.text_rows = _stored_rows(df, keys, state.column_states)
+        else:
+            state.rows = _replace_rows(state.rows, outgoing, incoming[list(state.rows.columns)])
+            state.text_rows = {
+                col: _replace_rows(stored, outgoing, text_row_stats(incoming[col]))
+                for col, stored in state.text_rows.items()
+            }
+        state.content_hashes = pd.Series(hashes, index=keys)
+
+        added_count = int(is_new.sum())
+        changed_count = int(is_changed.sum())
+        return ChangeReport(
+            added=added_count,
+            changed=changed_count,
+            removed=int(is_removed.sum()),
+            unchanged=len(df) - added_count - changed_count,
+            type_changes=type_changes,
+            count_deltas=count_deltas,
+        )
+
+    def _to_aggregates(self, state: IncrementalState) -> DatasetAggregates:
+        results = {}
+        for col in state.columns:
+            col_state = state.column_states[col]
+            if col_state.question_type == QuestionType.TEXT:
+                results[col] = QuestionAggregate(col_state.question_type)
+                continue
+            results[col] = QuestionAggregate(
+                question_type=col_state.question_type,
+                counts=finalize_counts(col_state.counts),
+                counts_with_blank=finalize_counts(col_state.counts_with_blank),
+            )
+        return DatasetAggregates(state.fingerprint, results)
+
+    def _state_path(self, survey_id: str) -> str:
+        return os.path.join(self.state_dir, f"{survey_id}.pkl")
+
+    def _load_state(self, survey_id: str) -> Optional[IncrementalState]:
+        if not self.state_dir or not os.path.exists(self._state_path(survey_id)):
+            return None
+        with open(self._state_path(survey_id), "rb") as f:
+            state = pickle.load(f)
+        if getattr(state, "version", None) != STATE_VERSION:
+            return None
+        return state
+
+    def _save_state(self, survey_id: str, state: IncrementalState) -> None:
+        if not self.state_dir:
+            return
+        path = self._state_path(survey_id)
+        with open(f"{path}.tmp", "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{path}.tmp", path)
+
+
+class IncrementalSession:
+    """세션 하나의 증분 집계 계보 (세션 상태에 보관)
+
+    프로세스 전역 집계기에서 세션마다 별도 식별자로 누적 상태를 유지하므로
+    다른 세션의 업로드가 변경 내역에 섞이지 않는다. 세션이 끝나 이 객체가
+    수거되면 누적 상태도 제거된다.
+    """
+
+    def __init__(self, aggregator: IncrementalAggregator):
+        self.aggregator = aggregator
+        self.survey_id = uuid.uuid4().hex
+        self._finalizer = weakref.finalize(self, aggregator.reset, self.survey_id)
+
+    def update(
+        self,
+        df: pd.DataFrame,
+        questions: List[Question]
+    ) -> Tuple[DatasetAggregates, ChangeReport]:
+        """이 세션의 이전 업로드 대비 변경분을 반영한 집계 결과와 변경 내역"""
+        return self.aggregator.update(df, questions, survey_id=self.survey_id)
+
+    def close(self) -> None:
+        """누적 상태 제거 (여러 번 호출해도 한 번만 반영)"""
+        self._finalizer()
+
+
+def survey_key(columns: List[str]) -> str:
+    """문항 컬럼 구성으로 설문 식별자 생성"""
+    h = hashlib.sha256()
+    for col in columns:
+        h.update(str(col).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:32]
+
+
+@process_singleton
+def get_incremental_aggregator() -> IncrementalAggregator:
+    """프로세스 전역 증분 집계기 반환 (Streamlit 재실행 간 유지, 세션별 상태는 IncrementalSession)"""
+    return IncrementalAggregator()
@@ -0,0 +1,85 @@
+"""컬럼 프로파일 - 문항 유형 감지에 필요한 통계를 한 번에 계산"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..data.cache import LRUCache
+from ..data.fingerprint import get_fingerprint
+from ..utils import process_singleton
+
+
+# 프로파일을 보관할 최대 (데이터셋, 컬럼) 수
+PROFILE_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    """컬럼 프로파일 (결측 제외, 문자열 변환 + strip 기준)"""
+    non_null_count: int     # 응답 수
+    mean_length: float      # 평균 글자수
+    has_pipe: bool          # 파이프(|) 포함 여부
+    distinct_count: int     # 고유 응답 수
+
+
+def profile_column(series: pd.Series) -> ColumnProfile:
+    """컬럼 프로파일 계산
+
+    원본은 한 번만 해시(factorize)하고, 문자열 변환/길이/파이프 검사는
+    고유값에 대해서만 수행한 뒤 등장 횟수로 가중한다.
+    """
+    codes, uniques = pd.factorize(series)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    non_null_count = int(counts.sum())
+    if non_null_count == 0:
+        return ColumnProfile(0, 0.0, False, 0)
+
+    text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    lengths = text.str.len().to_numpy()
+
+    return ColumnProfile(
+        non_null_count=non_null_count,
+        mean_length=float((lengths * counts).sum() / non_null_count),
+        has_pipe=bool(text.str.contains("|", regex=False).any()),
+        distinct_count=int(text.nunique()),
+    )
+
+
+class ProfileCache:
+    """데이터셋 지문 + 컬럼명 기준 프로파일 캐시"""
+
+    def __init__(self, max_size: int = PROFILE_CACHE_SIZE):
+        self._profiles = LRUCache(max_size, lambda _: 1)
+
+    def get_profiles(
+        self,
+        df: pd.DataFrame,
+        columns: Optional[List[str]] = None
+    ) -> Dict[str, ColumnProfile]:
+        """컬럼별 프로파일 반환 (캐시에 없는 컬럼만 계산)"""
+        fingerprint = get_fingerprint(df)
+        columns = list(df.columns) if columns is None else columns
+
+        profiles = {}
+        for col in columns:
+            key = (fingerprint, col)
+            profile = self._profiles.get(key)
+            if profile is None:
+                profile = profile_column(df[col])
+                self._profiles.put(key, profile)
+            profiles[col] = profile
+        return profiles
+
+
+@process_singleton
+def _default_cache() -> ProfileCache:
+    return ProfileCache()
+
+
+def get_column_profiles(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None
+) -> Dict[str, ColumnProfile]:
+    """프로세스 전역 캐시를 사용해 컬럼별 프로파일 반환"""
+    return _default_cache().get_profiles(df, columns)
@@ -0,0 +1,258 @@
+"""응답자 세그먼트 - 객관식 보기별 비트맵 색인으로 조건부 집계
+
+데이터셋마다 (문항, 보기)별 응답자 비트셋을 한 번 만들어 두고, 세그먼트는
+비트셋의 AND/OR/NOT으로 표현한다. 세그먼트 안의 보기별 응답 수는
+비트셋 교집합의 popcount이므로 세그먼트를 바꿔도 원본 행을 다시 읽지 않는다.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .aggregate_store import DatasetAggregates, QuestionAggregate
+from .aggregators import factorize_pipe, is_encoded, _factorize_categorical
+from .detectors import QuestionType
+from ..data.cache import LRUCache
+from ..data.fingerprint import derive_fingerprint
+from ..data.question_parser import Question
+from ..utils import process_singleton
+
+
+# 무응답 라벨 (집계기와 동일)
+BLANK_LABEL = "Blank"
+
+# 비트셋 색인을 보관할 최대 데이터셋 수
+SEGMENT_INDEX_MAX_DATASETS = 8
+
+
+def popcount(bits: np.ndarray) -> np.ndarray:
+    """비트셋(마지막 축이 uint64 단어)의 켜진 비트 수"""
+    return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+
+
+def _rows_to_bits(rows: np.ndarray, slots: np.ndarray, slot_count: int, words: int) -> np.ndarray:
+    """(행, 슬롯) 쌍을 슬롯별 비트셋 (slot_count, words)으로 변환 (쌍은 중복 없음)"""
+    bits = np.zeros(slot_count * words, dtype=np.uint64)
+    rows = rows.astype(np.uint64)
+    np.bitwise_or.at(
+        bits,
+        slots.astype(np.int64) * words + (rows >> np.uint64(6)).astype(np.int64),
+        np.left_shift(np.uint64(1), rows & np.uint64(63)),
+    )
+    return bits.reshape(slot_count, words)
+
+
+def _unique_choices(series: pd.Series, multi: bool) -> Tuple[np.ndarray, np.ndarray, pd.Series]:
+    """행별 고유 응답 코드, 고유 응답, 고유 응답 코드를 인덱스로 갖는 보기 Series
+
+    단일 선택은 strip한 응답 전체가 보기 하나이고 빈 문자열만 무응답이다
+    (SingleSelectAggregator 규칙). 복수 선택은 factorize_pipe 규칙을 따른다.
+    """
+    if multi:
+        return factorize_pipe(series)
+
+    if is_encoded(series):
+        codes, uniques = _factorize_categorical(series)
+    else:
+        values = series.astype(object)
+        text = values.where(values.notna(), "").astype(str)
+        codes, uniques = pd.factorize(text.to_numpy())
+    options = pd.Series(uniques, dtype=object).str.strip()
+    return codes, uniques, options[options != ""]
+
+
+@dataclass(frozen=True)
+class QuestionBitmap:
+    """문항 하나의 보기별 응답자 비트셋"""
+    question_type: QuestionType
+    labels: np.ndarray          # 보기 라벨 (첫 등장 순서)
+    bits: np.ndarray            # (보기 수, 단어 수) uint64
+    blank: np.ndarray           # 무응답 행 비트셋 (단어 수,)
+
+    @classmethod
+    def build(cls, series: pd.Series, question_type: QuestionType, words: int) -> "QuestionBitmap":
+        multi = question_type == QuestionType.MULTI_SELECT
+        codes, uniques, options = _unique_choices(series, multi)
+
+        # 고유 응답 → 보기 쌍 (한 응답 안의 중복 보기는 한 번만)
+        option_codes, labels = pd.factorize(options.to_numpy())
+        pairs = pd.DataFrame({"u": options.index.to_numpy(), "l": option_codes}).drop_duplicates()
+        blank_uniques = np.setdiff1d(np.arange(len(uniques)), pairs["u"].to_numpy())
+
+        # 고유 응답별 행 목록 (codes 정렬) 에서 쌍마다 행을 펼침
+        unique_counts = np.bincount(codes, minlength=len(uniques))
+        row_order = np.argsort(codes, kind="stable")
+        starts = np.concatenate([[0], np.cumsum(unique_counts)])
+
+        def expand(unique_codes: np.ndarray, slots: np.ndarray):
+            lengths = unique_counts[unique_codes]
+            offsets = np.repeat(starts[unique_codes] - np.cumsum(lengths) + lengths, lengths)
+            return row_order[offsets + np.arange(lengths.sum())], np.repeat(slots, lengths)
+
+        rows, slots = expand(pairs["u"].to_numpy(), pairs["l"].to_numpy())
+        bits = _rows_to_bits(rows, slots, len(labels), words)
+        blank_rows, blank_slots = expand(blank_uniques, np.zeros(len(blank_uniques), dtype=np.int64))
+        blank = _rows_to_bits(blank_rows, blank_slots, 1, words)[0]
+
+        return cls(question_type, np.asarray(labels, dtype=object), bits, blank)
+
+    def select(self, options: Sequence[str]) -> np.ndarray:
+        """선택한 보기 중 하나라도 응답한 행 비트셋 (BLANK_LABEL은 무응답 행)"""
+        result = np.zeros(self.bits.shape[1], dtype=np.uint64)
+        wanted = set(options)
+        for i in np.flatnonzero(np.isin(self.labels, list(wanted))):
+            result |= self.bits[i]
+        if BLANK_LABEL in wanted:
+            result |= self.blank
+        return result
+
+    def counts(self, rows: np.ndarray, name: str, include_blank: bool) -> pd.Series:
+        """rows 비트셋 안의 보기별 응답 수 (집계기 결과와 같은 형태)"""
+        counts = pd.Series(popcount(self.bits & rows), index=self.labels, dtype=np.int64)
+        if include_blank:
+            blank = int(popcount(self.blank & rows))
+            if blank:
+                counts[BLANK_LABEL] = counts.get(BLANK_LABEL, 0) + blank
+        counts = counts[counts > 0]
+        return pd.Series(
+            counts.to_numpy(),
+            index=pd.Index(counts.index.to_numpy(), dtype=object, name=name),
+            name="count"
+        ).sort_values(ascending=False, kind="stable")
+
+
+@dataclass(frozen=True)
+class SegmentCondition:
+    """세그먼트 조건 하나: 문항에서 options 중 하나를 응답 (negate면 응답하지 않음)"""
+    column: str
+    options: Tuple[str, ...]
+    negate: bool = False
+
+
+@dataclass(frozen=True)
+class Segment:
+    """조건들의 결합 (combine: "and" 또는 "or")"""
+    conditions: Tuple[SegmentCondition, ...] = ()
+    combine: str = "and"
+
+    def __bool__(self) -> bool:
+        return bool(self.conditions)
+
+
+class SegmentIndex:
+    """데이터셋의 객관식 문항별 비트맵 색인"""
+
+    def __init__(self, df: pd.DataFrame, questions: List[Question], aggregates: DatasetAggregates):
+        self.row_count = len(df)
+        self.fingerprint = aggregates.fingerprint
+        self.words = (self.row_count + 63) // 64
+        self.columns = [q.column_name for q in questions]
+        self.question_types = {col: aggregates.question_type(col) for col in self.columns}
+
+        self.bitmaps: Dict[str, QuestionBitmap] = {}
+        for col, question_type in self.question_types.items():
+            if question_type == QuestionType.TEXT:
+                continue
+            self.bitmaps[col] = QuestionBitmap.build(df[col], question_type, self.words)
+
+        # 전체 행 비트셋 (마지막 단어의 남는 비트는 0)
+        self.all_rows = np.full(self.words, np.iinfo(np.uint64).max, dtype=np.uint64)
+        tail = self.row_count % 64
+        if tail:
+            self.all_rows[-1] = (np.uint64(1) << np.uint64(tail)) - np.uint64(1)
+
+    def options(self, column: str) -> List[str]:
+        """세그먼트 조건에 쓸 수 있는 보기 (무응답 포함)
+
+        집계기와 마찬가지로 "Blank"라는 응답은 무응답과 같은 보기로 취급한다.
+        """
+        labels = list(self.bitmaps[column].labels)
+        if BLANK_LABEL not in labels:
+            labels.append(BLANK_LABEL)
+        return labels
+
+    def select(self, column: str, options: Sequence[str]) -> np.ndarray:
+        return self.bitmaps[column].select(options)
+
+    def negate(self, rows: np.ndarray) -> np.ndarray:
+        return ~rows & self.all_rows
+
+    def evaluate(self, segment: Segment) -> np.ndarray:
+        """세그먼트에 속한 행 비트셋 (조건이 없으면 전체 행)"""
+        if not segment:
+            return self.all_rows.copy()
+
+        result = None
+        for condition in segment.conditions:
+            rows = self.select(condition.column, condition.options)
+            if condition.negate:
+                rows = self.negate(rows)
+            if result is None:
+                result = rows
+            elif segment.combine == "or":
+                result = result | rows
+            else:
+                result = result & rows
+        return result
+
+    def count(self, rows: np.ndarray) -> int:
+        """비트셋에 속한 응답자 수"""
+        return int(popcount(rows))
+
+    def row_mask(self, rows: np.ndarray) -> np.ndarray:
+        """비트셋을 행별 bool 배열로 변환"""
+        bits = np.unpackbits(rows.view(np.uint8), bitorder="little")
+        return bits[:self.row_count].astype(bool)
+
+    def aggregate(self, rows: np.ndarray, segment: Segment) -> DatasetAggregates:
+        """세그먼트 안의 모든 문항 집계 (popcount만 사용)"""
+        results = {}
+        for col, question_type in self.question_types.items():
+            bitmap = self.bitmaps.get(col)
+            if bitmap is None:
+                results[col] = QuestionAggregate(question_type)
+                continue
+            results[col] = QuestionAggregate(
+                question_type=question_type,
+                counts=bitmap.counts(rows, col, include_blank=False),
+                counts_with_blank=bitmap.counts(rows, col, include_blank=True),
+            )
+        return DatasetAggregates(derive_fingerprint(self.fingerprint, "segment", repr(segment)), results)
+
+
+class SegmentIndexCache:
+    """데이터셋 지문 기준 비트맵 색인 캐시"""
+
+    def __init__(self, max_datasets: int = SEGMENT_INDEX_MAX_DATASETS):
+        self._entries = LRUCache(max_datasets, lambda _: 1)
+
+    def get(
+        self,
+        df: pd.DataFrame,
+        questions: List[Question],
+        aggregates: DatasetAggregates
+    ) -> SegmentIndex:
+        key = (aggregates.fingerprint, tuple(q.column_name for q in questions))
+        index = self._entries.get(key)
+        if index is None:
+            index = SegmentIndex(df, questions, aggregates)
+            self._entries.put(key, index)
+        return index
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@process_singleton
+def _default_cache() -> SegmentIndexCache:
+    return SegmentIndexCache()
+
+
+def get_segment_index(
+    df: pd.DataFrame,
+    questions: List[Question],
+    aggregates: DatasetAggregates
+) -> SegmentIndex:
+    """프로세스 전역 캐시에서 데이터셋의 비트맵 색인 반환 (없으면 생성)"""
+    return _default_cache().get(df, questions, aggregates)
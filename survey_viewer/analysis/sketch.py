@@ -0,0 +1,162 @@
+"""상위 K 요약 - 고유 응답이 매우 많은 객관식 문항의 근사 집계
+
+Space-Saving 요약을 청크 단위로 병합한다. 각 청크는 기존 집계기로 정확히
+센 뒤 요약에 더하므로 무응답/복수 선택 규칙은 집계기와 같고, 메모리는
+capacity개 라벨과 청크 하나의 고유 응답 수로 제한된다.
+
+보장:
+    - 전체 응답 수(total)는 정확하다.
+    - 요약에 남은 라벨의 추정 빈도 c와 오차 e에 대해 c - e <= 실제 빈도 <= c.
+    - 요약 밖 라벨의 실제 빈도는 max_error(요약의 최소 빈도) 이하이고,
+      max_error <= total / capacity 이다.
+"""
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .aggregators import Aggregator, ChunkAccumulator
+from ..config.constants import STREAMING_CHUNK_SIZE
+
+
+# 요약이 보관할 라벨 수
+TOP_K_SKETCH_CAPACITY = 200
+
+# 고유 응답 수가 이보다 많은 문항은 상위 K 요약으로 집계
+TOP_K_DISTINCT_THRESHOLD = 1000
+
+# 요약 밖 라벨 빈도 합을 나타내는 행 이름 (집계 결과의 마지막 행)
+UNTRACKED_LABEL = "(상위 목록 밖)"
+
+
+class TopKSketch:
+    """Space-Saving 상위 K 요약 (청크별 정확한 빈도를 병합)"""
+
+    def __init__(self, capacity: int = TOP_K_SKETCH_CAPACITY):
+        self.capacity = capacity
+        self.total = 0
+        self.counts = pd.Series(dtype=np.int64)     # 라벨별 추정 빈도 (과대 추정)
+        self.errors = pd.Series(dtype=np.int64)     # 라벨별 최대 과대 추정량
+
+    @property
+    def max_error(self) -> int:
+        """요약 밖 라벨의 최대 빈도 (요약이 가득 차지 않았으면 0, 즉 정확)"""
+        if len(self.counts) < self.capacity:
+            return 0
+        return int(self.counts.min())
+
+    @property
+    def exact(self) -> bool:
+        """모든 라벨 빈도가 정확한지 여부"""
+        return self.max_error == 0 and not self.errors.any()
+
+    @classmethod
+    def from_counts(cls, counts: pd.Series, capacity: int = TOP_K_SKETCH_CAPACITY) -> "TopKSketch":
+        """정확한 전체 집계로 만든 요약 (추적 라벨의 오차는 0)"""
+        sketch = cls(capacity)
+        sketch.update(counts)
+        return sketch
+
+    def update(self, chunk_counts: pd.Series) -> None:
+        """청크 하나의 정확한 라벨별 빈도를 요약에 병합"""
+        if chunk_counts.empty:
+            return
+        self.total += int(chunk_counts.sum())
+
+        # 요약에 없던 라벨은 이미 밀려난 빈도가 최대 max_error만큼 있었을 수 있음
+        floor = self.max_error
+        counts = self.counts.add(chunk_counts, fill_value=0).astype(np.int64)
+        errors = self.errors.reindex(counts.index)
+        new = errors.isna().to_numpy()
+        counts[new] += floor
+        errors = errors.fillna(floor).astype(np.int64)
+
+        keep = counts.sort_values(ascending=False, kind="stable").index[:self.capacity]
+        self.counts = counts[keep]
+        self.errors = errors[keep]
+
+    def to_counts(self) -> pd.Series:
+        """추정 빈도 내림차순 + 마지막 행에 요약 밖 빈도 합 (합계는 total과 같음)"""
+        counts = self.counts
+        rest = self.total - int(counts.sum())
+        if rest > 0:
+            counts = pd.concat([counts, pd.Series({UNTRACKED_LABEL: rest})])
+        return pd.Series(
+            counts.to_numpy(dtype=np.int64),
+            index=pd.Index(counts.index.to_numpy(), dtype=object),
+            name="count"
+        )
+
+    def error_bounds(self) -> pd.Series:
+        """to_counts와 같은 순서의 라벨별 최대 과대 추정량 (요약 밖 행은 NaN)"""
+        return self.errors.reindex(self.to_counts().index).astype(float)
+
+
+class TopKAggregator(Aggregator):
+    """기존 집계기를 청크 단위로 실행해 상위 K 요약으로 합치는 집계기"""
+
+    def __init__(
+        self,
+        aggregator: Aggregator,
+        capacity: int = TOP_K_SKETCH_CAPACITY,
+        chunk_size: int = STREAMING_CHUNK_SIZE
+    ):
+        self.aggregator = aggregator
+        self.capacity = capacity
+        self.chunk_size = chunk_size
+
+    def sketch(
+        self,
+        chunks: Iterable[pd.Series],
+        include_blank: bool = False,
+        sketch: Optional[TopKSketch] = None
+    ) -> TopKSketch:
+        """청크를 차례로 집계해 요약에 병합 (sketch가 주어지면 이어서 병합)"""
+        sketch = sketch if sketch is not None else TopKSketch(self.capacity)
+        for chunk in chunks:
+            sketch.update(self.aggregator.aggregate(chunk, include_blank))
+        return sketch
+
+    def sketch_series(self, series: pd.Series, include_blank: bool = False) -> TopKSketch:
+        """메모리에 있는 컬럼을 chunk_size 행씩 나눠 요약"""
+        chunks = (
+            series.iloc[start:start + self.chunk_size]
+            for start in range(0, len(series), self.chunk_size)
+        )
+        return self.sketch(chunks, include_blank)
+
+    def aggregate(self, series: pd.Series, include_blank: bool = False) -> pd.Series:
+        return self.sketch_series(series, include_blank).to_counts()
+
+    def aggregate_chunks(
+        self,
+        chunks: Iterable[pd.Series],
+        include_blank: bool = False
+    ) -> pd.Series:
+        return self.sketch(chunks, include_blank).to_counts()
+
+
+class TopKChunkAccumulator(ChunkAccumulator):
+    """ChunkAccumulator의 상위 K 요약 버전 (스트리밍 로딩 중 문항별 메모리 O(capacity))"""
+
+    def __init__(
+        self,
+        aggregators: Dict[str, Aggregator],
+        include_blank: bool = False,
+        capacity: int = TOP_K_SKETCH_CAPACITY
+    ):
+        super().__init__(aggregators, include_blank)
+        self._sketches = {col: TopKSketch(capacity) for col in aggregators}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """청크 하나를 문항별 요약에 병합"""
+        self.row_count += len(chunk)
+        for col, aggregator in self.aggregators.items():
+            self._sketches[col].update(aggregator.aggregate(chunk[col], self.include_blank))
+
+    def result(self, column: str) -> pd.Series:
+        return self._sketches[column].to_counts()
+
+    def sketch(self, column: str) -> TopKSketch:
+        """문항별 요약 (오차 범위 확인용)"""
+        return self._sketches[column]
@@ -0,0 +1,218 @@
+"""서술형 응답 검색 인덱스 - 문자 n-gram 역색인"""
+import math
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .aggregators import collect_text_responses
+from ..data.cache import LRUCache
+from ..data.fingerprint import get_fingerprint
+from ..utils import process_singleton
+
+
+# 인덱스를 보관할 최대 (데이터셋, 문항) 수
+TEXT_INDEX_CACHE_SIZE = 64
+
+# 검색 결과 페이지 크기
+TEXT_SEARCH_PAGE_SIZE = 50
+
+# 단어 빈도표에 포함할 최소 글자수
+MIN_TERM_LENGTH = 2
+
+# 유니코드 코드포인트 비트 수 (bigram 코드 = 앞 글자 << 21 | 뒤 글자)
+_CODEPOINT_BITS = 21
+_SPACE = ord(" ")
+
+
+def normalize_text(values: pd.Series) -> pd.Series:
+    """검색용 정규화 (NFKC, 소문자, 연속 공백을 공백 하나로)"""
+    return (
+        values.astype(str)
+        .str.normalize("NFKC")
+        .str.lower()
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _codepoints(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+
+def _gram_masks(chars: np.ndarray):
+    """unigram 위치(공백 제외)와 bigram 시작 위치(공백을 포함하지 않는 쌍) 마스크"""
+    is_char = chars != _SPACE
+    return is_char, is_char[:-1] & is_char[1:]
+
+
+def _gram_codes(chars: np.ndarray) -> np.ndarray:
+    """문자 배열의 unigram + bigram 코드
+
+    한국어는 어절 안에서도 조사/어미가 붙으므로 형태소 분석 대신 음절
+    bigram을 색인하고, 한 글자 검색을 위해 unigram도 함께 색인한다.
+    """
+    is_char, pair = _gram_masks(chars)
+    bigrams = (chars[:-1][pair] << np.uint64(_CODEPOINT_BITS)) | chars[1:][pair]
+    return np.concatenate([chars[is_char], bigrams])
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """검색 결과 한 페이지"""
+    total: int                  # 전체 일치 응답 수
+    page: int                   # 현재 페이지 (1부터)
+    page_count: int             # 전체 페이지 수
+    responses: pd.Series        # 현재 페이지 응답 (원본 행 인덱스 유지)
+
+
+class TextIndex:
+    """서술형 문항 하나의 n-gram 역색인
+
+    모든 응답의 (gram 코드, 응답 번호) 쌍을 정렬해 CSR 형태로 보관한다.
+    검색어는 공백으로 나눈 키워드의 AND이며, 각 키워드는 gram posting의
+    교집합으로 후보를 좁힌 뒤 부분 문자열 포함 여부로 확정한다.
+    """
+
+    def __init__(self, series: pd.Series):
+        self.responses = collect_text_responses(series)
+        self._normalized = normalize_text(self.responses).to_numpy(dtype=object)
+        self._build_postings()
+        self._terms: Optional[pd.Series] = None
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def _build_postings(self) -> None:
+        """전체 응답을 하나의 코드포인트 배열로 이어 붙여 벡터 연산으로 색인"""
+        if len(self._normalized) == 0:
+            self._grams = np.empty(0, dtype=np.uint64)
+            self._offsets = np.zeros(1, dtype=np.int64)
+            self._docs = np.empty(0, dtype=np.int32)
+            return
+
+        # 응답 사이는 공백으로 구분해 응답 경계를 넘는 bigram이 생기지 않게 함
+        chars = _codepoints(" ".join(self._normalized))
+        lengths = np.fromiter((len(t) for t in self._normalized), dtype=np.int64)
+        owner = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths + 1)[:len(chars)]
+
+        is_char, pair = _gram_masks(chars)
+        grams = _gram_codes(chars)
+        docs = np.concatenate([owner[is_char], owner[:-1][pair]])
+
+        # (gram, 응답) 순으로 정렬 후 중복 제거
+        order = np.lexsort((docs, grams))
+        grams, docs = grams[order], docs[order]
+        keep = np.ones(len(grams), dtype=bool)
+        keep[1:] = (grams[1:] != grams[:-1]) | (docs[1:] != docs[:-1])
+        grams, docs = grams[keep], docs[keep]
+
+        starts = np.flatnonzero(np.r_[True, grams[1:] != grams[:-1]])
+        self._grams = grams[starts]
+        self._offsets = np.append(starts, len(grams)).astype(np.int64)
+        self._docs = docs.astype(np.int32)
+
+    def _postings(self, gram: np.uint64) -> np.ndarray:
+        i = np.searchsorted(self._grams, gram)
+        if i >= len(self._grams) or self._grams[i] != gram:
+            return np.empty(0, dtype=np.int32)
+        return self._docs[self._offsets[i]:self._offsets[i + 1]]
+
+    def _match_keyword(self, keyword: str, candidates: Optional[np.ndarray]) -> np.ndarray:
+        """키워드를 포함하는 응답 번호 (정렬된 배열)"""
+        grams = np.unique(_gram_codes(_codepoints(keyword)))
+        postings = sorted((self._postings(g) for g in grams), key=len)
+        docs = candidates
+        for posting in postings:
+            docs = posting if docs is None else np.intersect1d(docs, posting, assume_unique=True)
+            if len(docs) == 0:
+                return docs
+
+        # gram이 모두 포함되어도 순서가 다를 수 있으므로 부분 문자열로 확정
+        if len(keyword) > 2:
+            texts = self._normalized[docs]
+            docs = docs[np.fromiter((keyword in t for t in texts), dtype=bool, count=len(docs))]
+        return docs
+
+    def match(self, query: str) -> np.ndarray:
+        """검색어(공백 구분 키워드 AND)와 일치하는 응답 번호"""
+        keywords = normalize_text(pd.Series([query])).iloc[0].split(" ")
+        keywords = [k for k in keywords if k]
+        if not keywords:
+            return np.arange(len(self), dtype=np.int32)
+
+        docs = None
+        # 긴 키워드일수록 후보가 적으므로 먼저 적용
+        for keyword in sorted(keywords, key=len, reverse=True):
+            docs = self._match_keyword(keyword, docs)
+            if len(docs) == 0:
+                break
+        return docs
+
+    def search(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = TEXT_SEARCH_PAGE_SIZE
+    ) -> SearchResult:
+        """검색 결과의 한 페이지 반환 (빈 검색어면 전체 응답)"""
+        docs = self.match(query)
+        page_count = max(1, math.ceil(len(docs) / page_size))
+        page = min(max(1, page), page_count)
+        start = (page - 1) * page_size
+        return SearchResult(
+            total=len(docs),
+            page=page,
+            page_count=page_count,
+            responses=self.responses.iloc[docs[start:start + page_size]],
+        )
+
+    def term_frequencies(self, top_n: int = 30) -> pd.Series:
+        """단어(공백 구분)별 응답 수 상위 top_n (문장부호 제거, 2글자 이상)"""
+        if self._terms is None:
+            terms = (
+                pd.Series(self._normalized, dtype=object)
+                .str.replace(r"[^\w\s]", " ", regex=True)
+                .str.split()
+                .explode()
+                .dropna()
+            )
+            terms = terms[terms.str.len() >= MIN_TERM_LENGTH]
+            # 한 응답에서 여러 번 나와도 1회로 계산 (문서 빈도)
+            pairs = pd.DataFrame({"doc": terms.index, "term": terms.to_numpy()})
+            self._terms = pairs.drop_duplicates()["term"].value_counts().rename("응답 수")
+        return self._terms.head(top_n)
+
+
+class TextIndexCache:
+    """데이터셋 지문 + 컬럼명 기준 검색 인덱스 캐시"""
+
+    def __init__(self, max_size: int = TEXT_INDEX_CACHE_SIZE):
+        self._indexes = LRUCache(max_size, lambda _: 1)
+        self._lock = threading.Lock()
+
+    def get(self, df: pd.DataFrame, column: str) -> TextIndex:
+        key = (get_fingerprint(df), column)
+        index = self._indexes.get(key)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(key)
+                if index is None:
+                    index = TextIndex(df[column])
+                    self._indexes.put(key, index)
+        return index
+
+    def clear(self) -> None:
+        self._indexes.clear()
+
+
+@process_singleton
+def _default_cache() -> TextIndexCache:
+    return TextIndexCache()
+
+
+def get_text_index(df: pd.DataFrame, column: str) -> TextIndex:
+    """프로세스 전역 캐시를 사용해 서술형 문항 검색 인덱스 반환 (데이터셋별 1회 생성)"""
+    return _default_cache().get(df, column)
@@ -0,0 +1,92 @@
+"""차수 비교 - 시트(차수)별 같은 문항의 응답 수/비율 변화"""
+from typing import Dict, List, Sequence
+
+import pandas as pd
+
+from .dataset import SurveyDataset
+from ..data.question_parser import Question, strip_q_prefix
+
+
+# 비교표 지표 이름
+COUNT_COL = "응답 수"
+PERCENT_COL = "비율(%)"
+COUNT_DELTA_COL = "증감"
+PERCENT_DELTA_COL = "비율 증감(%p)"
+
+
+def question_keys(questions: Sequence[Question]) -> List[str]:
+    """차수 간 문항 정렬 기준 (Q번호 접두사를 뗀 제목)
+
+    한 시트 안에 같은 제목이 여러 번 나오면 두 번째부터 "(2)", "(3)"을 붙여
+    차수 간에도 나온 순서대로 맞춘다.
+    """
+    seen: Dict[str, int] = {}
+    keys = []
+    for question in questions:
+        title = strip_q_prefix(question.column_name)
+        seen[title] = seen.get(title, 0) + 1
+        keys.append(title if seen[title] == 1 else f"{title} ({seen[title]})")
+    return keys
+
+
+def wave_counts_long(waves: Dict[str, SurveyDataset], include_blank: bool = False) -> pd.DataFrame:
+    """차수별 객관식 집계를 (차수, 문항, 응답, 응답 수) 행으로 모음
+
+    문항은 Q번호 접두사를 뗀 제목으로 맞추므로 차수마다 번호가 달라도 같은 문항으로 본다.
+    """
+    frames = []
+    for wave, dataset in waves.items():
+        for key, question in zip(question_keys(dataset.questions), dataset.questions):
+            counts = dataset.aggregates.get_counts(question.column_name, include_blank)
+            if counts is None or counts.empty:
+                continue
+            frames.append(pd.DataFrame({
+                "wave": wave,
+                "question": key,
+                "answer": counts.index.to_numpy(dtype=object),
+                "count": counts.to_numpy(),
+            }))
+
+    if not frames:
+        return pd.DataFrame(columns=["wave", "question", "answer", "count"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def compare_waves(waves: Dict[str, SurveyDataset], include_blank: bool = False) -> pd.DataFrame:
+    """문항/응답별 차수 비교표
+
+    행은 (문항, 응답), 열은 (지표, 차수)이며 지표는 응답 수, 비율(%), 직전 차수 대비
+    응답 수 증감, 비율 증감(%p)이다. 해당 차수에 없는 문항은 NaN, 문항은 있으나
+    선택되지 않은 응답은 0으로 둔다. 문항/응답 순서는 처음 나온 차수 기준이다.
+    """
+    order: List[str] = list(waves)
+    long = wave_counts_long(waves, include_blank)
+    if long.empty:
+        return pd.DataFrame()
+
+    counts = (
+        long.set_index(["question", "answer", "wave"])["count"]
+        .unstack("wave")
+        .reindex(columns=order)
+    )
+    rows = pd.MultiIndex.from_frame(long[["question", "answer"]].drop_duplicates())
+    counts = counts.reindex(rows)
+    counts.columns.name = None
+
+    # 문항이 있는 차수에서 선택되지 않은 응답은 0
+    asked = long.drop_duplicates(["question", "wave"]).assign(asked=True).pivot(
+        index="question", columns="wave", values="asked"
+    ).reindex(columns=order).notna()
+    asked = asked.reindex(counts.index.get_level_values("question")).to_numpy()
+    counts = counts.mask(counts.isna() & asked, 0)
+
+    percents = counts / counts.groupby(level="question", sort=False).transform("sum") * 100
+    return pd.concat(
+        {
+            COUNT_COL: counts,
+            PERCENT_COL: percents.round(2),
+            COUNT_DELTA_COL: counts.diff(axis=1),
+            PERCENT_DELTA_COL: percents.diff(axis=1).round(2),
+        },
+        axis=1,
+    )
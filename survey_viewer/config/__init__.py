@@ -1,3 +1,3 @@
 """설정 모듈"""
-from .settings import configure_matplotlib, configure_streamlit
-from .constants import META_COLS, EXCLUDE_CONTACT_KEYWORDS, CONTACT_COL
+from .settings import configure_matplotlib, configure_streamlit, configure_warnings
+from .constants import META_COLS, EXCLUDE_CONTACT_KEYWORDS, CONTACT_COL, PARTICIPANT_COL
@@ -1,4 +1,5 @@
 """상수 정의"""
+import os
 
 # 메타 컬럼 (분석에서 제외)
 META_COLS = {
@@ -7,6 +8,44 @@ META_COLS = {
     "본 설문은 오프라인 모임/이벤트 운영 프로세스 개선을 위한 리서치이며, 응답은 익명 통계로만 사용됩니다.(*)",
 }
 
+# 참여자 / 응답일시 컬럼
+PARTICIPANT_COL = "참여자"
+DATE_COL = "응답일시"
+
 # 테스트 응답 제외 설정
 CONTACT_COL = "연락처(이메일/전화번호), 가능한 시간대"
 EXCLUDE_CONTACT_KEYWORDS = ["성종연", "김상진"]
+
+# 파싱 캐시 설정
+PARSE_CACHE_MAX_BYTES = 512 * 1024 * 1024   # 메모리 캐시 예산 (512MB)
+PARSE_CACHE_DIR = None                      # 디스크 저장 경로 (None이면 사용 안 함)
+
+# 증분 집계 상태 저장 경로 (None이면 프로세스 메모리에만 보관)
+INCREMENTAL_STATE_DIR = None
+
+# 스트리밍 로더 청크 크기 (행 수)
+STREAMING_CHUNK_SIZE = 5000
+
+# 이 크기 이상의 xlsx는 파싱 캐시 대신 스트리밍 로더로 읽음 (50MB)
+STREAMING_FILE_BYTES = 50 * 1024 * 1024
+
+# 차트 이미지 캐시 예산 (128MB)
+CHART_IMAGE_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# 사용 가능한 CPU 코어 수 (컨테이너 CPU 제한 반영)
+AVAILABLE_CPUS = (
+    len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+)
+
+# 차트 렌더링 워커 프로세스 수 (1 이하이면 순차 렌더링)
+CHART_RENDER_WORKERS = min(AVAILABLE_CPUS, 8)
+
+# 여러 시트(차수)를 동시에 읽을 워커 프로세스 수 (1 이하이면 한 번에 순차 로드)
+SHEET_LOAD_WORKERS = min(AVAILABLE_CPUS, 4)
+
+# 프로파일링 (환경 변수 또는 URL 쿼리 ?profile=1 로 활성화)
+PROFILE_ENV_VAR = "SURVEY_VIEWER_PROFILE"
+PROFILE_LOG_PATH = None     # 실행별 기록을 JSON lines로 이어 쓸 경로 (None이면 저장 안 함)
+
+# 공유 데이터셋 레지스트리: 참조가 없는 데이터셋을 보관할 시간 (초)
+DATASET_IDLE_SECONDS = 15 * 60
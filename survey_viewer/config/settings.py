@@ -1,26 +1,52 @@
 """앱 설정 - 폰트, 페이지 설정"""
+import functools
 import platform
 import warnings
-import matplotlib.pyplot as plt
-import streamlit as st
 
 
-def configure_matplotlib() -> None:
-    """matplotlib 한글 폰트 및 경고 설정"""
+# 플랫폼별 한글 폰트 후보 (앞쪽 우선)
+FONT_CANDIDATES = {
+    "Darwin": ["AppleGothic"],
+    "Windows": ["Malgun Gothic"],
+}
+DEFAULT_FONT_CANDIDATES = ["NanumGothic"]
+
+
+def configure_warnings() -> None:
+    """불필요한 경고 숨김 (openpyxl 스타일 경고 등)"""
     warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
 
-    system = platform.system()
-    if system == 'Darwin':
-        plt.rcParams['font.family'] = 'AppleGothic'
-    elif system == 'Windows':
-        plt.rcParams['font.family'] = 'Malgun Gothic'
-    else:
-        plt.rcParams['font.family'] = 'NanumGothic'
 
-    plt.rcParams['axes.unicode_minus'] = False
+@functools.lru_cache(maxsize=None)
+def resolve_font_family() -> str:
+    """설치된 한글 폰트 확인 (프로세스당 1회, 없으면 matplotlib 기본 폰트)"""
+    from matplotlib import font_manager
+
+    candidates = FONT_CANDIDATES.get(platform.system(), DEFAULT_FONT_CANDIDATES)
+    installed = {f.name for f in font_manager.fontManager.ttflist}
+    for name in candidates:
+        if name in installed:
+            return name
+    return font_manager.FontProperties().get_family()[0]
+
+
+@functools.lru_cache(maxsize=None)
+def configure_matplotlib() -> None:
+    """matplotlib 한글 폰트 설정 (프로세스당 1회)
+
+    matplotlib은 시각화가 필요해지는 시점에 처음 임포트된다.
+    """
+    configure_warnings()
+
+    import matplotlib
+    matplotlib.rcParams['font.family'] = resolve_font_family()
+    matplotlib.rcParams['axes.unicode_minus'] = False
 
 
 def configure_streamlit() -> None:
     """Streamlit 페이지 설정"""
+    # 헤드리스 리포트 등 Streamlit 없이 config를 쓰는 경로를 위해 지연 임포트
+    import streamlit as st
+
     st.set_page_config(page_title="설문 문항별 원그래프", layout="wide")
     st.title("설문 문항별 원그래프")
@@ -1,4 +1,12 @@
 """데이터 로딩 및 전처리 모듈"""
-from .loader import DataLoader, ExcelDataLoader
-from .preprocessor import DataPreprocessor, TestResponseFilter
-from .question_parser import Question, QuestionParser
+from .cache import LRUCache, ParseCache, get_default_cache
+from .loader import DataLoader, ExcelDataLoader, ChunkedExcelDataLoader, SnapshotDataLoader
+from .snapshot import export_snapshot, read_snapshot, write_snapshot
+from .fingerprint import get_fingerprint, set_fingerprint, derive_fingerprint
+from .participant_index import ParticipantIndex, get_participant_index
+from .preprocessor import (
+    DataPreprocessor, TestResponseFilter, PreprocessorPipeline, RuleEngine, FilterRule,
+    KeywordRule, RegexRule, ExactMatchRule, DateRangeRule, DuplicateParticipantRule
+)
+from .question_parser import Question, QuestionParser, strip_q_prefix
+from .registry import DatasetLease, DatasetRegistry, get_dataset_registry
@@ -0,0 +1,178 @@
+"""파싱 결과 캐시 - 업로드 파일 내용 해시 기반 LRU 캐시"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, BinaryIO, Callable, Hashable, List, Optional
+
+import pandas as pd
+
+from .snapshot import read_snapshot, write_snapshot
+from ..config.constants import PARSE_CACHE_DIR, PARSE_CACHE_MAX_BYTES
+from ..utils import process_singleton
+
+
+# 시트 이름 목록을 보관할 최대 파일 수
+SHEET_NAME_CACHE_SIZE = 256
+
+
+def compute_content_hash(file: BinaryIO) -> str:
+    """파일 전체 내용의 SHA-256 해시 반환 (이미 읽은 스트림도 처음부터 읽고 위치는 복원)"""
+    if hasattr(file, "getvalue"):
+        data = file.getvalue()
+    else:
+        position = file.tell()
+        file.seek(0)
+        data = file.read()
+        file.seek(position)
+    return hashlib.sha256(data).hexdigest()
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """DataFrame의 메모리 사용량(바이트) 추정"""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+class LRUCache:
+    """크기 예산 기반 LRU 캐시 (스레드 안전, 크기 단위는 sizeof가 결정)"""
+
+    def __init__(self, max_size: int, sizeof: Callable[[Any], int]):
+        self.max_size = max_size
+        self._sizeof = sizeof
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes = {}
+        self._total_size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_size(self) -> int:
+        """현재 캐시된 항목의 총 크기"""
+        return self._total_size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """항목 조회 (조회 시 최근 사용으로 갱신)"""
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """항목 저장 후 예산 초과분을 오래된 순서로 제거"""
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._items:
+                self._total_size -= self._sizes.pop(key)
+                del self._items[key]
+
+            # 예산보다 큰 항목은 저장하지 않음
+            if size > self.max_size:
+                return
+
+            self._items[key] = value
+            self._sizes[key] = size
+            self._total_size += size
+
+            while self._total_size > self.max_size:
+                old_key, _ = self._items.popitem(last=False)
+                self._total_size -= self._sizes.pop(old_key)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """항목 제거 후 반환 (없으면 None)"""
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._total_size -= self._sizes.pop(key)
+            return self._items.pop(key)
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self._total_size = 0
+
+
+class ParseCache:
+    """시트 파싱 결과 캐시 (메모리 LRU + 선택적 디스크 저장소)
+
+    디스크 저장소는 Arrow IPC 스냅샷을 사용하므로 새 프로세스에서도
+    메모리 매핑으로 바로 읽을 수 있다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = PARSE_CACHE_MAX_BYTES,
+        cache_dir: Optional[str] = PARSE_CACHE_DIR
+    ):
+        self._memory = LRUCache(max_bytes, frame_nbytes)
+        self._sheet_names = LRUCache(SHEET_NAME_CACHE_SIZE, lambda _: 1)
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get_sheet_names(self, content_hash: str) -> Optional[List[str]]:
+        """캐시된 시트 이름 목록 반환 (없으면 None)"""
+        return self._sheet_names.get(content_hash)
+
+    def put_sheet_names(self, content_hash: str, sheet_names: List[str]) -> None:
+        """시트 이름 목록 저장"""
+        self._sheet_names.put(content_hash, list(sheet_names))
+
+    def get(self, content_hash: str, sheet_name: str) -> Optional[pd.DataFrame]:
+        """캐시된 DataFrame 반환 (없으면 None)"""
+        key = (content_hash, sheet_name)
+        df = self._memory.get(key)
+        if df is not None:
+            return df
+
+        df = self._read_disk(content_hash, sheet_name)
+        if df is not None:
+            self._memory.put(key, df)
+        return df
+
+    def put(self, content_hash: str, sheet_name: str, df: pd.DataFrame) -> None:
+        """파싱 결과 저장"""
+        self._memory.put((content_hash, sheet_name), df)
+        self._write_disk(content_hash, sheet_name, df)
+
+    def evict(self, content_hash: str, sheet_name: str) -> None:
+        """시트 하나를 메모리 캐시에서 제거 (디스크 저장소는 유지)"""
+        self._memory.pop((content_hash, sheet_name))
+
+    def clear(self) -> None:
+        """메모리 캐시 비우기 (디스크 저장소는 유지)"""
+        self._memory.clear()
+        self._sheet_names.clear()
+
+    def _disk_path(self, content_hash: str, sheet_name: str) -> str:
+        """디스크 저장 경로 (시트명은 해시하여 파일명 충돌 방지)"""
+        sheet_key = hashlib.sha256(sheet_name.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{content_hash}_{sheet_key}.arrow")
+
+    def _read_disk(self, content_hash: str, sheet_name: str) -> Optional[pd.DataFrame]:
+        if not self.cache_dir:
+            return None
+
+        path = self._disk_path(content_hash, sheet_name)
+        if not os.path.exists(path):
+            return None
+        return read_snapshot(path)
+
+    def _write_disk(self, content_hash: str, sheet_name: str, df: pd.DataFrame) -> None:
+        if not self.cache_dir:
+            return
+
+        write_snapshot(df, self._disk_path(content_hash, sheet_name), format="arrow")
+
+
+@process_singleton
+def get_default_cache() -> ParseCache:
+    """프로세스 전역 파싱 캐시 반환 (Streamlit 재실행 간 유지)"""
+    return ParseCache()
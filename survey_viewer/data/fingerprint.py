@@ -0,0 +1,81 @@
+"""데이터셋 지문 - 캐시 키로 쓰는 DataFrame 버전 식별자"""
+import hashlib
+import itertools
+import weakref
+from typing import Dict, Optional
+
+import pandas as pd
+
+
+# DataFrame.attrs에 지문을 보관하는 키
+FINGERPRINT_ATTR = "fingerprint"
+
+# 지문을 지정한 DataFrame의 소유 토큰을 보관하는 키
+FINGERPRINT_OWNER_ATTR = "fingerprint_owner"
+
+# 소유 토큰 → 지문을 지정한 DataFrame 약한 참조 (토큰은 재사용되지 않음)
+_owner_tokens = itertools.count()
+_owners: Dict[int, "weakref.ref[pd.DataFrame]"] = {}
+
+
+def _is_owner(df: pd.DataFrame) -> bool:
+    """attrs의 소유 토큰이 이 DataFrame 객체에 발급된 것인지 여부"""
+    ref = _owners.get(df.attrs.get(FINGERPRINT_OWNER_ATTR))
+    return ref is not None and ref() is df
+
+
+def _own_fingerprint(df: pd.DataFrame) -> Optional[str]:
+    """이 DataFrame 객체에 지정된 지문 (없거나 다른 객체에서 복사된 것이면 None)
+
+    pandas는 df[mask], iloc, copy(), assign 등으로 만든 새 DataFrame에 attrs를
+    그대로 복사하므로, 지문을 지정할 때 발급한 토큰이 가리키는 객체가 자신일
+    때만 유효한 지문으로 본다. id()와 달리 토큰은 원본이 수거된 뒤에도
+    다른 객체에 다시 발급되지 않는다.
+    """
+    if not _is_owner(df):
+        return None
+    return df.attrs.get(FINGERPRINT_ATTR)
+
+
+def get_fingerprint(df: pd.DataFrame) -> str:
+    """DataFrame 지문 반환 (없으면 내용 해시로 계산 후 attrs에 저장)"""
+    fingerprint = _own_fingerprint(df)
+    if fingerprint is None:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+        h = hashlib.sha256(row_hashes.tobytes())
+        for col in df.columns:
+            h.update(b"\0")
+            h.update(str(col).encode("utf-8"))
+        fingerprint = h.hexdigest()
+        set_fingerprint(df, fingerprint)
+    return fingerprint
+
+
+def set_fingerprint(df: pd.DataFrame, fingerprint: str) -> pd.DataFrame:
+    """DataFrame에 지문 지정 (이 객체에만 유효하며 파생 DataFrame은 지문을 다시 계산)"""
+    if not _is_owner(df):
+        token = next(_owner_tokens)
+        _owners[token] = weakref.ref(df, lambda _, token=token: _owners.pop(token, None))
+        df.attrs[FINGERPRINT_OWNER_ATTR] = token
+    df.attrs[FINGERPRINT_ATTR] = fingerprint
+    return df
+
+
+def derive_fingerprint(parent: str, *parts: str) -> str:
+    """상위 지문과 변환 정보로 새 지문 생성"""
+    h = hashlib.sha256(parent.encode("utf-8"))
+    for part in parts:
+        h.update(b"\0")
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()
+
+
+def propagate_fingerprint(source: pd.DataFrame, result: pd.DataFrame, *parts: str) -> pd.DataFrame:
+    """변환 결과에 원본 지문 + 변환 정보로 만든 지문 지정 (원본 지문이 없으면 생략)"""
+    parent = _own_fingerprint(source)
+    if parent is None:
+        result.attrs.pop(FINGERPRINT_ATTR, None)
+        result.attrs.pop(FINGERPRINT_OWNER_ATTR, None)
+    else:
+        set_fingerprint(result, derive_fingerprint(parent, *parts))
+    return result
@@ -1,9 +1,21 @@
 """데이터 로딩 - Excel 파일 처리"""
+import io
+import json
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
-from typing import List, BinaryIO
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, BinaryIO, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
+from .cache import ParseCache, compute_content_hash
+from .fingerprint import derive_fingerprint, set_fingerprint
+from .preprocessor import DataPreprocessor
+from .snapshot import MANIFEST_FILE, read_snapshot
+from ..config.constants import SHEET_LOAD_WORKERS, STREAMING_CHUNK_SIZE
+
 
 class DataLoader(ABC):
     """데이터 로더 추상 클래스"""
@@ -20,16 +32,320 @@ class DataLoader(ABC):
 
 
 class ExcelDataLoader(DataLoader):
-    """Excel 파일 로더"""
+    """Excel 파일 로더
+
+    cache가 주어지면 파일 내용 해시 + 시트명 기준으로 파싱 결과를 재사용한다.
+    캐시에서 반환된 DataFrame은 여러 호출이 공유하므로 제자리 수정하지 않는다.
+    로드한 DataFrame에는 같은 해시 + 시트명으로 만든 지문이 지정된다.
+    """
 
-    def __init__(self, file: BinaryIO):
-        self._excel_file = pd.ExcelFile(file)
+    def __init__(self, file: BinaryIO, cache: Optional[ParseCache] = None):
+        self._file = file
+        self._cache = cache
+        self._excel_file: Optional[pd.ExcelFile] = None
+        self.content_hash = compute_content_hash(file)
 
     def get_sheet_names(self) -> List[str]:
-        return self._excel_file.sheet_names
+        if self._cache is not None:
+            sheet_names = self._cache.get_sheet_names(self.content_hash)
+            if sheet_names is not None:
+                return sheet_names
+
+        sheet_names = self._get_excel_file().sheet_names
+        if self._cache is not None:
+            self._cache.put_sheet_names(self.content_hash, sheet_names)
+        return sheet_names
 
     def load_sheet(self, sheet_name: str) -> pd.DataFrame:
-        return pd.read_excel(
-            self._excel_file,
-            sheet_name=sheet_name
-        ).reset_index(drop=True)
+        df = self._cache.get(self.content_hash, sheet_name) if self._cache is not None else None
+
+        if df is None:
+            df = pd.read_excel(
+                self._get_excel_file(),
+                sheet_name=sheet_name
+            ).reset_index(drop=True)
+            if self._cache is not None:
+                self._cache.put(self.content_hash, sheet_name, df)
+
+        return set_fingerprint(df, derive_fingerprint(self.content_hash, sheet_name))
+
+    def load_sheets(
+        self,
+        sheet_names: Optional[Sequence[str]] = None,
+        max_workers: int = SHEET_LOAD_WORKERS
+    ) -> Dict[str, pd.DataFrame]:
+        """여러 시트를 한 번에 로드 (sheet_names가 없으면 전체 시트)
+
+        캐시에 없는 시트만 파싱한다. max_workers가 1이면 워크북을 한 번 열어
+        순서대로 읽고, 2 이상이면 시트별로 워커 프로세스에서 동시에 읽는다.
+        """
+        sheet_names = list(sheet_names) if sheet_names is not None else self.get_sheet_names()
+        frames: Dict[str, pd.DataFrame] = {}
+        missing = []
+        for sheet_name in sheet_names:
+            df = self._cache.get(self.content_hash, sheet_name) if self._cache is not None else None
+            if df is None:
+                missing.append(sheet_name)
+            else:
+                frames[sheet_name] = df
+
+        if len(missing) > 1 and max_workers > 1:
+            data = self._read_bytes()
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(missing)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                parsed = dict(zip(missing, pool.map(read_excel_sheet, [data] * len(missing), missing)))
+        elif missing:
+            parsed = pd.read_excel(self._get_excel_file(), sheet_name=missing)
+        else:
+            parsed = {}
+
+        for sheet_name, df in parsed.items():
+            df = df.reset_index(drop=True)
+            if self._cache is not None:
+                self._cache.put(self.content_hash, sheet_name, df)
+            frames[sheet_name] = df
+
+        return {
+            sheet_name: set_fingerprint(frames[sheet_name], derive_fingerprint(self.content_hash, sheet_name))
+            for sheet_name in sheet_names
+        }
+
+    def release_sheet(self, sheet_name: str) -> None:
+        """파싱 캐시의 원본 시트를 메모리에서 제거
+
+        시트로 만든 데이터셋을 레지스트리가 보관하게 되면 원본 시트를 따로 들고 있을
+        필요가 없다 (디스크 저장소가 있으면 다시 파싱하지 않고 읽을 수 있음).
+        """
+        if self._cache is not None:
+            self._cache.evict(self.content_hash, sheet_name)
+
+    def _read_bytes(self) -> bytes:
+        if hasattr(self._file, "getvalue"):
+            return self._file.getvalue()
+        self._file.seek(0)
+        data = self._file.read()
+        self._file.seek(0)
+        return data
+
+    def _get_excel_file(self) -> pd.ExcelFile:
+        """워크북은 캐시 미스가 발생할 때만 연다"""
+        if self._excel_file is None:
+            self._excel_file = pd.ExcelFile(self._file)
+        return self._excel_file
+
+
+def read_excel_sheet(data: bytes, sheet_name: str) -> pd.DataFrame:
+    """워크북 바이트에서 시트 하나를 읽음 (워커 프로세스에서 실행)"""
+    return pd.read_excel(io.BytesIO(data), sheet_name=sheet_name)
+
+
+class ChunkedExcelDataLoader(DataLoader):
+    """openpyxl read-only 모드 기반 스트리밍 Excel 로더
+
+    셀 객체를 시트 전체만큼 만들지 않고 값만 행 단위로 읽어 고정 크기 청크로
+    반환한다. columns를 지정하면 해당 컬럼만 DataFrame으로 만든다.
+    파싱 캐시를 거치지 않으므로 메모리에 올리기 부담스러운 큰 파일에 사용한다.
+    """
+
+    def __init__(self, file: BinaryIO, chunk_size: int = STREAMING_CHUNK_SIZE):
+        self._file = file
+        self.chunk_size = chunk_size
+        self._workbook = None
+        self.content_hash = compute_content_hash(file)
+
+    def get_sheet_names(self) -> List[str]:
+        return list(self._get_workbook().sheetnames)
+
+    def load_sheet(
+        self,
+        sheet_name: str,
+        columns: Optional[Sequence[str]] = None,
+        preprocessor: Optional[DataPreprocessor] = None,
+        on_chunk: Optional[Callable[[pd.DataFrame], None]] = None
+    ) -> pd.DataFrame:
+        """시트를 청크 단위로 읽어 하나의 DataFrame으로 반환
+
+        preprocessor가 주어지면 청크마다 적용해 남는 행만 모은다 (행 단위 전처리기만 가능).
+        on_chunk는 전처리를 마친 청크마다 호출된다 (로딩 중 집계용).
+        """
+        chunks = self.iter_chunks(sheet_name, columns=columns)
+        if preprocessor is not None:
+            chunks = preprocessor.process_chunks(chunks)
+        kept = []
+        for chunk in chunks:
+            if on_chunk is not None:
+                on_chunk(chunk)
+            kept.append(chunk)
+        df = concat_chunks(kept)
+        if columns is None:
+            df = drop_empty_unnamed_tail(df)
+
+        parts = [sheet_name, *(["columns", *map(str, columns)] if columns is not None else [])]
+        if preprocessor is not None:
+            parts.append(type(preprocessor).__name__)
+        return set_fingerprint(df, derive_fingerprint(self.content_hash, *parts))
+
+    def iter_chunks(
+        self,
+        sheet_name: str,
+        chunk_size: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """시트를 chunk_size 행 단위 DataFrame으로 순회 (데이터 행이 없으면 빈 청크 하나)
+
+        pd.read_excel과 같이 중간의 빈 행은 NaN 행으로 유지하고 끝의 빈 행만 버린다.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        rows = self._get_workbook()[sheet_name].iter_rows(values_only=True)
+
+        header_row = next(rows, None)
+        if header_row is None:
+            yield pd.DataFrame(columns=list(columns or []))
+            return
+
+        header = self._build_header(header_row)
+        if columns is None:
+            positions = list(range(len(header)))
+        else:
+            missing = [c for c in columns if c not in header]
+            if missing:
+                raise ValueError(f"Unknown columns: {missing}")
+            positions = [header.index(c) for c in columns]
+        names = [header[i] for i in positions]
+
+        buffer = []
+        start = 0
+        blank_rows = 0
+        for row in rows:
+            # 빈 행은 뒤에 데이터 행이 나올 때만 추가 (시트 끝의 빈 행 제외)
+            if all(v is None for v in row):
+                blank_rows += 1
+                continue
+            buffer.extend([(None,) * len(positions)] * blank_rows)
+            blank_rows = 0
+            buffer.append(tuple(row[i] if i < len(row) else None for i in positions))
+            if len(buffer) >= chunk_size:
+                yield self._to_frame(buffer, names, start)
+                start += len(buffer)
+                buffer = []
+
+        if buffer or start == 0:
+            yield self._to_frame(buffer, names, start)
+
+    def close(self) -> None:
+        """열린 워크북 핸들 해제"""
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+
+    def _get_workbook(self):
+        if self._workbook is None:
+            from openpyxl import load_workbook
+
+            self._file.seek(0)
+            self._workbook = load_workbook(self._file, read_only=True, data_only=True)
+        return self._workbook
+
+    def _build_header(self, header_row: tuple) -> List[str]:
+        """헤더 행을 pd.read_excel 규칙(Unnamed: i, 중복 시 .1 접미사)으로 정리
+
+        헤더가 비어 있는 컬럼도 데이터가 있을 수 있으므로 위치 이름으로 유지한다.
+        """
+        header = []
+        seen = {}
+        for i, value in enumerate(header_row):
+            name = f"Unnamed: {i}" if value is None else value
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            header.append(name)
+        return header
+
+    def _to_frame(self, rows: list, names: List[str], start: int) -> pd.DataFrame:
+        df = pd.DataFrame(rows, columns=names)
+        df.index = pd.RangeIndex(start, start + len(df))
+
+        # object 컬럼의 None을 pd.read_excel과 같은 NaN으로 통일
+        object_cols = df.columns[df.dtypes == object]
+        if len(object_cols):
+            df[object_cols] = df[object_cols].where(df[object_cols].notna(), np.nan)
+        return df
+
+
+def concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """청크를 하나의 DataFrame으로 연결 (pd.read_excel로 한 번에 읽은 것과 같은 dtype)
+
+    어떤 청크에서 전부 비어 있는 컬럼은 값이 있는 청크의 dtype을 따른다.
+    정수 컬럼은 pd.read_excel과 같이 NaN을 담을 수 있는 float64가 된다.
+    """
+    if len(chunks) == 1:
+        return chunks[0].reset_index(drop=True)
+
+    chunks = list(chunks)
+    for col in chunks[0].columns:
+        empty = [i for i, chunk in enumerate(chunks) if chunk[col].isna().all()]
+        dtypes = {chunk[col].dtype for chunk in chunks if chunk[col].notna().any()}
+        if not empty or len(dtypes) != 1:
+            continue
+        dtype = dtypes.pop()
+        if dtype.kind in "iub":
+            dtype = np.dtype("float64")
+        for i in empty:
+            chunks[i] = chunks[i].astype({col: dtype})
+    return pd.concat(chunks, ignore_index=True)
+
+
+def drop_empty_unnamed_tail(df: pd.DataFrame) -> pd.DataFrame:
+    """헤더와 값이 모두 빈 끝쪽 컬럼 제거 (pd.read_excel은 이런 컬럼을 만들지 않음)"""
+    keep = len(df.columns)
+    while keep > 0:
+        name = df.columns[keep - 1]
+        if not (isinstance(name, str) and name.startswith("Unnamed: ")) or df[name].notna().any():
+            break
+        keep -= 1
+    return df.iloc[:, :keep] if keep < len(df.columns) else df
+
+
+class SnapshotDataLoader(DataLoader):
+    """스냅샷 로더
+
+    source가 디렉터리면 manifest.json의 시트 목록을 사용하고,
+    단일 스냅샷 파일(경로 또는 업로드 파일)이면 시트 하나로 취급한다.
+    """
+
+    def __init__(self, source: Union[str, BinaryIO], sheet_name: Optional[str] = None):
+        self._files: Dict[str, Union[str, BinaryIO]] = {}
+
+        if isinstance(source, str) and os.path.isdir(source):
+            with open(os.path.join(source, MANIFEST_FILE), encoding="utf-8") as f:
+                manifest = json.load(f)
+            for sheet in manifest["sheets"]:
+                self._files[sheet["name"]] = os.path.join(source, sheet["file"])
+        else:
+            name = sheet_name or self._default_sheet_name(source)
+            self._files[name] = source
+
+    def get_sheet_names(self) -> List[str]:
+        return list(self._files)
+
+    def load_sheet(
+        self,
+        sheet_name: str,
+        columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        if sheet_name not in self._files:
+            raise ValueError(f"Unknown sheet: {sheet_name}")
+
+        source = self._files[sheet_name]
+        if not isinstance(source, str):
+            source.seek(0)
+        return read_snapshot(source, columns)
+
+    def _default_sheet_name(self, source: Union[str, BinaryIO]) -> str:
+        """단일 파일 스냅샷의 시트명 (파일명에서 확장자 제거)"""
+        name = source if isinstance(source, str) else getattr(source, "name", "Sheet1")
+        return os.path.splitext(os.path.basename(name))[0]
@@ -0,0 +1,97 @@
+"""참여자 인덱스 - 참여자 -> 행 위치 조회"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .cache import LRUCache
+from .fingerprint import get_fingerprint
+from .question_parser import Question
+from ..config.constants import PARTICIPANT_COL
+from ..utils import process_singleton
+
+
+# 인덱스를 보관할 최대 데이터셋 수
+PARTICIPANT_INDEX_MAX_DATASETS = 8
+
+# 무응답 표시 문자열
+NO_ANSWER = "(무응답)"
+
+
+@dataclass(frozen=True)
+class ParticipantIndex:
+    """참여자별 첫 응답 행 위치와 정렬된 참여자 목록"""
+    positions: Dict[Any, int]
+    options: List[Any]
+
+    def __contains__(self, participant: Any) -> bool:
+        return participant in self.positions
+
+    def answer_table(
+        self,
+        df: pd.DataFrame,
+        questions: List[Question],
+        participant: Any
+    ) -> Optional[pd.DataFrame]:
+        """참여자의 문항별 응답 테이블 (행 위치 take, 없으면 None)"""
+        position = self.positions.get(participant)
+        if position is None:
+            return None
+
+        col_positions = df.columns.get_indexer([q.column_name for q in questions])
+        values = df.iloc[position, col_positions]
+        values = values.where(values.notna(), NO_ANSWER).astype(str)
+
+        return pd.DataFrame({
+            "문항": [q.display_title for q in questions],
+            "응답": values.to_numpy(),
+        })
+
+
+def build_participant_index(
+    df: pd.DataFrame,
+    participant_col: str = PARTICIPANT_COL
+) -> ParticipantIndex:
+    """참여자 컬럼으로 인덱스 생성 (중복 참여자는 첫 행 사용)"""
+    series = df[participant_col]
+    first = series.notna().to_numpy() & ~series.duplicated().to_numpy()
+    positions = np.flatnonzero(first)
+    participants = series.to_numpy()[positions]
+
+    return ParticipantIndex(
+        positions=dict(zip(participants.tolist(), positions.tolist())),
+        options=sorted(participants.tolist(), key=str),
+    )
+
+
+class ParticipantIndexCache:
+    """데이터셋 지문 기준 참여자 인덱스 캐시"""
+
+    def __init__(self, max_datasets: int = PARTICIPANT_INDEX_MAX_DATASETS):
+        self._entries = LRUCache(max_datasets, lambda _: 1)
+
+    def get(
+        self,
+        df: pd.DataFrame,
+        participant_col: str = PARTICIPANT_COL
+    ) -> ParticipantIndex:
+        key = (get_fingerprint(df), participant_col)
+        index = self._entries.get(key)
+        if index is None:
+            index = build_participant_index(df, participant_col)
+            self._entries.put(key, index)
+        return index
+
+
+@process_singleton
+def _default_cache() -> ParticipantIndexCache:
+    return ParticipantIndexCache()
+
+
+def get_participant_index(
+    df: pd.DataFrame,
+    participant_col: str = PARTICIPANT_COL
+) -> ParticipantIndex:
+    """프로세스 전역 캐시를 사용해 참여자 인덱스 반환"""
+    return _default_cache().get(df, participant_col)
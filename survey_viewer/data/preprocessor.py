@@ -1,10 +1,15 @@
 """데이터 전처리 - 테스트 응답 제외 등"""
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 
-from ..config.constants import CONTACT_COL, EXCLUDE_CONTACT_KEYWORDS
+from .fingerprint import propagate_fingerprint
+from ..config.constants import (
+    CONTACT_COL, DATE_COL, EXCLUDE_CONTACT_KEYWORDS, PARTICIPANT_COL
+)
 
 
 class DataPreprocessor(ABC):
@@ -15,8 +20,183 @@ class DataPreprocessor(ABC):
         """DataFrame 전처리 수행"""
         pass
 
+    def process_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """청크 단위 전처리 (행 단위 전처리기는 청크별 결과가 전체 결과와 같음)"""
+        for chunk in chunks:
+            yield self.process(chunk)
 
-class TestResponseFilter(DataPreprocessor):
+
+class FilterRule(ABC):
+    """행 제외 규칙 추상 클래스"""
+
+    # 다른 행과 무관하게 행별로 판정하는 규칙인지 여부
+    row_local = True
+
+    @abstractmethod
+    def mask(self, df: pd.DataFrame, excluded: np.ndarray) -> Optional[np.ndarray]:
+        """
+        제외할 행 마스크 계산
+
+        Args:
+            df: 원본 DataFrame
+            excluded: 앞선 규칙으로 이미 제외된 행 마스크
+
+        Returns:
+            제외할 행이 True인 bool 배열 (적용할 컬럼이 없으면 None)
+        """
+        pass
+
+    @abstractmethod
+    def describe(self) -> str:
+        """규칙 설명 (데이터셋 지문 생성용)"""
+        pass
+
+
+class KeywordRule(FilterRule):
+    """컬럼 값에 키워드가 포함된 행 제외 (키워드는 문자 그대로 비교)"""
+
+    def __init__(self, column: str, keywords: List[str]):
+        self.column = column
+        self.keywords = list(keywords)
+        self._pattern = (
+            re.compile("|".join(re.escape(k) for k in self.keywords)) if self.keywords else None
+        )
+
+    def mask(self, df: pd.DataFrame, excluded: np.ndarray) -> Optional[np.ndarray]:
+        if self._pattern is None or self.column not in df.columns:
+            return None
+        matched = df[self.column].astype(str).str.contains(self._pattern, na=False)
+        return matched.to_numpy(dtype=bool)
+
+    def describe(self) -> str:
+        return f"keyword:{self.column}:{self.keywords!r}"
+
+
+class RegexRule(FilterRule):
+    """컬럼 값이 정규식과 일치하는 행 제외"""
+
+    def __init__(self, column: str, pattern: str, flags: int = 0):
+        self.column = column
+        self.pattern = re.compile(pattern, flags)
+
+    def mask(self, df: pd.DataFrame, excluded: np.ndarray) -> Optional[np.ndarray]:
+        if self.column not in df.columns:
+            return None
+        matched = df[self.column].astype(str).str.contains(self.pattern, na=False)
+        return matched.to_numpy(dtype=bool)
+
+    def describe(self) -> str:
+        return f"regex:{self.column}:{self.pattern.pattern!r}:{self.pattern.flags}"
+
+
+class ExactMatchRule(FilterRule):
+    """컬럼 값이 지정된 값 집합에 속하는 행 제외"""
+
+    def __init__(self, column: str, values: Iterable):
+        self.column = column
+        self.values = set(values)
+
+    def mask(self, df: pd.DataFrame, excluded: np.ndarray) -> Optional[np.ndarray]:
+        if self.column not in df.columns:
+            return None
+        return df[self.column].isin(self.values).to_numpy(dtype=bool)
+
+    def describe(self) -> str:
+        return f"exact:{self.column}:{sorted(map(str, self.values))!r}"
+
+
+class DateRangeRule(FilterRule):
+    """응답일시가 [start, end] 범위를 벗어난 행 제외 (일시가 없는 행은 유지)"""
+
+    def __init__(
+        self,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        column: str = DATE_COL
+    ):
+        self.column = column
+        self.start = pd.Timestamp(start) if start is not None else None
+        self.end = pd.Timestamp(end) if end is not None else None
+
+    def mask(self, df: pd.DataFrame, excluded: np.ndarray) -> Optional[np.ndarray]:
+        if self.column not in df.columns or (self.start is None and self.end is None):
+            return None
+
+        dates = pd.to_datetime(df[self.column], errors="coerce")
+        outside = np.zeros(len(df), dtype=bool)
+        if self.start is not None:
+            outside |= (dates < self.start).to_numpy(dtype=bool)
+        if self.end is not None:
+            outside |= (dates > self.end).to_numpy(dtype=bool)
+        return outside
+
+    def describe(self) -> str:
+        return f"date:{self.column}:{self.start}:{self.end}"
+
+
+class DuplicateParticipantRule(FilterRule):
+    """같은 참여자의 중복 응답 제외 (앞선 규칙을 통과한 행 중에서 판정)"""
+
+    row_local = False
+
+    def __init__(self, column: str = PARTICIPANT_COL, keep: str = "first"):
+        if keep not in ("first", "last"):
+            raise ValueError(f"Unknown keep option: {keep}")
+        self.column = column
+        self.keep = keep
+
+    def mask(self, df: pd.DataFrame, excluded: np.ndarray) -> Optional[np.ndarray]:
+        if self.column not in df.columns:
+            return None
+
+        series = df[self.column]
+        candidates = series.notna().to_numpy() & ~excluded
+        duplicated = np.zeros(len(df), dtype=bool)
+        duplicated[candidates] = series[candidates].duplicated(keep=self.keep).to_numpy()
+        return duplicated
+
+    def describe(self) -> str:
+        return f"duplicate:{self.column}:{self.keep}"
+
+
+class RuleEngine(DataPreprocessor):
+    """제외 규칙들을 하나의 마스크로 합쳐 한 번의 take로 필터링
+
+    규칙은 순서대로 평가되며, 각 규칙은 앞선 규칙으로 제외된 행을 알 수 있어
+    전처리기를 차례로 적용한 것과 같은 결과를 낸다.
+    """
+
+    def __init__(self, rules: List[FilterRule]):
+        self.rules = list(rules)
+
+    def compile_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """모든 규칙을 평가해 제외할 행 마스크 반환"""
+        excluded = np.zeros(len(df), dtype=bool)
+        for rule in self.rules:
+            mask = rule.mask(df, excluded)
+            if mask is not None:
+                excluded |= mask
+        return excluded
+
+    def process(self, df: pd.DataFrame) -> pd.DataFrame:
+        excluded = self.compile_mask(df)
+        if not excluded.any() and isinstance(df.index, pd.RangeIndex) and df.index.start == 0:
+            # 제외할 행이 없으면 복사하지 않음
+            return df
+
+        result = df.take(np.flatnonzero(~excluded))
+        result.index = pd.RangeIndex(len(result))
+        return propagate_fingerprint(
+            df, result, type(self).__name__, *[rule.describe() for rule in self.rules]
+        )
+
+    def process_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        if not all(rule.row_local for rule in self.rules):
+            raise ValueError("Rules depending on other rows cannot be applied per chunk")
+        return super().process_chunks(chunks)
+
+
+class TestResponseFilter(RuleEngine):
     """테스트 응답 필터링"""
 
     def __init__(
@@ -26,24 +206,34 @@ class TestResponseFilter(DataPreprocessor):
     ):
         self.contact_col = contact_col
         self.exclude_keywords = exclude_keywords or EXCLUDE_CONTACT_KEYWORDS
-
-    def process(self, df: pd.DataFrame) -> pd.DataFrame:
-        if self.contact_col not in df.columns:
-            return df
-
-        pattern = "|".join(self.exclude_keywords)
-        mask = df[self.contact_col].astype(str).str.contains(pattern, na=False)
-        return df[~mask].reset_index(drop=True)
+        super().__init__([KeywordRule(self.contact_col, self.exclude_keywords)])
 
 
 class PreprocessorPipeline(DataPreprocessor):
-    """여러 전처리기를 체인으로 연결"""
+    """여러 전처리기를 체인으로 연결
+
+    연속된 RuleEngine은 규칙을 합쳐 한 번의 마스크 계산과 take로 처리한다.
+    """
 
     def __init__(self, preprocessors: List[DataPreprocessor]):
         self.preprocessors = preprocessors
 
     def process(self, df: pd.DataFrame) -> pd.DataFrame:
         result = df
-        for preprocessor in self.preprocessors:
+        for preprocessor in self._merge_rule_engines():
             result = preprocessor.process(result)
         return result
+
+    def _merge_rule_engines(self) -> List[DataPreprocessor]:
+        """연속된 RuleEngine을 하나로 합친 전처리기 목록"""
+        merged: List[DataPreprocessor] = []
+        for preprocessor in self.preprocessors:
+            if (
+                isinstance(preprocessor, RuleEngine)
+                and merged
+                and isinstance(merged[-1], RuleEngine)
+            ):
+                merged[-1] = RuleEngine(merged[-1].rules + preprocessor.rules)
+            else:
+                merged.append(preprocessor)
+        return merged
@@ -8,6 +8,11 @@ import pandas as pd
 from ..config.constants import META_COLS
 
 
+def strip_q_prefix(title: str) -> str:
+    """기존 Q번호 접두사("Q3. ") 제거 - 차수(시트) 간 같은 문항을 맞추는 기준"""
+    return re.sub(r"^\s*Q\d+\.\s*", "", title).strip()
+
+
 @dataclass
 class Question:
     """설문 문항 데이터"""
@@ -44,7 +49,7 @@ class QuestionParser:
 
     def _strip_existing_q_prefix(self, title: str) -> str:
         """기존 Q번호 접두사 제거"""
-        return re.sub(r"^\s*Q\d+\.\s*", "", title).strip()
+        return strip_q_prefix(title)
 
     def get_column_map(self, questions: List[Question]) -> Dict[str, str]:
         """display_title -> column_name 매핑"""
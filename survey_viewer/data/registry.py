@@ -0,0 +1,134 @@
+"""데이터셋 레지스트리 - 여러 세션이 같은 데이터셋을 한 벌만 공유"""
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+from ..config.constants import DATASET_IDLE_SECONDS
+from ..utils import process_singleton
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry:
+    """레지스트리 항목 (값은 최초 요청 스레드 하나만 생성)"""
+    ready: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+    refs: int = 0
+    last_access: float = field(default_factory=time.monotonic)
+
+
+class DatasetLease(Generic[T]):
+    """레지스트리 값에 대한 참조 (release 또는 GC 시 참조 수 감소)
+
+    value는 모든 세션이 공유하므로 읽기 전용으로 다룬다.
+    """
+
+    def __init__(self, registry: "DatasetRegistry", key: Hashable, entry: _Entry):
+        self.key = key
+        self.value: T = entry.value
+        # 세션 상태가 정리되면서 lease가 수거될 때도 참조를 반납
+        self._finalizer = weakref.finalize(self, registry._release, key, entry)
+
+    @property
+    def active(self) -> bool:
+        return self._finalizer.alive
+
+    def release(self) -> None:
+        """참조 반납 (여러 번 호출해도 한 번만 반영)"""
+        self._finalizer()
+
+
+class DatasetRegistry:
+    """키(파일 내용 해시 + 시트명 등)별로 값을 한 번만 만들어 공유하는 레지스트리
+
+    - 같은 키를 동시에 요청하면 첫 요청만 build를 실행하고 나머지는 완료를 기다린다.
+    - 참조 수가 0이 된 뒤 idle_seconds 동안 다시 요청되지 않은 항목은 제거한다.
+      유휴 항목은 획득/반납 때마다 정리하고, 마지막 참조가 반납되면 idle_seconds 뒤에
+      한 번 더 정리하므로 이후 요청이 없어도 남지 않는다.
+    """
+
+    def __init__(self, idle_seconds: float = DATASET_IDLE_SECONDS):
+        self.idle_seconds = idle_seconds
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, build: Callable[[], T]) -> DatasetLease[T]:
+        """키에 해당하는 값의 참조 획득 (없으면 build로 생성)"""
+        with self._lock:
+            self._evict_idle()
+            entry = self._entries.get(key)
+            is_builder = entry is None
+            if is_builder:
+                entry = _Entry()
+                self._entries[key] = entry
+            entry.refs += 1
+            entry.last_access = time.monotonic()
+
+        if is_builder:
+            try:
+                entry.value = build()
+            except BaseException as e:
+                entry.error = e
+                with self._lock:
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+                raise
+            finally:
+                entry.ready.set()
+        else:
+            entry.ready.wait()
+
+        if entry.error is not None:
+            self._release(key, entry)
+            raise entry.error
+        return DatasetLease(self, key, entry)
+
+    def _release(self, key: Hashable, entry: _Entry) -> None:
+        with self._lock:
+            entry.refs = max(0, entry.refs - 1)
+            entry.last_access = time.monotonic()
+            self._evict_idle()
+            unused = entry.refs == 0 and self._entries.get(key) is entry
+
+        if unused:
+            timer = threading.Timer(self.idle_seconds, self.evict_idle)
+            timer.daemon = True
+            timer.start()
+
+    def _evict_idle(self) -> None:
+        """참조가 없고 오래 사용되지 않은 항목 제거 (self._lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        idle = [
+            key for key, entry in self._entries.items()
+            if entry.refs == 0 and entry.ready.is_set()
+            and now - entry.last_access >= self.idle_seconds
+        ]
+        for key in idle:
+            del self._entries[key]
+
+    def evict_idle(self) -> None:
+        """유휴 항목 제거"""
+        with self._lock:
+            self._evict_idle()
+
+    def stats(self) -> Dict[Hashable, int]:
+        """키별 현재 참조 수"""
+        with self._lock:
+            return {key: entry.refs for key, entry in self._entries.items()}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+
+@process_singleton
+def get_dataset_registry() -> DatasetRegistry:
+    """프로세스 전역 데이터셋 레지스트리 반환 (모든 Streamlit 세션이 공유)"""
+    return DatasetRegistry()
@@ -0,0 +1,178 @@
+"""컬럼 기반 스냅샷 - Arrow IPC / Parquet 변환 및 로딩"""
+import datetime
+import json
+import os
+from typing import TYPE_CHECKING, BinaryIO, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from .loader import DataLoader
+
+
+SNAPSHOT_FORMATS = ("arrow", "parquet")
+MANIFEST_FILE = "manifest.json"
+
+SNAPSHOT_EXTENSIONS = {"arrow": ".arrow", "parquet": ".parquet"}
+_ARROW_MAGIC = b"ARROW1"
+_PARQUET_MAGIC = b"PAR1"
+
+# 혼합 타입 object 컬럼을 저장할 구조체 필드 (행마다 값의 타입에 맞는 필드 하나만 채움)
+# bool은 int의 하위 타입이므로 먼저 검사한다
+_MIXED_FIELDS = [
+    ("bool", (bool, np.bool_), pa.bool_()),
+    ("int", (int, np.integer), pa.int64()),
+    ("float", (float, np.floating), pa.float64()),
+    ("datetime", (datetime.datetime,), pa.timestamp("us")),
+    ("str", (str,), pa.string()),
+]
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+def frame_to_table(df: pd.DataFrame) -> pa.Table:
+    """DataFrame을 Arrow Table로 변환
+
+    문자열 컬럼은 딕셔너리 인코딩하고, 숫자/날짜가 섞인 object 컬럼은 값의
+    타입별 필드를 가진 구조체로 저장해 읽을 때 원래 값(1과 '1' 구분)을 복원한다.
+    """
+    arrays = []
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"):
+            array = pa.array(series, type=pa.string(), from_pandas=True).dictionary_encode()
+        elif series.dtype == object:
+            array = _mixed_to_array(series)
+        else:
+            array = pa.Array.from_pandas(series)
+        arrays.append(array)
+
+    names = [str(c) for c in df.columns]
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def table_to_frame(table: pa.Table) -> pd.DataFrame:
+    """Arrow Table을 DataFrame으로 변환 (딕셔너리/혼합 타입 컬럼은 object로 복원)"""
+    columns = {}
+    for name, column in zip(table.column_names, table.columns):
+        if pa.types.is_struct(column.type):
+            columns[name] = _mixed_from_array(column.combine_chunks())
+        elif pa.types.is_dictionary(column.type):
+            values = column.cast(pa.string()).to_pandas()
+            # 결측값은 pd.read_excel과 같은 NaN으로 통일
+            columns[name] = values.where(values.notna(), np.nan)
+        else:
+            columns[name] = column.to_pandas()
+    return pd.DataFrame(columns, columns=table.column_names)
+
+
+def _mixed_field(value) -> Optional[str]:
+    """값을 저장할 구조체 필드 이름 (결측값이면 None, 지원하지 않는 타입은 str)"""
+    if value is None or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return None
+    for name, types, _ in _MIXED_FIELDS:
+        if isinstance(value, types):
+            if name == "int" and not _INT64_MIN <= value <= _INT64_MAX:
+                return "str"
+            return name
+    return "str"
+
+
+def _mixed_to_array(series: pd.Series) -> pa.StructArray:
+    """혼합 타입 object 컬럼을 타입별 필드 구조체 배열로 변환"""
+    fields = {name: [None] * len(series) for name, _, _ in _MIXED_FIELDS}
+    for i, value in enumerate(series):
+        name = _mixed_field(value)
+        if name is not None:
+            fields[name][i] = value if name != "str" or isinstance(value, str) else str(value)
+
+    arrays = [pa.array(fields[name], type=type_) for name, _, type_ in _MIXED_FIELDS]
+    return pa.StructArray.from_arrays(arrays, names=[name for name, _, _ in _MIXED_FIELDS])
+
+
+def _mixed_from_array(array: pa.StructArray) -> pd.Series:
+    """구조체 배열을 원래 값의 object 컬럼으로 복원 (결측값은 NaN)"""
+    values = np.full(len(array), np.nan, dtype=object)
+    for name, _, _ in _MIXED_FIELDS:
+        field = array.field(name)
+        for i, value in enumerate(field.to_pylist()):
+            if value is not None:
+                values[i] = value
+    return pd.Series(values, dtype=object)
+
+
+def write_snapshot(df: pd.DataFrame, path: str, format: str = "arrow") -> None:
+    """DataFrame을 스냅샷 파일로 저장"""
+    if format not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unknown snapshot format: {format}")
+
+    table = frame_to_table(df)
+    tmp_path = f"{path}.tmp"
+    if format == "arrow":
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    else:
+        pq.write_table(table, tmp_path, use_dictionary=True)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(
+    source: Union[str, BinaryIO],
+    columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """스냅샷 파일 로드 (경로면 메모리 매핑, 필요한 컬럼만 읽음)"""
+    if isinstance(source, str):
+        buffer = pa.memory_map(source, "r")
+    else:
+        data = source.getvalue() if hasattr(source, "getvalue") else source.read()
+        buffer = pa.BufferReader(pa.py_buffer(data))
+
+    columns = list(columns) if columns is not None else None
+    if detect_snapshot_format(buffer) == "arrow":
+        table = ipc.open_file(buffer).read_all()
+        if columns is not None:
+            table = table.select(columns)
+    else:
+        table = pq.read_table(buffer, columns=columns, memory_map=isinstance(source, str))
+
+    return table_to_frame(table)
+
+
+def export_snapshot(
+    loader: "DataLoader",
+    directory: str,
+    sheet_names: Optional[List[str]] = None,
+    format: str = "arrow"
+) -> str:
+    """로더의 시트들을 스냅샷 디렉터리로 변환하고 manifest 경로 반환"""
+    if format not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unknown snapshot format: {format}")
+
+    os.makedirs(directory, exist_ok=True)
+    sheet_names = sheet_names or loader.get_sheet_names()
+
+    sheets = []
+    for i, sheet_name in enumerate(sheet_names):
+        file_name = f"sheet_{i}{SNAPSHOT_EXTENSIONS[format]}"
+        write_snapshot(loader.load_sheet(sheet_name), os.path.join(directory, file_name), format)
+        sheets.append({"name": sheet_name, "file": file_name})
+
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"format": format, "sheets": sheets}, f, ensure_ascii=False, indent=2)
+    return manifest_path
+
+
+def detect_snapshot_format(buffer) -> str:
+    """파일 시그니처로 스냅샷 형식 판별"""
+    head = buffer.read(len(_ARROW_MAGIC))
+    buffer.seek(0)
+    if head == _ARROW_MAGIC:
+        return "arrow"
+    if head[:len(_PARQUET_MAGIC)] == _PARQUET_MAGIC:
+        return "parquet"
+    raise ValueError("Unknown snapshot file format")
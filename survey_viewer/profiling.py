@@ -0,0 +1,210 @@
+"""파이프라인 프로파일링 - 단계별 경과/CPU 시간, 최대 할당량, 행 수 기록
+
+활성화된 Profiler가 없으면 profile_stage는 아무 것도 기록하지 않으므로
+라이브러리 코드 곳곳에 두어도 평소 비용은 거의 없다. 앱 시작 시 임포트되므로
+pandas는 요약표를 만들 때만 임포트한다.
+"""
+import contextvars
+import io
+import json
+import os
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import IO, TYPE_CHECKING, Iterator, List, Optional
+
+from .config.constants import PROFILE_ENV_VAR
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class StageRecord:
+    """단계 실행 기록 한 건"""
+    run_id: str
+    stage: str
+    question: Optional[str]       # 문항별 단계면 컬럼명
+    wall_s: float                 # 경과 시간 (초)
+    cpu_s: float                  # CPU 시간 (초, 워커 실행이면 워커 기준)
+    peak_bytes: Optional[int]     # 단계 중 최대 추가 할당량 (메모리 추적 시)
+    rows: Optional[int]           # 처리한 행 수
+    started_at: float             # 시작 시각 (epoch 초)
+
+
+class StageContext:
+    """진행 중인 단계 정보 (with 블록 안에서 rows를 채울 수 있음)"""
+
+    def __init__(self, rows: Optional[int] = None):
+        self.rows = rows
+
+
+@dataclass
+class _Frame:
+    start_current: int
+    child_peak: int = 0
+
+
+class Profiler:
+    """한 번의 실행(Streamlit 재실행 / 리포트 작업)에 대한 단계 기록기
+
+    trace_memory가 켜져 있으면 tracemalloc으로 단계별 최대 할당량을 잰다.
+    tracemalloc은 프로세스 전역이므로 여러 세션이 동시에 프로파일링하면
+    메모리 수치가 섞일 수 있다.
+    """
+
+    def __init__(self, run_id: Optional[str] = None, trace_memory: bool = True):
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.trace_memory = trace_memory
+        self.records: List[StageRecord] = []
+        self._frames: List[_Frame] = []
+
+    @contextmanager
+    def stage(
+        self,
+        name: str,
+        question: Optional[str] = None,
+        rows: Optional[int] = None
+    ) -> Iterator[StageContext]:
+        """단계 실행 시간/메모리 측정 (중첩 가능)"""
+        context = StageContext(rows)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            # 상위 단계의 지금까지 최대치를 보존한 뒤 이 단계 기준으로 초기화
+            if self._frames:
+                self._frames[-1].child_peak = max(self._frames[-1].child_peak, peak)
+            tracemalloc.reset_peak()
+            self._frames.append(_Frame(current))
+
+        started_at = time.time()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield context
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            peak_bytes = None
+            if tracing:
+                frame = self._frames.pop()
+                peak = max(tracemalloc.get_traced_memory()[1], frame.child_peak)
+                peak_bytes = max(0, peak - frame.start_current)
+                if self._frames:
+                    self._frames[-1].child_peak = max(self._frames[-1].child_peak, peak)
+            self.records.append(StageRecord(
+                self.run_id, name, question, wall, cpu, peak_bytes, context.rows, started_at
+            ))
+
+    def add(
+        self,
+        name: str,
+        wall_s: float,
+        cpu_s: float,
+        question: Optional[str] = None,
+        rows: Optional[int] = None
+    ) -> None:
+        """다른 프로세스에서 측정한 단계 기록 추가 (예: 렌더링 워커)"""
+        self.records.append(StageRecord(
+            self.run_id, name, question, wall_s, cpu_s, None, rows, time.time()
+        ))
+
+    def to_frame(self) -> "pd.DataFrame":
+        """기록 전체를 DataFrame으로 반환"""
+        import pandas as pd
+
+        columns = list(StageRecord.__dataclass_fields__)
+        return pd.DataFrame([asdict(r) for r in self.records], columns=columns)
+
+    def stage_summary(self) -> "pd.DataFrame":
+        """단계별 합계 (실행 횟수, 경과/CPU 시간 합, 최대 할당량, 행 수 합)"""
+        df = self.to_frame()
+        if df.empty:
+            return df
+        return df.groupby("stage", sort=False).agg(
+            count=("wall_s", "size"),
+            wall_s=("wall_s", "sum"),
+            cpu_s=("cpu_s", "sum"),
+            peak_bytes=("peak_bytes", "max"),
+            rows=("rows", "sum"),
+        ).sort_values("wall_s", ascending=False)
+
+    def question_summary(self) -> "pd.DataFrame":
+        """문항별 단계 시간 (문항 x 단계, 경과 시간 합) - 느린 문항 순"""
+        df = self.to_frame()
+        df = df[df["question"].notna()]
+        if df.empty:
+            return df
+        table = df.pivot_table(
+            index="question", columns="stage", values="wall_s", aggfunc="sum", fill_value=0.0
+        )
+        table["total"] = table.sum(axis=1)
+        return table.sort_values("total", ascending=False)
+
+    def write_jsonl(self, file: IO[str]) -> None:
+        """기록을 JSON lines로 기록 (한 줄에 단계 하나)"""
+        for record in self.records:
+            file.write(json.dumps(asdict(record), ensure_ascii=False))
+            file.write("\n")
+
+    def to_jsonl(self) -> str:
+        buffer = io.StringIO()
+        self.write_jsonl(buffer)
+        return buffer.getvalue()
+
+    def append_to(self, path: str) -> None:
+        """JSON lines 파일에 이어서 기록 (실행 간 회귀 추적용)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            self.write_jsonl(f)
+
+
+_current: contextvars.ContextVar[Optional[Profiler]] = contextvars.ContextVar(
+    "survey_viewer_profiler", default=None
+)
+
+
+def current_profiler() -> Optional[Profiler]:
+    """현재 실행에서 활성화된 Profiler (없으면 None)"""
+    return _current.get()
+
+
+@contextmanager
+def profile_run(profiler: Optional[Profiler]) -> Iterator[Optional[Profiler]]:
+    """with 블록 동안 profiler를 현재 Profiler로 지정 (None이면 비활성)"""
+    if profiler is None:
+        yield None
+        return
+
+    started_tracing = profiler.trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    token = _current.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _current.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def profile_stage(
+    name: str,
+    question: Optional[str] = None,
+    rows: Optional[int] = None
+) -> Iterator[StageContext]:
+    """현재 Profiler가 있으면 단계를 기록하고, 없으면 그대로 실행"""
+    profiler = _current.get()
+    if profiler is None:
+        yield StageContext(rows)
+        return
+    with profiler.stage(name, question, rows) as context:
+        yield context
+
+
+def profiling_requested() -> bool:
+    """환경 변수로 프로파일링이 켜져 있는지 여부"""
+    return os.environ.get(PROFILE_ENV_VAR, "").lower() in ("1", "true", "yes")
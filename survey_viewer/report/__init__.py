@@ -0,0 +1,5 @@
+"""헤드리스 리포트 모듈 - Streamlit 없이 정적 HTML 리포트 생성"""
+from .generator import (
+    ReportJob, ReportResult, generate_reports, generate_sheet_report, plan_jobs
+)
+from .html_writer import HtmlReportWriter
@@ -0,0 +1,83 @@
+"""리포트 CLI - python -m survey_viewer.report WORKBOOK [WORKBOOK ...] -o OUT"""
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from typing import List, Optional
+
+from ..config.constants import AVAILABLE_CPUS
+from ..visualization.base import ChartOptions
+from .generator import STAGES, generate_reports, plan_jobs
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m survey_viewer.report",
+        description="설문 워크북의 시트별 정적 HTML 리포트 생성",
+    )
+    parser.add_argument("workbooks", nargs="+", help="xlsx 파일 경로")
+    parser.add_argument("-o", "--output", required=True, help="출력 디렉터리")
+    parser.add_argument("--sheet", action="append", dest="sheets", help="처리할 시트 (반복 지정 가능)")
+    parser.add_argument("--workers", type=int, default=AVAILABLE_CPUS, help="병렬 처리 프로세스 수")
+    parser.add_argument("--top-n", type=int, default=8, help="원그래프 Top N (나머지 Other)")
+    parser.add_argument("--include-blank", action="store_true", help="무응답(Blank) 포함")
+    parser.add_argument(
+        "--streaming", action="store_true",
+        help="큰 워크북을 청크 단위로 읽음 (시트 전체를 한 번에 파싱하지 않음)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    options = ChartOptions(top_n=args.top_n, include_blank=args.include_blank)
+
+    jobs = plan_jobs(args.workbooks, args.output, args.sheets, streaming=args.streaming)
+    if not jobs:
+        print("처리할 시트가 없습니다.", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = []
+    for result in generate_reports(jobs, options, args.workers):
+        results.append(result)
+        if result.failed:
+            print(
+                f"[{len(results)}/{len(jobs)}] {result.job.workbook} / {result.job.sheet_name}: "
+                f"실패 - {result.error}",
+                file=sys.stderr,
+            )
+            continue
+        stage_text = " ".join(f"{s}={result.timings.get(s, 0.0):.2f}s" for s in STAGES)
+        print(
+            f"[{len(results)}/{len(jobs)}] {result.job.workbook} / {result.job.sheet_name}: "
+            f"{result.row_count} rows, {result.question_count} questions, {stage_text}",
+            file=sys.stderr,
+        )
+
+    elapsed = time.perf_counter() - start
+    failed = [r for r in results if r.failed]
+    print(f"완료: {len(results) - len(failed)}개 시트, 실패 {len(failed)}개, {elapsed:.2f}s", file=sys.stderr)
+
+    # 단계별 타이밍 기록
+    os.makedirs(args.output, exist_ok=True)
+    with open(os.path.join(args.output, "timings.json"), "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "elapsed": elapsed,
+                "sheets": [
+                    {**asdict(r.job), "index_path": r.index_path, "row_count": r.row_count,
+                     "question_count": r.question_count, "timings": r.timings}
+                    for r in results if not r.failed
+                ],
+                "failed": [{**asdict(r.job), "error": r.error} for r in failed],
+            },
+            f, ensure_ascii=False, indent=2,
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""헤드리스 리포트 생성 - 워크북/시트별 정적 HTML 번들 (Streamlit 미사용)"""
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from ..analysis.aggregate_store import compute_aggregates
+from ..analysis.aggregators import collect_text_responses
+from ..analysis.detectors import QuestionType
+from ..analysis.encoding import AnswerEncoder
+from ..data.loader import ChunkedExcelDataLoader, ExcelDataLoader
+from ..data.preprocessor import TestResponseFilter
+from ..data.question_parser import QuestionParser
+from ..visualization.base import ChartOptions
+from ..visualization.factory import create_default_factory
+from ..visualization.image_cache import figure_to_bytes
+from ..visualization.parallel import init_render_worker
+from .html_writer import HtmlReportWriter
+
+
+# 리포트 처리 단계 (타이밍 출력 순서)
+STAGES = ["load", "filter", "parse", "encode", "aggregate", "render"]
+
+
+@dataclass
+class ReportJob:
+    """리포트 작업 단위 (워크북의 시트 하나)"""
+    workbook: str
+    sheet_name: str
+    output_dir: str
+    # 원본 시트 전체를 한 번에 파싱하지 않고 청크 단위로 읽으며 필터링
+    streaming: bool = False
+
+
+@dataclass
+class ReportResult:
+    """리포트 작업 결과 (실패한 작업은 error에 예외 내용을 담음)"""
+    job: ReportJob
+    index_path: Optional[str] = None
+    row_count: int = 0
+    question_count: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    @classmethod
+    def from_error(cls, job: ReportJob, error: BaseException) -> "ReportResult":
+        return cls(job=job, error=f"{type(error).__name__}: {error}")
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], stage: str) -> Iterator[None]:
+    """단계별 경과 시간(초) 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+
+def safe_name(name: str) -> str:
+    """파일/디렉터리 이름으로 쓸 수 없는 문자 치환"""
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", name).strip("_") or "sheet"
+
+
+def generate_sheet_report(job: ReportJob, options: ChartOptions) -> ReportResult:
+    """시트 하나를 처리하여 HTML 번들 작성"""
+    timings: Dict[str, float] = {}
+
+    if job.streaming:
+        # 청크마다 필터를 적용하므로 filter 시간은 load에 포함됨
+        with _timed(timings, "load"):
+            with open(job.workbook, "rb") as f:
+                loader = ChunkedExcelDataLoader(f)
+                try:
+                    df = loader.load_sheet(job.sheet_name, preprocessor=TestResponseFilter())
+                finally:
+                    loader.close()
+    else:
+        with _timed(timings, "load"):
+            with open(job.workbook, "rb") as f:
+                df = ExcelDataLoader(f).load_sheet(job.sheet_name)
+
+        with _timed(timings, "filter"):
+            df = TestResponseFilter().process(df)
+
+    with _timed(timings, "parse"):
+        questions = QuestionParser().parse(df)
+
+    with _timed(timings, "encode"):
+        df = AnswerEncoder(questions).process(df)
+
+    with _timed(timings, "aggregate"):
+        aggregates = compute_aggregates(df, questions)
+
+    renderer = create_default_factory().get("pie")
+    title = f"{os.path.basename(job.workbook)} - {job.sheet_name}"
+    with HtmlReportWriter(job.output_dir, title) as writer:
+        writer.write_summary(len(df), questions)
+
+        # 문항별로 렌더링 즉시 파일에 기록
+        for question in questions:
+            col = question.column_name
+            if aggregates.question_type(col) == QuestionType.TEXT:
+                writer.write_text_question(question, collect_text_responses(df[col]))
+                continue
+
+            value_counts = aggregates.get_counts(col, options.include_blank)
+            image = None
+            with _timed(timings, "render"):
+                if not value_counts.empty:
+                    fig, _ = renderer.render(value_counts, options)
+                    if fig is not None:
+                        image = figure_to_bytes(fig)
+            writer.write_chart_question(question, value_counts, image)
+
+    return ReportResult(
+        job=job,
+        index_path=writer.index_path,
+        row_count=len(df),
+        question_count=len(questions),
+        timings=timings,
+    )
+
+
+def plan_jobs(
+    workbooks: List[str],
+    output_dir: str,
+    sheet_names: Optional[List[str]] = None,
+    streaming: bool = False
+) -> List[ReportJob]:
+    """워크북별 시트 목록으로 작업 목록 생성 (sheet_names가 있으면 해당 시트만)"""
+    jobs = []
+    for workbook in workbooks:
+        with open(workbook, "rb") as f:
+            available = ExcelDataLoader(f).get_sheet_names()
+
+        stem = safe_name(os.path.splitext(os.path.basename(workbook))[0])
+        for sheet_name in available:
+            if sheet_names and sheet_name not in sheet_names:
+                continue
+            jobs.append(ReportJob(
+                workbook=workbook,
+                sheet_name=sheet_name,
+                output_dir=os.path.join(output_dir, stem, safe_name(sheet_name)),
+                streaming=streaming,
+            ))
+    return jobs
+
+
+def generate_reports(
+    jobs: List[ReportJob],
+    options: ChartOptions,
+    max_workers: int = 1
+) -> Iterator[ReportResult]:
+    """작업들을 병렬 처리하고 완료되는 순서대로 결과 반환
+
+    시트 하나가 실패해도 나머지 작업은 계속 진행하며, 실패한 작업은 error가
+    채워진 결과로 반환한다. 워커는 렌더링 풀과 같이 spawn으로 띄운다.
+    """
+    if max_workers <= 1:
+        init_render_worker()
+        for job in jobs:
+            try:
+                yield generate_sheet_report(job, options)
+            except Exception as e:
+                yield ReportResult.from_error(job, e)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_render_worker,
+    ) as pool:
+        futures = {pool.submit(generate_sheet_report, job, options): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield ReportResult.from_error(futures[future], e)
@@ -0,0 +1,100 @@
+"""정적 HTML 리포트 작성 - 문항 단위로 파일에 바로 기록"""
+import html
+import os
+from typing import List, Optional
+
+import pandas as pd
+
+from ..data.question_parser import Question
+
+
+_STYLE = """
+body { font-family: sans-serif; max-width: 1100px; margin: 0 auto; padding: 24px; }
+section { border-bottom: 1px solid #ddd; padding: 16px 0; }
+.chart-row { display: flex; gap: 24px; align-items: flex-start; }
+.chart-row img { max-width: 480px; }
+table { border-collapse: collapse; }
+td, th { border: 1px solid #ccc; padding: 4px 8px; }
+"""
+
+
+class HtmlReportWriter:
+    """시트 하나의 HTML 리포트 번들 작성기 (index.html + 차트 이미지)"""
+
+    def __init__(self, output_dir: str, title: str):
+        self.output_dir = output_dir
+        self.title = title
+        self._file = None
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.output_dir, "index.html")
+
+    def __enter__(self) -> "HtmlReportWriter":
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._file = open(self.index_path, "w", encoding="utf-8")
+        self._write(
+            "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\">"
+            f"<title>{html.escape(self.title)}</title><style>{_STYLE}</style></head><body>"
+            f"<h1>{html.escape(self.title)}</h1>"
+        )
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._write("</body></html>")
+        self._file.close()
+        self._file = None
+
+    def write_summary(self, row_count: int, questions: List[Question]) -> None:
+        """응답 수 및 문항 목차"""
+        self._write(f"<p>분석에 포함된 응답 수: {row_count} (테스트 응답 제외 적용)</p><ul>")
+        for q in questions:
+            self._write(
+                f"<li><a href=\"#{q.anchor_id}\">{html.escape(q.display_title)}</a></li>"
+            )
+        self._write("</ul>")
+
+    def write_chart_question(
+        self,
+        question: Question,
+        value_counts: pd.Series,
+        image: Optional[bytes]
+    ) -> None:
+        """객관식 문항 (차트 이미지 + 통계표)"""
+        self._open_section(question)
+        if value_counts.empty:
+            self._write("<p>집계할 응답이 없습니다.</p></section>")
+            return
+
+        self._write("<div class=\"chart-row\">")
+        if image is not None:
+            image_name = f"{question.anchor_id}.png"
+            with open(os.path.join(self.output_dir, image_name), "wb") as f:
+                f.write(image)
+            self._write(f"<img src=\"{image_name}\" alt=\"{html.escape(question.display_title)}\">")
+
+        stat_df = pd.DataFrame({
+            "응답": value_counts.index,
+            "빈도": value_counts.values,
+            "비율(%)": (value_counts.values / value_counts.values.sum() * 100).round(2),
+        })
+        self._write(stat_df.to_html(index=False))
+        self._write("</div></section>")
+
+    def write_text_question(self, question: Question, responses: pd.Series) -> None:
+        """서술형 문항 (응답 목록)"""
+        self._open_section(question)
+        self._write(f"<p>서술형 응답 수: {len(responses)}</p><ol>")
+        for value in responses:
+            self._write(f"<li>{html.escape(value)}</li>")
+        self._write("</ol></section>")
+
+    def _open_section(self, question: Question) -> None:
+        self._write(
+            f"<section id=\"{question.anchor_id}\">"
+            f"<h2>{html.escape(question.display_title)}</h2>"
+        )
+
+    def _write(self, text: str) -> None:
+        self._file.write(text)
+        self._file.write("\n")
@@ -2,3 +2,9 @@
 from .sidebar import SidebarUI, DisplayOptions
 from .main_content import MainContentUI
 from .participant_view import ParticipantView
+from .crosstab_view import CrosstabView
+from .change_report import ChangeReportView
+from .text_search import TextSearchView
+from .debug_panel import DebugPanel
+from .wave_comparison import WaveComparisonView
+from .warmup_status import WarmupStatus
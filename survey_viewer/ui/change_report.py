@@ -0,0 +1,44 @@
+"""증분 집계 변경 내역 UI"""
+from typing import List
+
+import pandas as pd
+import streamlit as st
+
+from ..analysis.incremental import ChangeReport
+from ..data.question_parser import Question
+
+
+class ChangeReportView:
+    """재업로드 변경 내역 컴포넌트"""
+
+    def __init__(self, report: ChangeReport, questions: List[Question]):
+        self.report = report
+        self.titles = {q.column_name: q.display_title for q in questions}
+
+    def render(self) -> None:
+        """변경 내역 렌더링"""
+        report = self.report
+        if report.full_rebuild:
+            st.caption(f"증분 집계: 이전 상태가 없어 전체 {report.added}건을 집계했습니다.")
+            return
+        if not report.has_changes:
+            st.caption("증분 집계: 이전 업로드와 동일합니다.")
+            return
+
+        with st.expander(
+            f"증분 집계 변경 내역 (추가 {report.added} / 변경 {report.changed} / "
+            f"삭제 {report.removed} / 유지 {report.unchanged})"
+        ):
+            for col, (before, after) in report.type_changes.items():
+                st.warning(
+                    f"{self.titles.get(col, col)}: 문항 유형 변경 "
+                    f"({before.value} → {after.value}), 해당 문항은 전체 재집계"
+                )
+
+            rows = [
+                {"문항": self.titles.get(col, col), "응답": answer, "증감": int(delta)}
+                for col, deltas in report.count_deltas.items()
+                for answer, delta in deltas.items()
+            ]
+            if rows:
+                st.dataframe(pd.DataFrame(rows), width='stretch', hide_index=True)
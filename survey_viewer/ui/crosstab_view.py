@@ -0,0 +1,82 @@
+"""교차 분석 UI"""
+from typing import List
+
+import pandas as pd
+import streamlit as st
+
+from ..analysis.aggregate_store import DatasetAggregates
+from ..analysis.crosstab import get_crosstab_engine
+from ..analysis.detectors import QuestionType
+from ..data.question_parser import Question
+from ..visualization.base import ChartOptions
+from ..visualization.factory import ChartFactory
+from ..visualization.image_cache import CachedChartRenderer
+from .sidebar import DisplayOptions
+
+
+class CrosstabView:
+    """교차 분석 컴포넌트 (문항 A x 문항 B 분할표 + 히트맵)"""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        questions: List[Question],
+        aggregates: DatasetAggregates,
+        chart_factory: ChartFactory,
+        options: DisplayOptions
+    ):
+        self.df = df
+        self.aggregates = aggregates
+        self.chart_factory = chart_factory
+        self.options = options
+        # 객관식 문항만 교차 분석 대상
+        self.questions = [
+            q for q in questions
+            if aggregates.question_type(q.column_name) != QuestionType.TEXT
+        ]
+
+    def render(self) -> None:
+        """교차 분석 렌더링"""
+        if len(self.questions) < 2:
+            st.info("교차 분석할 객관식 문항이 2개 이상 필요합니다.")
+            return
+
+        c1, c2 = st.columns(2)
+        with c1:
+            row_q = st.selectbox(
+                "행 문항", self.questions, index=0,
+                format_func=lambda q: q.display_title, key="crosstab_row"
+            )
+        with c2:
+            col_q = st.selectbox(
+                "열 문항", self.questions, index=1,
+                format_func=lambda q: q.display_title, key="crosstab_col"
+            )
+
+        if row_q.column_name == col_q.column_name:
+            st.info("서로 다른 문항을 선택하세요.")
+            return
+
+        table = get_crosstab_engine().crosstab(
+            self.df, row_q.column_name, col_q.column_name, self.options.include_blank
+        )
+        if table.empty or table.to_numpy().sum() == 0:
+            st.info("집계할 응답이 없습니다.")
+            return
+
+        chart_options = ChartOptions(
+            top_n=self.options.top_n,
+            include_blank=self.options.include_blank
+        )
+        renderer = CachedChartRenderer(self.chart_factory.get("heatmap"))
+        image, _ = renderer.render_image(table, chart_options)
+        if image is not None:
+            st.image(image, width="stretch")
+
+        # 빈도 / 행 기준 비율
+        tab_count, tab_ratio = st.tabs(["빈도", "행 비율(%)"])
+        with tab_count:
+            st.dataframe(table, width='stretch')
+        with tab_ratio:
+            totals = table.sum(axis=1).replace(0, 1)
+            st.dataframe((table.div(totals, axis=0) * 100).round(2), width='stretch')
@@ -0,0 +1,34 @@
+"""디버그 패널 UI - 단계별 프로파일링 결과"""
+import streamlit as st
+
+from ..profiling import Profiler
+
+
+class DebugPanel:
+    """프로파일링 결과 접이식 패널 (단계 합계, 느린 문항, JSON lines 내보내기)"""
+
+    def __init__(self, profiler: Profiler):
+        self.profiler = profiler
+
+    def render(self) -> None:
+        """디버그 패널 렌더링"""
+        with st.expander(f"디버그: 단계별 프로파일 (run {self.profiler.run_id})"):
+            summary = self.profiler.stage_summary()
+            if summary.empty:
+                st.caption("기록된 단계가 없습니다.")
+                return
+
+            st.caption("단계별 합계 (wall/cpu: 초, peak: 최대 추가 할당 바이트)")
+            st.dataframe(summary, width='stretch')
+
+            questions = self.profiler.question_summary()
+            if not questions.empty:
+                st.caption("문항별 경과 시간 (느린 순)")
+                st.dataframe(questions, width='stretch')
+
+            st.download_button(
+                "JSON lines 내보내기",
+                data=self.profiler.to_jsonl(),
+                file_name=f"profile_{self.profiler.run_id}.jsonl",
+                mime="application/x-ndjson",
+            )
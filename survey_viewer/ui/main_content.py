@@ -1,18 +1,25 @@
 """본문 UI - 문항별 시각화"""
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
 
 from ..data.question_parser import Question
-from ..analysis.detectors import QuestionType, detect_question_type
-from ..analysis.aggregators import get_aggregator
+from ..profiling import profile_stage
+from ..analysis.aggregate_store import DatasetAggregates, get_aggregate_store
+from ..analysis.detectors import QuestionType
 from ..visualization.base import ChartOptions
 from ..visualization.factory import ChartFactory
+from ..visualization.parallel import ParallelChartRenderer
+from ..visualization.warmup import WarmupRequester, get_chart_warmup
 from .sidebar import DisplayOptions
+from .text_search import TextSearchView
+from .warmup_status import WarmupStatus
 
 
+# 세션의 차트 미리 렌더링 요청자 (재실행마다 새 세대로 예약)
+WARMUP_REQUESTER_KEY = "warmup_requester"
+
 class MainContentUI:
     """본문 UI 컴포넌트"""
 
@@ -21,22 +28,63 @@ class MainContentUI:
         df: pd.DataFrame,
         questions: List[Question],
         chart_factory: ChartFactory,
-        options: DisplayOptions
+        options: DisplayOptions,
+        aggregates: Optional[DatasetAggregates] = None
     ):
         self.df = df
         self.questions = questions
         self.chart_factory = chart_factory
         self.options = options
+        self.aggregates = aggregates or get_aggregate_store().build(df, questions)
 
     def render(self) -> None:
-        """모든 문항 렌더링"""
-        for question in self.questions:
-            self._render_question(question)
+        """모든 문항 렌더링
+
+        페이지 모드에서는 현재 페이지의 문항만 렌더링한다. 레이아웃과
+        통계표를 먼저 그리고, 차트는 자리만 잡아 둔 뒤 일괄 렌더링하여
+        완료되는 대로 채운다.
+        """
+        total = len(self.questions)
+        page = self.options.page_slice(total)
+        visible = self.questions[page]
+        if len(visible) < total:
+            st.caption(
+                f"전체 {total}문항 중 {page.start + 1}–{page.stop}번째 문항 "
+                f"(페이지 {self.options.page}/{self.options.page_count(total)})"
+            )
+
+        # 현재 페이지 → 나머지 문항 → 무응답 포함 토글 순으로 백그라운드 렌더링 예약
+        WarmupStatus(self._schedule_warmup(visible)).render()
+
+        pending = []
+        for question in visible:
+            self._render_question(question, pending)
+
+        self._render_charts(pending)
+
+        if self.options.scroll_to is not None:
+            self._scroll_to(self.options.scroll_to)
+
+    def _scroll_to(self, anchor_id: str) -> None:
+        """문항 앵커로 스크롤 (페이지 전환 직후에는 앵커가 아직 없을 수 있어 잠시 재시도)"""
+        from streamlit.components.v1 import html
+
+        html(
+            f"""<script>
+            let tries = 0;
+            const scroll = () => {{
+                const target = window.parent.document.getElementById({anchor_id!r});
+                if (target) target.scrollIntoView();
+                else if (++tries < 20) setTimeout(scroll, 100);
+            }};
+            scroll();
+            </script>""",
+            height=0,
+        )
 
-    def _render_question(self, question: Question) -> None:
+    def _render_question(self, question: Question, pending: list) -> None:
         """개별 문항 렌더링"""
-        series = self.df[question.column_name]
-        question_type = detect_question_type(question.column_name, series)
+        question_type = self.aggregates.question_type(question.column_name)
 
         # 앵커 및 제목
         st.markdown(
@@ -46,50 +94,41 @@ class MainContentUI:
         st.subheader(question.display_title)
 
         if question_type == QuestionType.TEXT:
-            self._render_text_question(series)
+            self._render_text_question(question)
         else:
-            self._render_chart_question(series, question_type)
+            self._render_chart_question(question, pending)
 
         st.divider()
 
-    def _render_text_question(self, series: pd.Series) -> None:
-        """서술형 문항 렌더링"""
-        s = series.dropna().astype(str).str.strip()
-        s = s[(s != "") & (s != ".")]
+    def _render_text_question(self, question: Question) -> None:
+        """서술형 문항 렌더링 (검색 인덱스 기반 페이지 보기)"""
+        TextSearchView(self.df, question).render()
 
-        st.caption(f"서술형 응답 수: {len(s)}")
-        st.dataframe(s.to_frame(name="응답"), width='stretch')
-
-    def _render_chart_question(
-        self,
-        series: pd.Series,
-        question_type: QuestionType
-    ) -> None:
+    def _render_chart_question(self, question: Question, pending: list) -> None:
         """차트 문항 렌더링 (객관식)"""
-        # 집계
-        is_multi = question_type == QuestionType.MULTI_SELECT
-        aggregator = get_aggregator(is_multi)
-        value_counts = aggregator.aggregate(series, self.options.include_blank)
+        # 고유 응답이 많은 문항은 기본으로 상위 K 요약을 표시하고, 켜면 정확한 집계를 계산
+        column = question.column_name
+        include_blank = self.options.include_blank
+        sketch = self.aggregates.get_sketch(column, include_blank)
+        if sketch is not None and st.toggle(
+            "전체 정확 집계", key=f"exact_counts_{column}",
+            help="고유 응답이 많아 상위 항목만 요약해 표시합니다. 켜면 모든 응답을 정확히 집계합니다."
+        ):
+            sketch = None
+        if sketch is not None:
+            value_counts = sketch.to_counts()
+        else:
+            value_counts = self.aggregates.get_counts(column, include_blank)
 
         if value_counts.empty:
             st.info("집계할 응답이 없습니다.")
             return
 
-        # 차트 렌더링
-        chart_options = ChartOptions(
-            top_n=self.options.top_n,
-            include_blank=self.options.include_blank
-        )
-        renderer = self.chart_factory.get("pie")
-        fig, display_data = renderer.render(value_counts, chart_options)
-
-        # 2컬럼 레이아웃
+        # 2컬럼 레이아웃 (차트 자리는 일괄 렌더링 후 채움)
         c1, c2 = st.columns([1, 1])
 
         with c1:
-            if fig is not None:
-                st.pyplot(fig, clear_figure=True)
-                plt.close(fig)
+            pending.append((st.empty(), value_counts, column))
 
         with c2:
             stat_df = pd.DataFrame({
@@ -97,4 +136,75 @@ class MainContentUI:
                 "빈도": value_counts.values,
                 "비율(%)": (value_counts.values / value_counts.values.sum() * 100).round(2),
             })
+            if sketch is not None:
+                stat_df["최대 오차"] = sketch.error_bounds().to_numpy()
+                st.caption(
+                    f"고유 응답이 많아 상위 {sketch.capacity}개만 요약했습니다. "
+                    f"전체 {sketch.total:,}건은 정확하며, 빈도는 최대 오차만큼 과대 추정일 수 있고 "
+                    f"목록 밖 응답은 각각 {sketch.max_error:,}건 이하입니다."
+                )
             st.dataframe(stat_df, width='stretch')
+
+    def _chart_options(self, include_blank: bool) -> ChartOptions:
+        return ChartOptions(top_n=self.options.top_n, include_blank=include_blank)
+
+    def _schedule_warmup(self, visible: List[Question]) -> List[str]:
+        """모든 객관식 문항 차트를 미리 렌더링하도록 예약하고 현재 옵션의 캐시 키 반환"""
+        chart_renderer = self.chart_factory.get(self.options.chart_renderer)
+        warmup = get_chart_warmup()
+        if chart_renderer.client_side or not warmup.enabled:
+            return []
+
+        visible_columns = {q.column_name for q in visible}
+        ordered = [q for q in self.questions if q.column_name in visible_columns]
+        ordered += [q for q in self.questions if q.column_name not in visible_columns]
+        columns = [
+            q.column_name for q in ordered
+            if self.aggregates.question_type(q.column_name) != QuestionType.TEXT
+        ]
+
+        def jobs(include_blank: bool) -> list:
+            counts = [self.aggregates.get_display_counts(col, include_blank) for col in columns]
+            return [c for c in counts if not c.empty]
+
+        requester = st.session_state.get(WARMUP_REQUESTER_KEY)
+        if requester is None:
+            requester = st.session_state[WARMUP_REQUESTER_KEY] = WarmupRequester()
+        # 이전 실행에서 예약했지만 이번 실행에서 다시 요청하지 않은 작업은 버림
+        warmup.begin(requester)
+
+        include_blank = self.options.include_blank
+        keys = warmup.schedule(
+            chart_renderer, jobs(include_blank), self._chart_options(include_blank),
+            requester=requester
+        )
+        # 무응답 포함 옵션을 바꿨을 때를 대비해 현재 옵션 다음 순위로 예약
+        warmup.schedule(
+            chart_renderer, jobs(not include_blank), self._chart_options(not include_blank),
+            priority=len(keys), requester=requester
+        )
+        return keys
+
+    def _render_charts(self, pending: list) -> None:
+        """대기 중인 차트를 일괄 렌더링하여 자리에 채움"""
+        if not pending:
+            return
+
+        chart_options = self._chart_options(self.options.include_blank)
+        chart_renderer = self.chart_factory.get(self.options.chart_renderer)
+        if chart_renderer.client_side:
+            # 브라우저에서 그리는 차트는 명세만 만들면 되므로 바로 채움
+            for placeholder, value_counts, column in pending:
+                with profile_stage("render_question", question=column):
+                    chart, _ = chart_renderer.render(value_counts, chart_options)
+                if chart is not None:
+                    placeholder.altair_chart(chart, use_container_width=True)
+            return
+
+        renderer = ParallelChartRenderer(chart_renderer, warmup=get_chart_warmup())
+        jobs = [value_counts for _, value_counts, _ in pending]
+        labels = [column for _, _, column in pending]
+
+        for i, image, _ in renderer.render_images(jobs, chart_options, labels):
+            if image is not None:
+                pending[i][0].image(image, width="stretch")
@@ -1,44 +1,137 @@
 """사이드바 UI"""
+import math
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 import streamlit as st
 
+from ..analysis.segments import Segment, SegmentCondition, SegmentIndex
 from ..data.question_parser import Question
 
 
+# 페이지 선택 위젯의 세션 상태 키
+PAGE_KEY = "question_page"
+
+# 문항 바로가기로 이동할 문항 앵커의 세션 상태 키 (페이지 전환 후 스크롤)
+SCROLL_TARGET_KEY = "scroll_to_question"
+
+# 페이지당 문항 수 선택지 (0 = 전체)
+PAGE_SIZE_CHOICES = [0, 10, 20, 50]
+
+# 기본 페이지당 문항 수 (문항이 많은 설문도 첫 화면은 이만큼만 렌더링)
+DEFAULT_PAGE_SIZE = 20
+
+# 객관식 차트 렌더러 선택지 (ChartFactory 등록 이름 → 표시 문구)
+CHART_RENDERER_CHOICES = {
+    "pie": "원그래프 (이미지)",
+    "altair_bar": "막대 (인터랙티브)",
+    "altair_donut": "도넛 (인터랙티브)",
+}
+
+# 세그먼트 조건 최대 개수
+MAX_SEGMENT_CONDITIONS = 4
+
+# 세그먼트 조건 결합 방식 (표시 문구 → Segment.combine)
+SEGMENT_COMBINE_CHOICES = {"모두 만족 (AND)": "and", "하나 이상 만족 (OR)": "or"}
+
+
 @dataclass
 class DisplayOptions:
     """표시 옵션"""
     include_blank: bool = False
     top_n: int = 8
+    page_size: int = DEFAULT_PAGE_SIZE  # 페이지당 문항 수 (0이면 전체 렌더링)
+    page: int = 1           # 현재 페이지 (1부터 시작)
+    scroll_to: Optional[str] = None     # 렌더링 후 스크롤할 문항 앵커 (바로가기 선택 시)
+    incremental: bool = False   # 같은 설문 재업로드 시 증분 집계 사용
+    segment: Optional[Segment] = None   # 응답자 세그먼트 (None이면 전체 응답자)
+    chart_renderer: str = "pie"     # 객관식 문항 차트 렌더러 (ChartFactory 등록 이름)
+
+    def page_count(self, total: int) -> int:
+        """전체 페이지 수"""
+        if self.page_size <= 0:
+            return 1
+        return max(1, math.ceil(total / self.page_size))
+
+    def page_slice(self, total: int) -> slice:
+        """현재 페이지에 해당하는 문항 범위"""
+        if self.page_size <= 0:
+            return slice(0, total)
+        start = (self.page - 1) * self.page_size
+        return slice(start, min(start + self.page_size, total))
+
+    def page_of(self, index: int) -> int:
+        """문항 위치(0부터)가 속한 페이지"""
+        if self.page_size <= 0:
+            return 1
+        return index // self.page_size + 1
 
 
 class SidebarUI:
     """사이드바 UI 컴포넌트"""
 
-    def __init__(self, questions: List[Question]):
+    def __init__(self, questions: List[Question], segment_index: Optional[SegmentIndex] = None):
         self.questions = questions
+        self.segment_index = segment_index
 
     def render(self) -> DisplayOptions:
         """사이드바 렌더링 및 옵션 반환"""
         with st.sidebar:
-            self._render_navigation()
+            # 네비게이션은 위에 표시하되, 현재 페이지를 알아야 하므로 옵션 이후에 채움
+            navigation = st.container()
             st.divider()
-            return self._render_options()
+            options = self._render_options()
+            if self.segment_index is not None:
+                st.divider()
+                options.segment = self._render_segment()
+
+            with navigation:
+                self._render_navigation(options)
+            return options
 
-    def _render_navigation(self) -> None:
+    def _render_navigation(self, options: DisplayOptions) -> None:
         """문항 바로가기 네비게이션"""
         st.header("문항 바로가기")
         st.caption("아래 문항을 클릭하면 해당 섹션으로 이동합니다.")
 
-        toc_lines = []
-        for q in self.questions:
-            toc_lines.append(
-                f'- <a href="#{q.anchor_id}">{q.display_title}</a>'
+        if options.page_size <= 0:
+            toc_lines = [f'- <a href="#{q.anchor_id}">{q.display_title}</a>' for q in self.questions]
+            st.markdown("\n".join(toc_lines), unsafe_allow_html=True)
+            return
+
+        self._render_page_jump(options)
+
+        # 페이지 모드에서는 다른 페이지 문항이 렌더링되지 않았으므로
+        # 클릭 시 해당 페이지로 전환한 뒤 문항 위치로 스크롤
+        current = range(len(self.questions))[options.page_slice(len(self.questions))]
+        for i, q in enumerate(self.questions):
+            label = q.display_title if i in current else f"{q.display_title} (p.{options.page_of(i)})"
+            st.button(
+                label, key=f"toc_{i}", type="tertiary",
+                on_click=self._go_to_question, args=(options, i),
             )
 
-        st.markdown("\n".join(toc_lines), unsafe_allow_html=True)
+    def _go_to_question(self, options: DisplayOptions, index: int) -> None:
+        """문항이 속한 페이지로 전환하고 다음 실행에서 그 문항으로 스크롤하도록 기록"""
+        st.session_state[PAGE_KEY] = options.page_of(index)
+        st.session_state[SCROLL_TARGET_KEY] = self.questions[index].anchor_id
+
+    def _render_page_jump(self, options: DisplayOptions) -> None:
+        """다른 페이지 문항으로 이동 (선택 시 해당 페이지로 전환)"""
+        def jump() -> None:
+            index = st.session_state["question_jump"]
+            if index is not None:
+                self._go_to_question(options, index)
+
+        st.selectbox(
+            "문항으로 이동",
+            options=range(len(self.questions)),
+            index=None,
+            format_func=lambda i: self.questions[i].display_title,
+            key="question_jump",
+            on_change=jump,
+            placeholder="문항 선택",
+        )
 
     def _render_options(self) -> DisplayOptions:
         """표시 옵션 UI"""
@@ -46,8 +139,83 @@ class SidebarUI:
 
         include_blank = st.checkbox("무응답(Blank) 포함", value=False)
         top_n = st.slider("Pie Top N (나머지 Other)", 3, 15, 8)
+        chart_renderer = st.selectbox(
+            "차트",
+            options=list(CHART_RENDERER_CHOICES),
+            format_func=CHART_RENDERER_CHOICES.get,
+            help="인터랙티브 차트는 집계 결과만 브라우저로 보내 그리며 마우스를 올리면 값이 표시됩니다."
+        )
+        page_size = st.selectbox(
+            "페이지당 문항 수",
+            options=PAGE_SIZE_CHOICES,
+            index=PAGE_SIZE_CHOICES.index(DEFAULT_PAGE_SIZE),
+            format_func=lambda n: "전체" if n == 0 else f"{n}개",
+        )
+        incremental = st.checkbox(
+            "증분 집계 (같은 설문 재업로드)",
+            value=False,
+            help="이전 업로드 이후 새로 추가/변경된 응답만 집계에 반영합니다."
+        )
 
-        return DisplayOptions(
+        options = DisplayOptions(
             include_blank=include_blank,
-            top_n=top_n
+            top_n=top_n,
+            page_size=page_size,
+            incremental=incremental,
+            chart_renderer=chart_renderer,
+            scroll_to=st.session_state.pop(SCROLL_TARGET_KEY, None)
         )
+
+        if page_size > 0:
+            page_count = options.page_count(len(self.questions))
+            # 페이지 크기 변경으로 범위를 벗어난 페이지 보정
+            if st.session_state.get(PAGE_KEY, 1) > page_count:
+                st.session_state[PAGE_KEY] = page_count
+            options.page = st.number_input(
+                f"페이지 (총 {page_count})",
+                min_value=1,
+                max_value=page_count,
+                step=1,
+                key=PAGE_KEY,
+            )
+
+        return options
+
+    def _render_segment(self) -> Optional[Segment]:
+        """응답자 세그먼트 조건 UI (객관식 문항의 보기 조합)"""
+        st.header("응답자 세그먼트")
+        choices = [q for q in self.questions if q.column_name in self.segment_index.bitmaps]
+        if not choices:
+            st.caption("세그먼트에 사용할 객관식 문항이 없습니다.")
+            return None
+
+        count = st.number_input(
+            "조건 수", min_value=0, max_value=MAX_SEGMENT_CONDITIONS, value=0, step=1,
+            help="선택한 보기에 응답한 응답자만 집계합니다. 조건 안의 보기는 하나 이상 응답(OR)입니다."
+        )
+        combine = "and"
+        if count > 1:
+            combine = SEGMENT_COMBINE_CHOICES[
+                st.radio("조건 결합", list(SEGMENT_COMBINE_CHOICES), horizontal=True)
+            ]
+
+        conditions = []
+        for i in range(count):
+            question = st.selectbox(
+                f"조건 {i + 1} 문항",
+                options=choices,
+                format_func=lambda q: q.display_title,
+                key=f"segment_question_{i}",
+            )
+            selected = st.multiselect(
+                f"조건 {i + 1} 보기",
+                options=self.segment_index.options(question.column_name),
+                key=f"segment_options_{i}_{question.anchor_id}",
+            )
+            negate = st.checkbox("응답하지 않은 사람 (NOT)", key=f"segment_negate_{i}")
+            if selected:
+                conditions.append(SegmentCondition(question.column_name, tuple(selected), negate))
+
+        if not conditions:
+            return None
+        return Segment(tuple(conditions), combine)
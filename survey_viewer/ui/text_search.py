@@ -0,0 +1,50 @@
+"""서술형 응답 검색 UI"""
+import pandas as pd
+import streamlit as st
+
+from ..analysis.text_index import TEXT_SEARCH_PAGE_SIZE, get_text_index
+from ..data.question_parser import Question
+
+
+# 단어 빈도표에 표시할 단어 수
+TERM_TABLE_SIZE = 30
+
+
+class TextSearchView:
+    """서술형 문항 검색/단어 빈도/페이지별 응답 보기 컴포넌트"""
+
+    def __init__(self, df: pd.DataFrame, question: Question):
+        self.df = df
+        self.question = question
+
+    def render(self) -> None:
+        """검색 UI 렌더링 (인덱스는 데이터셋별 1회 생성)"""
+        index = get_text_index(self.df, self.question.column_name)
+        st.caption(f"서술형 응답 수: {len(index)}")
+        if len(index) == 0:
+            return
+
+        key = f"text_search_{self.question.anchor_id}"
+        c1, c2 = st.columns([3, 1])
+        with c1:
+            query = st.text_input(
+                "응답 검색",
+                key=f"{key}_query",
+                placeholder="검색어 (공백으로 구분하면 모두 포함)",
+            )
+        with c2:
+            page = st.number_input("페이지", min_value=1, step=1, key=f"{key}_page")
+
+        result = index.search(query, page=page, page_size=TEXT_SEARCH_PAGE_SIZE)
+        if query:
+            st.caption(f"'{query}' 포함 응답: {result.total}건")
+        st.caption(f"페이지 {result.page}/{result.page_count}")
+        st.dataframe(result.responses.to_frame(name="응답"), width='stretch')
+
+        with st.expander("자주 나온 단어"):
+            terms = index.term_frequencies(TERM_TABLE_SIZE)
+            st.dataframe(
+                pd.DataFrame({"단어": terms.index, "응답 수": terms.to_numpy()}),
+                width='stretch',
+                hide_index=True,
+            )
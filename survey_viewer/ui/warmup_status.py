@@ -0,0 +1,37 @@
+"""차트 미리 렌더링 진행률 UI"""
+from typing import List
+
+import streamlit as st
+
+from ..visualization.warmup import get_chart_warmup
+
+
+# 진행률 표시 갱신 주기 (초)
+WARMUP_REFRESH_SECONDS = 1.0
+
+
+class WarmupStatus:
+    """백그라운드 차트 준비 진행률 컴포넌트 (완료 전까지 이 부분만 주기적으로 갱신)
+
+    남은 작업이 있을 때만 주기적으로 갱신되는 fragment를 만들고, 완료를 확인하면
+    페이지 전체를 한 번 다시 실행해 fragment와 갱신 타이머를 없앤다.
+    """
+
+    def __init__(self, keys: List[str]):
+        self.keys = keys
+
+    def render(self) -> None:
+        """진행률 렌더링 (이미 모두 준비되었으면 표시하지 않음)"""
+        warmup = get_chart_warmup()
+        done, total = warmup.progress(self.keys)
+        if done >= total:
+            return
+
+        @st.fragment(run_every=WARMUP_REFRESH_SECONDS)
+        def progress() -> None:
+            done, total = warmup.progress(self.keys)
+            if done >= total:
+                st.rerun()
+            st.progress(done / total, text=f"차트 미리 준비 중 {done}/{total}")
+
+        progress()
@@ -0,0 +1,47 @@
+"""차수 비교 UI"""
+from typing import Dict
+
+import streamlit as st
+
+from ..analysis.dataset import SurveyDataset
+from ..analysis.waves import compare_waves
+
+
+class WaveComparisonView:
+    """시트(차수)별 같은 문항의 응답 수/비율 변화 컴포넌트"""
+
+    def __init__(self, waves: Dict[str, SurveyDataset], include_blank: bool = False):
+        self.waves = waves
+        self.include_blank = include_blank
+
+    def render(self) -> None:
+        """문항별 차수 비교표 렌더링"""
+        if len(self.waves) < 2:
+            st.info("비교할 차수(시트)를 두 개 이상 선택하세요.")
+            return
+
+        table = compare_waves(self.waves, self.include_blank)
+        if table.empty:
+            st.info("비교할 객관식 문항이 없습니다.")
+            return
+
+        st.caption(
+            "Q번호를 뗀 문항 제목으로 차수를 맞춥니다. 증감은 직전 차수 대비이며, "
+            "해당 차수에 없는 문항은 빈 칸으로 표시됩니다."
+        )
+        titles = list(table.index.get_level_values("question").unique())
+        title = st.selectbox("문항", titles, key="wave_question")
+
+        # 지표 x 차수 열을 "차수 지표" 한 줄 이름으로 펼쳐 표시
+        question_table = table.loc[title]
+        question_table.columns = [f"{wave} {metric}" for metric, wave in question_table.columns]
+        st.dataframe(question_table, width='stretch')
+
+        flat = table.copy()
+        flat.columns = [f"{wave} {metric}" for metric, wave in flat.columns]
+        st.download_button(
+            "전체 비교표 CSV 다운로드",
+            data=flat.reset_index().to_csv(index=False).encode("utf-8-sig"),
+            file_name="wave_comparison.csv",
+            mime="text/csv",
+        )
@@ -0,0 +1,31 @@
+"""공용 유틸리티 - 여러 모듈이 함께 쓰는 작은 도우미 (표준 라이브러리만 사용)"""
+import functools
+import threading
+from typing import Callable, List, TypeVar
+
+
+T = TypeVar("T")
+
+
+def process_singleton(factory: Callable[[], T]) -> Callable[[], T]:
+    """프로세스 전역 인스턴스 접근자로 감싸는 데코레이터 (Streamlit 재실행 간 유지)
+
+    처음 호출할 때 한 번만 factory를 실행하고(스레드 안전) 이후에는 같은 객체를
+    반환한다. 접근자의 reset()은 인스턴스를 버려 다음 호출에서 새로 만들게 한다.
+    """
+    lock = threading.Lock()
+    holder: List[T] = []
+
+    @functools.wraps(factory)
+    def get() -> T:
+        with lock:
+            if not holder:
+                holder.append(factory())
+            return holder[0]
+
+    def reset() -> None:
+        with lock:
+            holder.clear()
+
+    get.reset = reset
+    return get
@@ -1,5 +1,10 @@
 """시각화 모듈"""
 from .base import ChartRenderer, ChartOptions
 from .factory import ChartFactory, create_default_factory
+from .image_cache import CachedChartRenderer, get_chart_image_cache
+from .parallel import ParallelChartRenderer
+from .warmup import ChartWarmup, WarmupRequester, get_chart_warmup
+from .charts.altair_chart import AltairChartRenderer
+from .charts.heatmap import HeatmapRenderer
 from .charts.pie_chart import PieChartRenderer
 from .charts.text_list import TextListRenderer
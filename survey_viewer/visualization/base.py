@@ -1,10 +1,12 @@
 """차트 렌더러 추상 클래스 및 옵션"""
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import pandas as pd
-import matplotlib.pyplot as plt
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 @dataclass
@@ -15,15 +17,27 @@ class ChartOptions:
     figsize: Tuple[int, int] = (6, 6)
 
 
+def collapse_top_n(data: pd.Series, top_n: int) -> pd.Series:
+    """상위 top_n개 응답만 남기고 나머지는 "Other"로 합침"""
+    if len(data) <= top_n:
+        return data.copy()
+    top = data.head(top_n)
+    other = data.iloc[top_n:].sum()
+    return pd.concat([top, pd.Series({"Other": other})])
+
+
 class ChartRenderer(ABC):
     """차트 렌더러 추상 클래스"""
 
+    # True면 render가 Figure 대신 브라우저에서 그릴 Vega-Lite 차트를 반환
+    client_side: bool = False
+
     @abstractmethod
     def render(
         self,
         data: pd.Series,
         options: ChartOptions
-    ) -> Tuple[Optional[plt.Figure], pd.Series]:
+    ) -> Tuple[Optional["Figure"], pd.Series]:
         """
         차트 렌더링
 
@@ -32,7 +46,7 @@ class ChartRenderer(ABC):
             options: 차트 옵션
 
         Returns:
-            (Figure 또는 None, 표시용 데이터)
+            (Figure(client_side면 Vega-Lite 차트) 또는 None, 표시용 데이터)
         """
         pass
 
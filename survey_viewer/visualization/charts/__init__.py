@@ -1,3 +1,5 @@
 """차트 구현체"""
+from .altair_chart import AltairChartRenderer
+from .heatmap import HeatmapRenderer
 from .pie_chart import PieChartRenderer
 from .text_list import TextListRenderer
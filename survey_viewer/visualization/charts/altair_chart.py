@@ -0,0 +1,68 @@
+"""Altair(Vega-Lite) 렌더러 - 집계 결과만 브라우저로 보내 클라이언트에서 그림"""
+from typing import Optional, Tuple
+
+import altair as alt
+import pandas as pd
+
+from ..base import ChartRenderer, ChartOptions, collapse_top_n
+
+
+# 차트 유형별 표시 방식
+ALTAIR_VARIANTS = ("bar", "donut")
+
+
+class AltairChartRenderer(ChartRenderer):
+    """막대/도넛 Vega-Lite 차트 렌더러 (응답/빈도/비율 툴팁)
+
+    서버는 Top N + Other로 정리된 응답별 빈도만 인라인 데이터로 담은
+    차트 명세를 만들고, 래스터화는 브라우저가 한다.
+    """
+
+    client_side = True
+
+    def __init__(self, variant: str = "bar"):
+        if variant not in ALTAIR_VARIANTS:
+            raise ValueError(f"Unknown altair variant: {variant}")
+        self.variant = variant
+
+    def render(
+        self,
+        data: pd.Series,
+        options: ChartOptions
+    ) -> Tuple[Optional[alt.Chart], pd.Series]:
+        if data.empty:
+            return None, data
+
+        display_data = collapse_top_n(data, options.top_n)
+        total = display_data.sum()
+        values = [
+            {"응답": str(label), "빈도": int(count), "비율": round(count / total * 100, 1)}
+            for label, count in display_data.items()
+        ]
+
+        chart = alt.Chart(alt.Data(values=values))
+        order = [row["응답"] for row in values]
+        tooltip = [
+            alt.Tooltip("응답:N"),
+            alt.Tooltip("빈도:Q"),
+            alt.Tooltip("비율:Q", format=".1f", title="비율(%)"),
+        ]
+
+        if self.variant == "donut":
+            chart = chart.mark_arc(innerRadius=60).encode(
+                theta=alt.Theta("빈도:Q", stack=True),
+                color=alt.Color("응답:N", sort=order, legend=alt.Legend(title=None)),
+                order=alt.Order("빈도:Q", sort="descending"),
+                tooltip=tooltip,
+            )
+        else:
+            chart = chart.mark_bar().encode(
+                x=alt.X("빈도:Q", title="빈도"),
+                y=alt.Y("응답:N", sort=order, title=None),
+                tooltip=tooltip,
+            )
+
+        return chart.properties(height=max(200, 28 * len(values))), display_data
+
+    def get_chart_type(self) -> str:
+        return f"altair_{self.variant}"
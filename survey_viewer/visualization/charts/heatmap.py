@@ -0,0 +1,61 @@
+"""교차 분석 히트맵 렌더러"""
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from ..base import ChartRenderer, ChartOptions
+
+
+def collapse_table_top_n(table: pd.DataFrame, top_n: int) -> pd.DataFrame:
+    """분할표의 행/열을 각각 상위 top_n개로 줄이고 나머지는 Other로 합침"""
+    if len(table.index) > top_n:
+        other = table.iloc[top_n:].sum(axis=0).to_frame("Other").T
+        table = pd.concat([table.iloc[:top_n], other])
+    if len(table.columns) > top_n:
+        other = table.iloc[:, top_n:].sum(axis=1).rename("Other")
+        table = pd.concat([table.iloc[:, :top_n], other], axis=1)
+    return table
+
+
+class HeatmapRenderer(ChartRenderer):
+    """분할표 히트맵 렌더러 (data는 행 x 열 빈도 DataFrame)"""
+
+    def render(
+        self,
+        data: pd.DataFrame,
+        options: ChartOptions
+    ) -> Tuple[Optional[plt.Figure], pd.DataFrame]:
+        if data.empty:
+            return None, data
+
+        # Top N + Other 처리
+        display_data = collapse_table_top_n(data, options.top_n)
+        values = display_data.to_numpy()
+
+        # 차트 생성 (보기 수에 맞춰 크기 조정)
+        width = max(options.figsize[0], 1 + 0.9 * len(display_data.columns))
+        height = max(options.figsize[1] * 0.75, 1 + 0.6 * len(display_data.index))
+        fig, ax = plt.subplots(figsize=(width, height))
+        image = ax.imshow(values, cmap="Blues", aspect="auto")
+        fig.colorbar(image, ax=ax)
+
+        ax.set_xticks(np.arange(len(display_data.columns)))
+        ax.set_xticklabels(display_data.columns, rotation=45, ha="right")
+        ax.set_yticks(np.arange(len(display_data.index)))
+        ax.set_yticklabels(display_data.index)
+
+        # 셀 값 표시 (진한 셀은 흰 글씨)
+        threshold = values.max() / 2 if values.size else 0
+        for i in range(values.shape[0]):
+            for j in range(values.shape[1]):
+                ax.text(
+                    j, i, str(values[i, j]), ha="center", va="center",
+                    color="white" if values[i, j] > threshold else "black"
+                )
+
+        return fig, display_data
+
+    def get_chart_type(self) -> str:
+        return "heatmap"
@@ -4,7 +4,7 @@ from typing import Optional, Tuple
 import pandas as pd
 import matplotlib.pyplot as plt
 
-from ..base import ChartRenderer, ChartOptions
+from ..base import ChartRenderer, ChartOptions, collapse_top_n
 
 
 class PieChartRenderer(ChartRenderer):
@@ -19,11 +19,7 @@ class PieChartRenderer(ChartRenderer):
             return None, data
 
         # Top N + Other 처리
-        display_data = data.copy()
-        if len(display_data) > options.top_n:
-            top = display_data.head(options.top_n)
-            other = display_data.iloc[options.top_n:].sum()
-            display_data = pd.concat([top, pd.Series({"Other": other})])
+        display_data = collapse_top_n(data, options.top_n)
 
         # 차트 생성
         fig, ax = plt.subplots(figsize=options.figsize)
@@ -1,11 +1,13 @@
 """서술형 응답 리스트 렌더러"""
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import pandas as pd
-import matplotlib.pyplot as plt
 
 from ..base import ChartRenderer, ChartOptions
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 
 class TextListRenderer(ChartRenderer):
     """서술형 응답 리스트 렌더러 (차트 없음)"""
@@ -14,7 +16,7 @@ class TextListRenderer(ChartRenderer):
         self,
         data: pd.Series,
         options: ChartOptions
-    ) -> Tuple[Optional[plt.Figure], pd.Series]:
+    ) -> Tuple[Optional["Figure"], pd.Series]:
         # 서술형은 차트가 없으므로 None 반환
         # data는 원본 시리즈 그대로 반환
         return None, data
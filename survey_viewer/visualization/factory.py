@@ -2,6 +2,8 @@
 from typing import Dict
 
 from .base import ChartRenderer
+from .charts.altair_chart import AltairChartRenderer
+from .charts.heatmap import HeatmapRenderer
 from .charts.pie_chart import PieChartRenderer
 from .charts.text_list import TextListRenderer
 from ..analysis.detectors import QuestionType
@@ -35,4 +37,7 @@ def create_default_factory() -> ChartFactory:
     factory = ChartFactory()
     factory.register("pie", PieChartRenderer())
     factory.register("text", TextListRenderer())
+    factory.register("heatmap", HeatmapRenderer())
+    factory.register("altair_bar", AltairChartRenderer("bar"))
+    factory.register("altair_donut", AltairChartRenderer("donut"))
     return factory
@@ -0,0 +1,102 @@
+"""차트 이미지 캐시 - 렌더링된 PNG/SVG 바이트를 LRU로 보관"""
+import dataclasses
+import hashlib
+import io
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from .base import ChartRenderer, ChartOptions
+from ..config.constants import CHART_IMAGE_CACHE_MAX_BYTES
+from ..data.cache import LRUCache
+from ..utils import process_singleton
+
+
+IMAGE_FORMATS = ("png", "svg")
+
+
+def figure_to_bytes(fig: plt.Figure, image_format: str = "png") -> bytes:
+    """Figure를 이미지 바이트로 변환 후 닫음 (st.pyplot과 같은 저장 옵션)"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=image_format, bbox_inches="tight", dpi=200)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def chart_cache_key(
+    data: pd.Series,
+    options: ChartOptions,
+    chart_type: str,
+    image_format: str
+) -> str:
+    """집계 결과 + 차트 옵션 + 렌더러 유형으로 캐시 키 생성"""
+    h = hashlib.sha256()
+    h.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    if isinstance(data, pd.DataFrame):
+        # 행 해시에는 컬럼명이 포함되지 않으므로 별도로 반영 (분할표 등)
+        h.update(repr(list(data.columns)).encode("utf-8"))
+    h.update(repr(dataclasses.astuple(options)).encode("utf-8"))
+    h.update(f"{chart_type}:{image_format}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _entry_nbytes(entry: Tuple[Optional[bytes], pd.Series]) -> int:
+    image, display_data = entry
+    return len(image or b"") + int(np.sum(display_data.memory_usage(deep=True)))
+
+
+class CachedChartRenderer:
+    """ChartRenderer 결과를 이미지 바이트로 캐시하는 래퍼
+
+    같은 집계 결과와 옵션이면 matplotlib을 다시 호출하지 않고
+    저장된 이미지를 반환한다.
+    """
+
+    def __init__(
+        self,
+        renderer: ChartRenderer,
+        cache: Optional[LRUCache] = None,
+        image_format: str = "png"
+    ):
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format: {image_format}")
+
+        self.renderer = renderer
+        self.cache = cache if cache is not None else get_chart_image_cache()
+        self.image_format = image_format
+
+    def render_image(
+        self,
+        data: pd.Series,
+        options: ChartOptions
+    ) -> Tuple[Optional[bytes], pd.Series]:
+        """
+        차트 이미지 렌더링 (캐시 우선)
+
+        Returns:
+            (이미지 바이트 또는 None, 표시용 데이터)
+        """
+        key = chart_cache_key(
+            data, options, self.renderer.get_chart_type(), self.image_format
+        )
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+
+        fig, display_data = self.renderer.render(data, options)
+        image = figure_to_bytes(fig, self.image_format) if fig is not None else None
+
+        entry = (image, display_data)
+        self.cache.put(key, entry)
+        return entry
+
+    def get_chart_type(self) -> str:
+        return self.renderer.get_chart_type()
+
+
+@process_singleton
+def get_chart_image_cache() -> LRUCache:
+    """프로세스 전역 차트 이미지 캐시 반환 (Streamlit 재실행 간 유지)"""
+    return LRUCache(CHART_IMAGE_CACHE_MAX_BYTES, _entry_nbytes)
@@ -0,0 +1,198 @@
+"""병렬 차트 렌더링 - 프로세스 풀에서 matplotlib 차트를 이미지로 변환"""
+import multiprocessing
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .base import ChartRenderer, ChartOptions
+from .image_cache import chart_cache_key, figure_to_bytes, get_chart_image_cache
+from ..config.constants import CHART_RENDER_WORKERS
+from ..data.cache import LRUCache
+from ..profiling import current_profiler, profile_stage
+
+if TYPE_CHECKING:
+    from .warmup import ChartWarmup
+
+
+# 캐시 미스가 이 개수 이하이면 프로세스 풀 없이 현재 프로세스에서 렌더링
+MIN_PARALLEL_JOBS = 3
+
+
+def init_render_worker() -> None:
+    """워커 프로세스 초기화 (Agg 백엔드 + 한글 폰트)"""
+    import matplotlib
+    matplotlib.use("Agg")
+
+    from ..config.settings import configure_matplotlib
+    configure_matplotlib()
+
+
+def render_chart_job(
+    renderer: ChartRenderer,
+    data: pd.Series,
+    options: ChartOptions,
+    image_format: str
+) -> Tuple[Optional[bytes], pd.Series]:
+    """차트 하나를 렌더링해 이미지 바이트로 반환 (워커에서 실행)"""
+    fig, display_data = renderer.render(data, options)
+    image = figure_to_bytes(fig, image_format) if fig is not None else None
+    return image, display_data
+
+
+def timed_render_chart_job(
+    renderer: ChartRenderer,
+    data: pd.Series,
+    options: ChartOptions,
+    image_format: str
+) -> Tuple[Tuple[Optional[bytes], pd.Series], float, float]:
+    """render_chart_job + 워커에서 측정한 (경과 시간, CPU 시간)"""
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    entry = render_chart_job(renderer, data, options, image_format)
+    return entry, time.perf_counter() - wall, time.process_time() - cpu
+
+
+class ParallelChartRenderer:
+    """여러 차트를 프로세스 풀로 렌더링하고 완료 순서대로 반환
+
+    이미지 캐시에 있는 차트는 바로 반환하고, 나머지만 워커로 보낸다.
+    warmup이 주어지면 미리 렌더링 중인 차트는 다시 보내지 않고 그 결과를 기다린다.
+    워커가 비정상 종료되어 풀이 깨지면 풀을 버리고 남은 차트는 현재 프로세스에서 렌더링한다.
+    """
+
+    def __init__(
+        self,
+        renderer: ChartRenderer,
+        max_workers: int = CHART_RENDER_WORKERS,
+        cache: Optional[LRUCache] = None,
+        image_format: str = "png",
+        warmup: Optional["ChartWarmup"] = None
+    ):
+        self.renderer = renderer
+        self.max_workers = max_workers
+        self.cache = cache if cache is not None else get_chart_image_cache()
+        self.image_format = image_format
+        self.warmup = warmup
+
+    def render_images(
+        self,
+        jobs: List[pd.Series],
+        options: ChartOptions,
+        labels: Optional[List[str]] = None
+    ) -> Iterator[Tuple[int, Optional[bytes], pd.Series]]:
+        """
+        집계 결과 목록을 렌더링
+
+        Args:
+            jobs: 집계 결과 목록
+            options: 차트 옵션
+            labels: 프로파일링 기록용 문항 이름 (jobs와 같은 순서)
+
+        Returns:
+            (jobs 내 위치, 이미지 바이트 또는 None, 표시용 데이터)를 완료 순서대로 반환
+        """
+        chart_type = self.renderer.get_chart_type()
+        misses = []
+        warming: Dict[Future, Tuple[int, str, pd.Series]] = {}
+        for i, data in enumerate(jobs):
+            key = chart_cache_key(data, options, chart_type, self.image_format)
+            entry = self.cache.get(key)
+            if entry is not None:
+                yield (i, *entry)
+                continue
+            future = self.warmup.take(key) if self.warmup is not None else None
+            if future is not None:
+                warming[future] = (i, key, data)
+            else:
+                misses.append((i, key, data))
+
+        futures: Dict[Future, Tuple[int, str, pd.Series]] = {}
+        pool = None
+        if self.max_workers > 1 and len(misses) >= MIN_PARALLEL_JOBS:
+            pool = get_render_pool(self.max_workers)
+            try:
+                for i, key, data in misses:
+                    future = pool.submit(
+                        timed_render_chart_job, self.renderer, data, options, self.image_format
+                    )
+                    futures[future] = (i, key, data)
+                misses = []
+            except BrokenProcessPool:
+                discard_render_pool(pool)
+                submitted = {i for i, _, _ in futures.values()}
+                misses = [job for job in misses if job[0] not in submitted]
+
+        for i, key, data in misses:
+            yield (i, *self._render_local(data, key, options, labels[i] if labels else None))
+
+        profiler = current_profiler()
+        for future in as_completed([*futures, *warming]):
+            i, key, data = futures[future] if future in futures else warming[future]
+            try:
+                result = future.result()
+            except (BrokenProcessPool, CancelledError) as e:
+                if isinstance(e, BrokenProcessPool):
+                    discard_render_pool(pool)
+                yield (i, *self._render_local(data, key, options, labels[i] if labels else None))
+                continue
+
+            if future in warming:
+                yield (i, *result)
+                continue
+            entry, wall, cpu = result
+            if profiler is not None:
+                label = labels[i] if labels else None
+                profiler.add("render_question", wall, cpu, question=label, rows=len(data))
+            self.cache.put(key, entry)
+            yield (i, *entry)
+
+    def _render_local(
+        self,
+        data: pd.Series,
+        key: str,
+        options: ChartOptions,
+        label: Optional[str]
+    ) -> Tuple[Optional[bytes], pd.Series]:
+        """현재 프로세스에서 렌더링하고 캐시에 저장"""
+        with profile_stage("render_question", question=label, rows=len(data)):
+            entry = render_chart_job(self.renderer, data, options, self.image_format)
+        self.cache.put(key, entry)
+        return entry
+
+
+# 워커 수별 렌더링 풀 (다른 세션/미리 렌더링이 같은 풀을 공유)
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pool_lock = threading.Lock()
+
+
+def get_render_pool(max_workers: int = CHART_RENDER_WORKERS) -> ProcessPoolExecutor:
+    """프로세스 전역 렌더링 풀 반환 (Streamlit 재실행 간 유지)
+
+    Streamlit 서버는 멀티스레드이므로 fork 대신 spawn으로 워커를 띄운다.
+    워커 수마다 풀을 따로 두므로 다른 크기를 요청해도 사용 중인 풀의 작업은 취소되지 않는다.
+    """
+    with _pool_lock:
+        pool = _pools.get(max_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_render_worker,
+            )
+            _pools[max_workers] = pool
+        return pool
+
+
+def discard_render_pool(pool: Optional[ProcessPoolExecutor]) -> None:
+    """깨진 풀(BrokenProcessPool)을 버림 (다음 get_render_pool 호출이 새 풀을 만듦)"""
+    if pool is None:
+        return
+    with _pool_lock:
+        for max_workers, current in list(_pools.items()):
+            if current is pool:
+                del _pools[max_workers]
+    pool.shutdown(wait=False)
@@ -0,0 +1,254 @@
+"""차트 미리 렌더링 - 재실행과 무관하게 백그라운드에서 문항 차트를 이미지 캐시에 채움
+
+디스패처 스레드 하나가 우선순위 큐에서 작업을 꺼내 렌더링 풀(spawn 프로세스)로
+보낸다. 동시에 보내는 작업 수를 풀 워커 수로 제한하므로, 사용자가 다른 페이지로
+이동해 우선순위가 바뀌면 아직 보내지 않은 작업의 순서가 그대로 반영된다.
+워커 수가 1 이하(순차 렌더링)이면 화면 렌더링과 CPU를 다투지 않도록 예약하지 않는다.
+matplotlib은 스레드 안전하지 않으므로 이 스레드에서는 직접 렌더링하지 않는다.
+
+작업은 요청한 세션(WarmupRequester)의 세대별로 관리한다. 세션이 다시 실행되어
+새 세대를 시작하면 이전 세대에만 요청되고 아직 보내지 않은 작업은 버려지며,
+세션이 끝나 요청자가 수거되면 그 세션의 작업도 함께 버려진다.
+"""
+import heapq
+import itertools
+import threading
+import weakref
+from concurrent.futures import CancelledError, Future
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .base import ChartRenderer, ChartOptions
+from .image_cache import chart_cache_key, get_chart_image_cache
+from .parallel import discard_render_pool, get_render_pool, render_chart_job
+from ..config.constants import CHART_RENDER_WORKERS
+from ..data.cache import LRUCache
+from ..utils import process_singleton
+
+
+# 렌더링에 실패한 차트 키를 기억할 개수 (다시 예약하지 않고 진행률에서 완료로 취급)
+FAILED_KEYS_LIMIT = 1024
+
+
+class WarmupRequester:
+    """미리 렌더링 요청자 (세션마다 하나, 세션 상태에 보관)
+
+    ChartWarmup.begin을 호출할 때마다 세대가 바뀐다.
+    """
+
+    def __init__(self):
+        self.generation = 0
+
+
+# requester 없이 예약한 작업의 요청자 (세대가 바뀌지 않음)
+_ANONYMOUS = WarmupRequester()
+
+
+@dataclass
+class _WarmupTask:
+    key: str
+    renderer: ChartRenderer
+    data: pd.Series
+    options: ChartOptions
+    image_format: str
+    priority: int
+    future: Future
+    dispatched: bool = False
+    # 요청자 → (요청한 세대, 순위)
+    requests: "weakref.WeakKeyDictionary[WarmupRequester, Tuple[int, int]]" = field(
+        default_factory=weakref.WeakKeyDictionary
+    )
+
+    def live_priority(self) -> Optional[int]:
+        """현재 세대 요청 중 가장 높은 순위 (모두 지난 세대이거나 수거되었으면 None)"""
+        ranks = [
+            rank for requester, (generation, rank) in list(self.requests.items())
+            if generation == requester.generation
+        ]
+        return min(ranks) if ranks else None
+
+
+class ChartWarmup:
+    """우선순위 기반 차트 미리 렌더링 작업 관리자 (프로세스 전역)"""
+
+    def __init__(
+        self,
+        max_workers: int = CHART_RENDER_WORKERS,
+        cache: Optional[LRUCache] = None
+    ):
+        self.max_workers = max_workers
+        self.cache = cache if cache is not None else get_chart_image_cache()
+        self._tasks: Dict[str, _WarmupTask] = {}
+        self._failed = LRUCache(FAILED_KEYS_LIMIT, lambda _: 1)
+        self._heap: List[Tuple[int, int, str]] = []
+        self._seq = itertools.count()
+        self._running = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        """미리 렌더링 사용 여부 (렌더링 풀을 쓸 때만)"""
+        return self.max_workers > 1
+
+    def begin(self, requester: WarmupRequester) -> None:
+        """요청자의 새 세대 시작 (이전 세대에만 요청된 대기 작업은 버려짐)"""
+        with self._condition:
+            requester.generation += 1
+
+    def schedule(
+        self,
+        renderer: ChartRenderer,
+        jobs: Sequence[pd.Series],
+        options: ChartOptions,
+        priority: int = 0,
+        image_format: str = "png",
+        requester: Optional[WarmupRequester] = None
+    ) -> List[str]:
+        """jobs 순서대로 미리 렌더링 예약 (이미 캐시/예약된 차트는 우선순위만 갱신)
+
+        앞선 작업일수록, priority가 작을수록 먼저 렌더링된다. 여러 요청자가 같은
+        차트를 요청하면 가장 높은 순위를 따른다. 렌더링에 실패한 차트는 다시
+        예약하지 않는다.
+
+        Returns:
+            jobs와 같은 순서의 이미지 캐시 키 (진행률 확인용, 사용하지 않으면 빈 리스트)
+        """
+        if not self.enabled:
+            return []
+
+        requester = requester or _ANONYMOUS
+        chart_type = renderer.get_chart_type()
+        keys = []
+        with self._condition:
+            for i, data in enumerate(jobs):
+                key = chart_cache_key(data, options, chart_type, image_format)
+                keys.append(key)
+                if key in self.cache or key in self._failed:
+                    continue
+
+                rank = priority + i
+                task = self._tasks.get(key)
+                if task is None:
+                    task = _WarmupTask(key, renderer, data, options, image_format, rank, Future())
+                    self._tasks[key] = task
+                    task.requests[requester] = (requester.generation, rank)
+                    heapq.heappush(self._heap, (rank, next(self._seq), key))
+                    continue
+
+                task.requests[requester] = (requester.generation, rank)
+                live = task.live_priority()
+                if task.dispatched or live == task.priority:
+                    continue
+                task.priority = live
+                heapq.heappush(self._heap, (live, next(self._seq), key))
+
+            self._ensure_thread()
+            self._condition.notify_all()
+        return keys
+
+    def take(self, key: str) -> Optional[Future]:
+        """요청한 차트의 진행 중 작업 반환
+
+        이미 렌더링 풀로 보낸 작업이면 그 Future를 반환하고, 아직 대기 중이면
+        예약을 취소하고 None을 반환한다 (호출한 쪽에서 바로 렌더링).
+        """
+        with self._condition:
+            task = self._tasks.get(key)
+            if task is None:
+                return None
+            if task.dispatched:
+                return task.future
+            del self._tasks[key]
+            return None
+
+    def progress(self, keys: Sequence[str]) -> Tuple[int, int]:
+        """(끝난 차트 수, 전체 수) - 렌더링에 실패한 차트도 끝난 것으로 셈"""
+        return sum(key in self.cache or key in self._failed for key in keys), len(keys)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._dispatch, name="chart-warmup", daemon=True
+            )
+            self._thread.start()
+
+    def _next_task(self) -> _WarmupTask:
+        """다음으로 보낼 작업 (빈 슬롯과 대기 작업이 생길 때까지 대기)"""
+        with self._condition:
+            while True:
+                while self._heap and self._running < self.max_workers:
+                    rank, _, key = heapq.heappop(self._heap)
+                    task = self._tasks.get(key)
+                    # 이미 보낸/취소된 작업이거나 우선순위가 바뀌기 전 항목은 건너뜀
+                    if task is None or task.dispatched or task.priority != rank:
+                        continue
+                    live = task.live_priority()
+                    if live is None:
+                        # 모든 요청이 지난 세대 (아직 보내지 않았으므로 기다리는 쪽 없음)
+                        del self._tasks[key]
+                        continue
+                    if live != rank:
+                        # 다른 요청자의 세대가 바뀌어 순위가 내려간 작업은 새 순위로 다시 넣음
+                        task.priority = live
+                        heapq.heappush(self._heap, (live, next(self._seq), key))
+                        continue
+                    task.dispatched = True
+                    self._running += 1
+                    return task
+                self._condition.wait()
+
+    def _dispatch(self) -> None:
+        while True:
+            task = self._next_task()
+            pool = get_render_pool(self.max_workers)
+            try:
+                pool_future = pool.submit(
+                    render_chart_job, task.renderer, task.data, task.options, task.image_format
+                )
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    discard_render_pool(pool)
+                self._finish(task, error=e)
+                continue
+            pool_future.add_done_callback(lambda f, task=task, pool=pool: self._on_done(task, f, pool))
+
+    def _on_done(self, task: _WarmupTask, pool_future: Future, pool) -> None:
+        error = entry = None
+        try:
+            if pool_future.cancelled():
+                error = CancelledError()
+            else:
+                error = pool_future.exception()
+            if isinstance(error, BrokenProcessPool):
+                # 다음 작업부터 새 풀 사용 (기다리던 화면 렌더링은 현재 프로세스에서 다시 렌더링)
+                discard_render_pool(pool)
+            if error is None:
+                entry = pool_future.result()
+                self.cache.put(task.key, entry)
+        except Exception as e:
+            error = e
+        finally:
+            self._finish(task, error=error, entry=entry)
+
+    def _finish(self, task: _WarmupTask, error=None, entry=None) -> None:
+        with self._condition:
+            self._running -= 1
+            self._tasks.pop(task.key, None)
+            # 실패한 차트는 다시 예약하지 않음 (화면에 필요하면 그때 현재 프로세스에서 렌더링)
+            if error is not None:
+                self._failed.put(task.key, True)
+            self._condition.notify_all()
+        if error is not None:
+            task.future.set_exception(error)
+        else:
+            task.future.set_result(entry)
+
+
+@process_singleton
+def get_chart_warmup() -> ChartWarmup:
+    """프로세스 전역 차트 미리 렌더링 관리자 반환 (모든 세션이 공유)"""
+    return ChartWarmup()
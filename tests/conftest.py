@@ -0,0 +1,30 @@
+"""테스트 공통 설정 - 저장소 루트를 import 경로에 추가 (benchmarks와 같은 방식)"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from survey_viewer.config.constants import DATE_COL, PARTICIPANT_COL  # noqa: E402
+
+
+@pytest.fixture
+def survey_question() -> str:
+    """make_survey가 만드는 객관식 문항 컬럼"""
+    return "Q1. 만족도는?"
+
+
+@pytest.fixture
+def make_survey(survey_question):
+    """응답일시/참여자 + 객관식 문항 하나(좋음/나쁨/보통 반복)인 설문 DataFrame 생성 함수"""
+    def make(n: int = 40) -> pd.DataFrame:
+        answers = ["좋음", "나쁨", "보통"]
+        return pd.DataFrame({
+            DATE_COL: pd.date_range("2025-01-01", periods=n, freq="min"),
+            PARTICIPANT_COL: [f"user{i}" for i in range(n)],
+            survey_question: [answers[i % 3] for i in range(n)],
+        })
+    return make
@@ -0,0 +1,105 @@
+"""집계기 테스트 - 벡터화된 복수 선택 집계와 기존 행 단위 구현의 동등성"""
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey_viewer.analysis.aggregators import PIPE_SPLIT, MultiSelectAggregator
+from survey_viewer.analysis.encoding import encode_choice_column
+
+
+def split_pipe_reference(value) -> list:
+    """벡터화 이전 MultiSelectAggregator._split_pipe"""
+    if value is None:
+        return []
+
+    s = str(value).strip()
+    if s == "" or s.lower() == "nan" or s == ".":
+        return []
+
+    return [x.strip() for x in re.split(PIPE_SPLIT, s) if x and x.strip()]
+
+
+def aggregate_reference(series: pd.Series, include_blank: bool) -> pd.Series:
+    """벡터화 이전 MultiSelectAggregator.aggregate (행마다 분리하는 루프)"""
+    tokens = []
+    for v in series.tolist():
+        parts = split_pipe_reference(v)
+        if not parts and include_blank:
+            tokens.append("Blank")
+        else:
+            tokens.extend(parts)
+
+    if not tokens:
+        return pd.Series(dtype=int)
+    return pd.Series(tokens).value_counts()
+
+
+def assert_same_counts(actual: pd.Series, expected: pd.Series) -> None:
+    """라벨 순서(동률 순서 포함)와 빈도가 같은지 확인"""
+    assert list(actual.index) == list(expected.index)
+    assert list(actual.to_numpy()) == list(expected.to_numpy())
+
+
+EDGE_VALUES = [
+    None, np.nan, "", "   ", "nan", "NaN", " NAN ", ".", " . ",
+    "A", " A ", "A|B", "A | B", "A  |B", " B|A ", "A|A", "A||B", "|A|", "A|.|B",
+    "C", "B|C|A", "D | D | D",
+]
+
+
+@pytest.mark.parametrize("include_blank", [False, True])
+@pytest.mark.parametrize("encoded", [False, True])
+def test_edge_cases_match_reference(include_blank, encoded):
+    series = pd.Series(EDGE_VALUES * 3, dtype=object)
+    expected = aggregate_reference(series, include_blank)
+    if encoded:
+        series = encode_choice_column(series)
+
+    assert_same_counts(MultiSelectAggregator().aggregate(series, include_blank), expected)
+
+
+@pytest.mark.parametrize("include_blank", [False, True])
+def test_ties_keep_first_seen_order(include_blank):
+    # 모두 같은 빈도 - 처음 나온 순서를 유지해야 함
+    series = pd.Series(["C|A", "B", None, "A|C", "B", ".", "D"], dtype=object)
+    expected = aggregate_reference(series, include_blank)
+
+    assert_same_counts(MultiSelectAggregator().aggregate(series, include_blank), expected)
+
+
+@pytest.mark.parametrize("include_blank", [False, True])
+def test_only_blank_answers(include_blank):
+    series = pd.Series([None, "", ".", "nan"], dtype=object)
+    expected = aggregate_reference(series, include_blank)
+    actual = MultiSelectAggregator().aggregate(series, include_blank)
+
+    assert actual.empty == expected.empty
+    assert_same_counts(actual, expected)
+
+
+def test_randomized_against_reference():
+    rng = np.random.default_rng(4)
+    pieces = ["A", "B", "C", "D", " E ", "가나", "", ".", "nan", " "]
+    for case in range(400):
+        rows = []
+        for _ in range(int(rng.integers(0, 30))):
+            roll = rng.random()
+            if roll < 0.1:
+                rows.append(None)
+            elif roll < 0.15:
+                rows.append(np.nan)
+            else:
+                parts = rng.choice(pieces, size=int(rng.integers(1, 4)))
+                sep = rng.choice(["|", " | ", "|  ", " |"])
+                rows.append(sep.join(parts))
+        series = pd.Series(rows, dtype=object)
+        include_blank = bool(case % 2)
+
+        expected = aggregate_reference(series, include_blank)
+        assert_same_counts(MultiSelectAggregator().aggregate(series, include_blank), expected)
+        assert_same_counts(
+            MultiSelectAggregator().aggregate(encode_choice_column(series), include_blank),
+            expected,
+        )
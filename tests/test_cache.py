@@ -0,0 +1,35 @@
+"""LRU 캐시와 파일 내용 해시 테스트"""
+import io
+import tempfile
+
+from survey_viewer.data.cache import LRUCache, compute_content_hash
+
+
+def test_lru_cache_evicts_oldest_over_budget():
+    cache = LRUCache(3, lambda _: 1)
+    for key in "abc":
+        cache.put(key, key)
+    cache.get("a")
+    cache.put("d", "d")
+
+    assert "b" not in cache
+    assert [key for key in "acd" if key in cache] == ["a", "c", "d"]
+    assert cache.total_size == 3
+
+
+def test_lru_cache_skips_item_larger_than_budget():
+    cache = LRUCache(2, len)
+    cache.put("big", "xyz")
+
+    assert "big" not in cache
+    assert cache.total_size == 0
+
+
+def test_content_hash_reads_whole_stream_and_restores_position():
+    data = b"survey export bytes"
+    with tempfile.TemporaryFile() as file:
+        file.write(data)
+        file.seek(5)
+
+        assert compute_content_hash(file) == compute_content_hash(io.BytesIO(data))
+        assert file.tell() == 5
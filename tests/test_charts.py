@@ -0,0 +1,25 @@
+"""차트 데이터 정리 테스트 - 상위 N개 + Other 합치기"""
+import pandas as pd
+
+from survey_viewer.visualization.base import collapse_top_n
+from survey_viewer.visualization.charts.heatmap import collapse_table_top_n
+
+
+def test_collapse_top_n_series():
+    data = pd.Series({"A": 5, "B": 3, "C": 2, "D": 1})
+    collapsed = collapse_top_n(data, 2)
+
+    assert collapsed.to_dict() == {"A": 5, "B": 3, "Other": 3}
+    assert collapse_top_n(data, 4).equals(data)
+
+
+def test_collapse_table_top_n_rows_and_columns():
+    table = pd.DataFrame(
+        [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+        index=["r1", "r2", "r3"], columns=["c1", "c2", "c3"],
+    )
+    collapsed = collapse_table_top_n(table, 2)
+
+    assert list(collapsed.index) == ["r1", "r2", "Other"]
+    assert list(collapsed.columns) == ["c1", "c2", "Other"]
+    assert collapsed.to_numpy().sum() == table.to_numpy().sum()
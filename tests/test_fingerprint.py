@@ -0,0 +1,66 @@
+"""데이터셋 지문 테스트 - 파생 DataFrame이 원본의 캐시 항목을 재사용하지 않는지"""
+import gc
+
+from survey_viewer.analysis.aggregate_store import AggregateStore
+from survey_viewer.analysis.incremental import IncrementalAggregator
+from survey_viewer.data.fingerprint import (
+    derive_fingerprint, get_fingerprint, propagate_fingerprint, set_fingerprint
+)
+from survey_viewer.data.question_parser import QuestionParser
+
+
+def test_derived_frames_do_not_inherit_fingerprint(make_survey, survey_question):
+    df = set_fingerprint(make_survey(), derive_fingerprint("file", "sheet"))
+    fingerprint = get_fingerprint(df)
+
+    assert get_fingerprint(df[df[survey_question] == "좋음"]) != fingerprint
+    assert get_fingerprint(df.iloc[:30]) != fingerprint
+    assert get_fingerprint(df.assign(extra=1)) != fingerprint
+    # 내용이 같은 복사본은 내용 해시로 다시 계산되며 같은 내용끼리는 같은 지문
+    assert get_fingerprint(df.copy()) == get_fingerprint(make_survey())
+
+
+def test_copied_fingerprint_stays_invalid_after_source_is_collected(make_survey):
+    df = set_fingerprint(make_survey(), "parent")
+    derived = df.iloc[:10]
+    del df
+    gc.collect()
+
+    # 원본이 수거되어도 복사된 소유 토큰은 다른 객체의 것으로 취급
+    assert get_fingerprint(derived) != "parent"
+    assert get_fingerprint(derived) == get_fingerprint(make_survey().iloc[:10])
+
+
+def test_propagate_ignores_inherited_fingerprint(make_survey):
+    df = set_fingerprint(make_survey(), "parent")
+    derived = df.iloc[:10]
+    result = propagate_fingerprint(derived, derived.copy(), "step")
+
+    assert get_fingerprint(result) != derive_fingerprint("parent", "step")
+    assert get_fingerprint(propagate_fingerprint(df, df.copy(), "step")) == (
+        derive_fingerprint("parent", "step")
+    )
+
+
+def test_aggregate_store_does_not_reuse_parent_entry(make_survey, survey_question):
+    df = set_fingerprint(make_survey(), "parent")
+    questions = QuestionParser().parse(df)
+    store = AggregateStore()
+
+    full = store.build(df, questions).get_counts(survey_question, False)
+    filtered = store.build(df[df[survey_question] == "좋음"], questions).get_counts(survey_question, False)
+
+    assert full.to_dict() == {"좋음": 14, "나쁨": 13, "보통": 13}
+    assert filtered.to_dict() == {"좋음": 14}
+
+
+def test_incremental_update_sees_removed_rows_of_derived_frame(make_survey, survey_question):
+    df = set_fingerprint(make_survey(), "parent")
+    questions = QuestionParser().parse(df)
+    aggregator = IncrementalAggregator(state_dir=None)
+    aggregator.update(df, questions)
+
+    aggregates, report = aggregator.update(df.iloc[:30].copy(), questions)
+
+    assert report.removed == 10
+    assert aggregates.get_counts(survey_question, False).sum() == 30
@@ -0,0 +1,81 @@
+"""증분 집계 테스트 - 재업로드 변경 내역의 응답별 증감"""
+import pandas as pd
+
+from survey_viewer.analysis.detectors import QuestionType
+from survey_viewer.analysis.incremental import (
+    IncrementalAggregator, IncrementalSession, ProfileStats, count_delta
+)
+from survey_viewer.data.question_parser import QuestionParser
+
+
+def reupload(before: pd.DataFrame, after: pd.DataFrame):
+    questions = QuestionParser().parse(before)
+    aggregator = IncrementalAggregator(state_dir=None)
+    aggregator.update(before, questions)
+    return aggregator.update(after, questions)
+
+
+def test_count_delta_keeps_negative_entries():
+    added = pd.Series({"A": 2, "B": 1})
+    removed = pd.Series({"B": 1, "C": 3})
+
+    assert count_delta(added, removed).to_dict() == {"A": 2, "C": -3}
+    assert count_delta(None, removed).to_dict() == {"B": -1, "C": -3}
+    assert count_delta(added, None).to_dict() == {"A": 2, "B": 1}
+    assert count_delta(None, pd.Series(dtype="int64")) is None
+
+
+def test_removal_only_upload_reports_negative_deltas(make_survey, survey_question):
+    df = make_survey()
+    aggregates, report = reupload(df, df.iloc[:30].copy())
+
+    assert (report.removed, report.added, report.changed) == (10, 0, 0)
+    assert report.count_deltas[survey_question].to_dict() == {"나쁨": -3, "보통": -3, "좋음": -4}
+    assert aggregates.get_counts(survey_question, False).sum() == 30
+
+
+def test_answer_changed_to_blank_reports_delta(make_survey, survey_question):
+    df = make_survey()
+    after = df.copy()
+    after.loc[0, survey_question] = None
+    aggregates, report = reupload(df, after)
+
+    assert report.changed == 1
+    assert report.count_deltas[survey_question].to_dict() == {"좋음": -1}
+    assert aggregates.get_counts(survey_question, True)["Blank"] == 1
+
+
+def test_sessions_keep_separate_state(make_survey):
+    df = make_survey()
+    questions = QuestionParser().parse(df)
+    aggregator = IncrementalAggregator(state_dir=None)
+    first, second = IncrementalSession(aggregator), IncrementalSession(aggregator)
+
+    first.update(df, questions)
+    _, report = second.update(df.iloc[:30].copy(), questions)
+    assert report.full_rebuild
+
+    _, report = first.update(df.iloc[:30].copy(), questions)
+    assert (report.full_rebuild, report.removed) == (False, 10)
+
+    first.close()
+    assert first.survey_id not in aggregator._states
+    assert second.survey_id in aggregator._states
+
+
+def test_text_answers_are_not_retained(make_survey):
+    text_col = "Q2. 의견을 자유롭게 적어 주세요"
+    df = make_survey()
+    df[text_col] = [f"의견 {i} " + "자세한 설명" * 10 if i % 4 else None for i in range(len(df))]
+    questions = QuestionParser().parse(df)
+    aggregator = IncrementalAggregator(state_dir=None)
+    aggregator.update(df, questions)
+
+    after = df.iloc[5:].copy()
+    after.iloc[0, after.columns.get_loc(text_col)] = "짧은|의견"
+    aggregator.update(after, questions)
+
+    state = next(iter(aggregator._states.values()))
+    assert text_col not in state.rows.columns
+    assert state.column_states[text_col].question_type == QuestionType.TEXT
+    assert state.column_states[text_col].stats == ProfileStats.from_series(after[text_col])
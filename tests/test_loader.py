@@ -0,0 +1,68 @@
+"""스트리밍 Excel 로더 테스트 (pd.read_excel과 같은 결과인지 확인)"""
+import datetime
+import io
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from survey_viewer.analysis.dataset import build_dataset
+from survey_viewer.config.constants import CONTACT_COL, EXCLUDE_CONTACT_KEYWORDS
+from survey_viewer.data.loader import ChunkedExcelDataLoader, ExcelDataLoader, concat_chunks
+
+HEADER = ["응답일시", "Q1", None, "Q1", "Q2", "점수", CONTACT_COL, None]
+ROWS = [
+    [datetime.datetime(2025, 1, 1, 9), "좋음", "메모", "예", None, 3, "a@b.c", "x"],
+    [datetime.datetime(2025, 1, 1, 10), "나쁨", None, "아니오", None, 5, EXCLUDE_CONTACT_KEYWORDS[0], None],
+    [None] * 8,
+    [datetime.datetime(2025, 1, 1, 11), "보통", None, "예", "A|B", 4, None, None],
+    [datetime.datetime(2025, 1, 1, 12), "좋음", None, None, "B", 1, "c@d.e", 7],
+    [None] * 8,
+    [None] * 8,
+]
+
+
+@pytest.fixture(scope="module")
+def workbook() -> bytes:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "응답"
+    ws.append(HEADER)
+    for row in ROWS:
+        ws.append(row)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_iter_chunks_matches_read_excel(workbook, chunk_size):
+    expected = pd.read_excel(io.BytesIO(workbook), sheet_name="응답")
+    loader = ChunkedExcelDataLoader(io.BytesIO(workbook))
+
+    chunks = list(loader.iter_chunks("응답", chunk_size=chunk_size))
+    pd.testing.assert_frame_equal(concat_chunks(chunks), expected)
+    # 헤더 없는 컬럼의 값과 중간의 빈 행 유지
+    assert "Unnamed: 7" in expected.columns
+    assert len(expected) == 5
+
+
+@pytest.mark.parametrize("chunk_size", [2, 100])
+def test_iter_chunks_projection_matches_read_excel(workbook, chunk_size):
+    columns = ["Q1.1", "점수", "Unnamed: 2"]
+    expected = pd.read_excel(io.BytesIO(workbook), sheet_name="응답")[columns]
+    loader = ChunkedExcelDataLoader(io.BytesIO(workbook))
+
+    chunks = list(loader.iter_chunks("응답", chunk_size=chunk_size, columns=columns))
+    pd.testing.assert_frame_equal(concat_chunks(chunks), expected)
+
+    with pytest.raises(ValueError):
+        next(loader.iter_chunks("응답", columns=["없는 문항"]))
+
+
+def test_streaming_dataset_matches_in_memory(workbook):
+    streamed = build_dataset(ChunkedExcelDataLoader(io.BytesIO(workbook), chunk_size=2), "응답")
+    loaded = build_dataset(ExcelDataLoader(io.BytesIO(workbook)), "응답")
+
+    pd.testing.assert_frame_equal(streamed.df, loaded.df)
+    assert [q.column_name for q in streamed.questions] == [q.column_name for q in loaded.questions]
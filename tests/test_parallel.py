@@ -0,0 +1,49 @@
+"""병렬 차트 렌더링 테스트 - 렌더링 풀이 깨지면 현재 프로세스에서 렌더링"""
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+import pytest
+
+from survey_viewer.data.cache import LRUCache
+from survey_viewer.visualization import parallel
+from survey_viewer.visualization.base import ChartOptions
+from survey_viewer.visualization.charts.pie_chart import PieChartRenderer
+from survey_viewer.visualization.parallel import ParallelChartRenderer, init_render_worker
+
+
+class BrokenPool:
+    """submit 또는 결과 대기 시 BrokenProcessPool을 내는 풀"""
+
+    def __init__(self, fail_on_submit: bool):
+        self.fail_on_submit = fail_on_submit
+        self.shutdown_called = False
+
+    def submit(self, fn, *args):
+        if self.fail_on_submit:
+            raise BrokenProcessPool("worker died")
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.shutdown_called = True
+
+
+@pytest.mark.parametrize("fail_on_submit", [True, False])
+def test_broken_pool_falls_back_to_in_process(monkeypatch, fail_on_submit):
+    init_render_worker()
+    pool = BrokenPool(fail_on_submit)
+    monkeypatch.setattr(parallel, "_pools", {4: pool})
+
+    jobs = [pd.Series({"A": i + 1, "B": 2}) for i in range(4)]
+    renderer = ParallelChartRenderer(
+        PieChartRenderer(), max_workers=4, cache=LRUCache(1 << 24, lambda _: 1)
+    )
+    results = list(renderer.render_images(jobs, ChartOptions()))
+
+    assert sorted(i for i, _, _ in results) == [0, 1, 2, 3]
+    assert all(image for _, image, _ in results)
+    # 깨진 풀은 버려지고 다음 요청에서 새로 만들어짐
+    assert pool.shutdown_called
+    assert 4 not in parallel._pools
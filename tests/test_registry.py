@@ -0,0 +1,48 @@
+"""데이터셋 레지스트리 테스트 - 반납 시 유휴 정리, 원본 시트는 레지스트리만 보관"""
+import io
+import time
+
+import pandas as pd
+
+from survey_viewer.analysis import dataset as dataset_module
+from survey_viewer.analysis.dataset import acquire_dataset
+from survey_viewer.data.cache import ParseCache
+from survey_viewer.data.loader import ExcelDataLoader
+from survey_viewer.data.registry import DatasetRegistry
+
+
+def test_release_evicts_idle_entries():
+    registry = DatasetRegistry(idle_seconds=0)
+    lease = registry.acquire("a", lambda: 1)
+    other = registry.acquire("b", lambda: 2)
+
+    lease.release()
+    assert "a" not in registry
+    assert "b" in registry
+
+    del other
+    assert len(registry) == 0
+
+
+def test_last_release_schedules_eviction():
+    registry = DatasetRegistry(idle_seconds=0.05)
+    registry.acquire("a", lambda: 1).release()
+    assert "a" in registry
+
+    deadline = time.monotonic() + 2
+    while "a" in registry and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert "a" not in registry
+
+
+def test_parse_cache_drops_sheet_once_dataset_is_registered(make_survey, monkeypatch):
+    buffer = io.BytesIO()
+    make_survey().to_excel(buffer, sheet_name="응답", index=False)
+    cache = ParseCache(cache_dir=None)
+    loader = ExcelDataLoader(io.BytesIO(buffer.getvalue()), cache=cache)
+    monkeypatch.setattr(dataset_module, "get_dataset_registry", lambda: DatasetRegistry())
+
+    lease = acquire_dataset(loader.content_hash, loader, "응답")
+
+    assert isinstance(lease.value.df, pd.DataFrame)
+    assert cache.get(loader.content_hash, "응답") is None
@@ -0,0 +1,50 @@
+"""헤드리스 리포트 테스트 - 실패한 시트가 있어도 나머지 시트는 처리"""
+import json
+
+import pandas as pd
+import pytest
+
+from survey_viewer.config.constants import DATE_COL, PARTICIPANT_COL
+from survey_viewer.report import __main__ as report_cli
+from survey_viewer.report.generator import ReportJob, generate_reports, plan_jobs
+from survey_viewer.visualization.base import ChartOptions
+
+
+@pytest.fixture(scope="module")
+def workbook(tmp_path_factory) -> str:
+    path = str(tmp_path_factory.mktemp("report") / "survey.xlsx")
+    df = pd.DataFrame({
+        DATE_COL: pd.date_range("2025-01-01", periods=4, freq="min"),
+        PARTICIPANT_COL: [f"user{i}" for i in range(4)],
+        "Q1. 만족도는?": ["좋음", "나쁨", "좋음", "보통"],
+    })
+    df.to_excel(path, sheet_name="1차", index=False)
+    return path
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_failed_sheet_does_not_abort_batch(workbook, tmp_path, max_workers):
+    jobs = plan_jobs([workbook], str(tmp_path))
+    jobs.append(ReportJob(workbook, "없는 시트", str(tmp_path / "missing")))
+
+    results = {r.job.sheet_name: r for r in generate_reports(jobs, ChartOptions(), max_workers)}
+
+    assert not results["1차"].failed
+    assert results["1차"].question_count == 1
+    assert results["없는 시트"].failed
+    assert "없는 시트" in results["없는 시트"].error
+
+
+def test_cli_records_failures_and_exits_non_zero(workbook, tmp_path, monkeypatch):
+    def plan_with_missing_sheet(workbooks, output_dir, sheet_names=None, streaming=False):
+        jobs = plan_jobs(workbooks, output_dir, sheet_names, streaming)
+        return jobs + [ReportJob(workbooks[0], "없는 시트", str(tmp_path / "missing"))]
+
+    monkeypatch.setattr(report_cli, "plan_jobs", plan_with_missing_sheet)
+    code = report_cli.main([workbook, "-o", str(tmp_path), "--workers", "1"])
+
+    with open(tmp_path / "timings.json", encoding="utf-8") as f:
+        timings = json.load(f)
+    assert code == 1
+    assert [s["sheet_name"] for s in timings["sheets"]] == ["1차"]
+    assert [s["sheet_name"] for s in timings["failed"]] == ["없는 시트"]
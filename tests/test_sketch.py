@@ -0,0 +1,143 @@
+"""상위 K 요약 테스트 - 오차 보장과 요청 시 정확 집계"""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey_viewer.analysis.aggregate_store import compute_aggregates
+from survey_viewer.analysis.aggregators import MultiSelectAggregator, SingleSelectAggregator
+from survey_viewer.analysis.dataset import build_dataset, build_dataset_from_frame
+from survey_viewer.analysis.sketch import (
+    TOP_K_DISTINCT_THRESHOLD, UNTRACKED_LABEL, TopKAggregator, TopKChunkAccumulator, TopKSketch
+)
+from survey_viewer.analysis.waves import COUNT_COL, compare_waves
+from survey_viewer.config.constants import DATE_COL, PARTICIPANT_COL
+from survey_viewer.data.loader import ChunkedExcelDataLoader
+from survey_viewer.data.question_parser import QuestionParser
+
+
+def heavy_tailed_answers(n: int, seed: int = 0) -> pd.Series:
+    """소수의 빈번한 보기 + 다수의 고유 기타 응답 + 무응답"""
+    rng = np.random.default_rng(seed)
+    base = np.array([f"보기{i}" for i in range(10)], dtype=object)
+    values = base[rng.zipf(1.5, n) % 10]
+    write_in = rng.random(n) < 0.3
+    values[write_in] = np.array(
+        [f"기타: {x}" for x in rng.integers(0, 6000, write_in.sum())], dtype=object
+    )
+    values[rng.random(n) < 0.05] = None
+    return pd.Series(values, dtype=object)
+
+
+def assert_bounds(sketch: TopKSketch, exact: pd.Series) -> None:
+    counts = sketch.to_counts()
+    assert sketch.total == exact.sum() == counts.sum()
+
+    tracked = counts.drop(UNTRACKED_LABEL, errors="ignore")
+    true = exact.reindex(tracked.index).fillna(0)
+    errors = sketch.errors.reindex(tracked.index)
+    assert ((tracked - errors <= true) & (true <= tracked)).all()
+    assert (exact.drop(tracked.index, errors="ignore") <= sketch.max_error).all()
+    assert sketch.max_error <= sketch.total / sketch.capacity
+
+
+@pytest.mark.parametrize("include_blank", [False, True])
+def test_chunked_sketch_error_bounds(include_blank):
+    series = heavy_tailed_answers(40_000)
+    exact = SingleSelectAggregator().aggregate(series, include_blank)
+    sketch = TopKAggregator(SingleSelectAggregator(), capacity=100, chunk_size=2_000).sketch_series(
+        series, include_blank
+    )
+
+    assert_bounds(sketch, exact)
+    assert list(sketch.to_counts().index[:5]) == list(exact.index[:5])
+
+
+def test_multi_select_sketch_total_is_exact():
+    rng = np.random.default_rng(1)
+    choices = np.array(list("ABCDEFGH"), dtype=object)
+    series = pd.Series([
+        " | ".join(rng.choice(choices, 2, replace=False)) if rng.random() > 0.1 else None
+        for _ in range(5_000)
+    ])
+    exact = MultiSelectAggregator().aggregate(series)
+    sketch = TopKAggregator(MultiSelectAggregator(), capacity=5, chunk_size=500).sketch_series(series)
+
+    assert_bounds(sketch, exact)
+
+
+def test_chunk_accumulator_matches_sketch_aggregator():
+    df = pd.DataFrame({"a": heavy_tailed_answers(20_000, seed=2)})
+    accumulator = TopKChunkAccumulator({"a": SingleSelectAggregator()}, capacity=50)
+    for start in range(0, len(df), 1_000):
+        accumulator.update(df.iloc[start:start + 1_000])
+
+    assert_bounds(accumulator.sketch("a"), SingleSelectAggregator().aggregate(df["a"]))
+
+
+def test_from_counts_is_exact_for_tracked_labels():
+    exact = SingleSelectAggregator().aggregate(heavy_tailed_answers(10_000, seed=3))
+    sketch = TopKSketch.from_counts(exact, capacity=20)
+
+    tracked = sketch.to_counts().head(20)
+    assert not sketch.errors.any()
+    assert (tracked == exact[tracked.index]).all()
+    assert list(tracked) == list(exact.head(20))
+
+
+def high_cardinality_frame(labels) -> pd.DataFrame:
+    n = len(labels)
+    return pd.DataFrame({
+        DATE_COL: pd.date_range("2025-01-01", periods=n, freq="min"),
+        PARTICIPANT_COL: [f"user{i}" for i in range(n)],
+        "Q1. 거주 동네": labels,
+    })
+
+
+def test_aggregates_compute_exact_counts_on_demand():
+    labels = heavy_tailed_answers(20_000, seed=4)
+    df = high_cardinality_frame(labels)
+    aggregates = compute_aggregates(df, QuestionParser().parse(df))
+    aggregate = aggregates["Q1. 거주 동네"]
+
+    # 정확한 집계는 요청 전까지 만들지 않고, 요약의 오차 범위는 실제 값을 반영
+    assert aggregate.counts is None and aggregate.counts_with_blank is None
+    sketch = aggregate.get_sketch(False)
+    assert sketch.max_error > 0 and sketch.errors.any()
+    assert aggregates.get_display_counts("Q1. 거주 동네", False).index[-1] == UNTRACKED_LABEL
+
+    counts = aggregates.get_counts("Q1. 거주 동네", False)
+    assert UNTRACKED_LABEL not in counts.index
+    assert counts.sum() == sketch.total
+    assert_bounds(sketch, counts)
+    assert aggregates.get_counts("Q1. 거주 동네", False) is counts
+
+
+def test_streaming_load_builds_sketch_from_chunks():
+    df = high_cardinality_frame(heavy_tailed_answers(6_000, seed=5))
+    buffer = io.BytesIO()
+    df.to_excel(buffer, sheet_name="응답", index=False)
+
+    dataset = build_dataset(ChunkedExcelDataLoader(io.BytesIO(buffer.getvalue()), chunk_size=500), "응답")
+    aggregates = dataset.aggregates
+    for include_blank in (False, True):
+        sketch = aggregates.get_sketch("Q1. 거주 동네", include_blank)
+        exact = aggregates.get_counts("Q1. 거주 동네", include_blank)
+        # 한 번에 센 요약은 오차가 0이므로, 오차가 있으면 로딩 청크로 만든 요약
+        assert sketch.errors.any()
+        assert_bounds(sketch, exact)
+        assert exact.equals(SingleSelectAggregator().aggregate(df["Q1. 거주 동네"], include_blank))
+
+
+def test_compare_waves_uses_exact_counts_for_summarized_questions():
+    rare = [f"지역{i}" for i in range(TOP_K_DISTINCT_THRESHOLD + 500)]
+    waves = {
+        "1차": build_dataset_from_frame(high_cardinality_frame(rare + ["X"] * 5)),
+        "2차": build_dataset_from_frame(high_cardinality_frame(rare[::-1] + ["X"])),
+    }
+    table = compare_waves(waves).loc["거주 동네"]
+
+    assert UNTRACKED_LABEL not in table.index
+    assert table.loc["X", (COUNT_COL, "1차")] == 5
+    assert table.loc["X", (COUNT_COL, "2차")] == 1
@@ -0,0 +1,25 @@
+"""스냅샷 저장/로딩 왕복 테스트"""
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey_viewer.data.snapshot import SNAPSHOT_FORMATS, read_snapshot, write_snapshot
+
+
+@pytest.mark.parametrize("format", SNAPSHOT_FORMATS)
+def test_round_trip_keeps_mixed_object_values(tmp_path, format):
+    df = pd.DataFrame({
+        "혼합": [1, "1", 2.5, np.nan, True, datetime.datetime(2025, 1, 2, 3, 4)],
+        "문자열": ["좋음", np.nan, "나쁨", "좋음", "보통", "좋음"],
+        "숫자": [1.0, 2.0, np.nan, 4.0, 5.0, 6.0],
+    })
+    path = str(tmp_path / f"sheet.{format}")
+    write_snapshot(df, path, format)
+    loaded = read_snapshot(path)
+
+    pd.testing.assert_frame_equal(loaded, df)
+    # 1과 '1'은 다른 응답으로 유지
+    assert [type(v) for v in loaded["혼합"][:3]] == [int, str, float]
+    assert read_snapshot(path, columns=["혼합"])["혼합"].tolist()[:2] == [1, "1"]
@@ -0,0 +1,33 @@
+"""공용 유틸리티 테스트 - 프로세스 전역 접근자"""
+import threading
+
+from survey_viewer.utils import process_singleton
+
+
+def test_process_singleton_builds_once_across_threads():
+    calls = []
+
+    @process_singleton
+    def get_thing() -> object:
+        """테스트용 접근자"""
+        calls.append(1)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_thing())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert get_thing.__doc__ == "테스트용 접근자"
+
+
+def test_process_singleton_reset_rebuilds():
+    get_thing = process_singleton(object)
+    first = get_thing()
+    get_thing.reset()
+
+    assert get_thing() is not first
@@ -0,0 +1,92 @@
+"""차트 미리 렌더링 테스트 - 예약 조건, 세대별 작업 정리, 실패/취소 처리"""
+import time
+from concurrent.futures import Future
+
+import pandas as pd
+import pytest
+
+from survey_viewer.data.cache import LRUCache
+from survey_viewer.visualization import warmup as warmup_module
+from survey_viewer.visualization.base import ChartOptions
+from survey_viewer.visualization.charts.pie_chart import PieChartRenderer
+from survey_viewer.visualization.warmup import ChartWarmup, WarmupRequester
+
+
+def test_sequential_rendering_skips_warmup():
+    warmup = ChartWarmup(max_workers=1, cache=LRUCache(1 << 20, lambda _: 1))
+    keys = warmup.schedule(PieChartRenderer(), [pd.Series({"A": 1, "B": 2})], ChartOptions())
+
+    assert not warmup.enabled
+    assert keys == []
+    assert warmup._thread is None
+    assert warmup.progress(keys) == (0, 0)
+
+
+class PendingPool:
+    """submit한 작업을 완료하지 않고 보관하는 렌더링 풀"""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, renderer, data, options, image_format):
+        future = Future()
+        self.submitted.append((data, future))
+        return future
+
+
+def wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = PendingPool()
+    monkeypatch.setattr(warmup_module, "get_render_pool", lambda max_workers: pool)
+    return pool
+
+
+def make_jobs(start: int, count: int) -> list:
+    return [pd.Series({"A": i, "B": 1}) for i in range(start, start + count)]
+
+
+def test_new_generation_drops_superseded_tasks(pool):
+    warmup = ChartWarmup(max_workers=2, cache=LRUCache(1 << 20, lambda _: 1))
+    requester = WarmupRequester()
+    warmup.begin(requester)
+    warmup.schedule(PieChartRenderer(), make_jobs(0, 4), ChartOptions(), requester=requester)
+    wait_until(lambda: len(pool.submitted) == 2)
+
+    # 다음 실행에서는 다른 문항만 요청
+    warmup.begin(requester)
+    warmup.schedule(PieChartRenderer(), make_jobs(10, 2), ChartOptions(), requester=requester)
+    for data, future in list(pool.submitted):
+        future.set_result((b"image", data))
+    wait_until(lambda: len(pool.submitted) == 4)
+    for data, future in pool.submitted[2:]:
+        future.set_result((b"image", data))
+    wait_until(lambda: warmup._running == 0)
+    time.sleep(0.05)
+
+    # 이전 세대에만 요청된 2, 3은 보내지 않고 버림
+    assert [data["A"] for data, _ in pool.submitted] == [0, 1, 10, 11]
+    assert warmup._tasks == {}
+
+
+def test_cancelled_and_failed_renders_count_as_finished(pool):
+    warmup = ChartWarmup(max_workers=2, cache=LRUCache(1 << 20, lambda _: 1))
+    jobs = make_jobs(0, 2)
+    keys = warmup.schedule(PieChartRenderer(), jobs, ChartOptions())
+    wait_until(lambda: len(pool.submitted) == 2)
+
+    pool.submitted[0][1].cancel()
+    pool.submitted[1][1].set_exception(RuntimeError("render failed"))
+
+    wait_until(lambda: warmup.progress(keys) == (2, 2))
+    assert warmup._running == 0
+    # 실패한 차트는 다시 예약하지 않음
+    warmup.schedule(PieChartRenderer(), jobs, ChartOptions())
+    time.sleep(0.05)
+    assert len(pool.submitted) == 2
@@ -0,0 +1,68 @@
+"""여러 시트 로딩과 차수 비교 테스트"""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey_viewer.analysis.dataset import build_dataset_from_frame
+from survey_viewer.analysis.waves import COUNT_COL, COUNT_DELTA_COL, PERCENT_COL, compare_waves
+from survey_viewer.config.constants import DATE_COL, PARTICIPANT_COL
+from survey_viewer.data.loader import ExcelDataLoader
+
+
+def make_wave(answers: dict, n: int = 6) -> pd.DataFrame:
+    df = pd.DataFrame({
+        DATE_COL: pd.date_range("2025-01-01", periods=n, freq="min"),
+        PARTICIPANT_COL: [f"user{i}" for i in range(n)],
+    })
+    for title, values in answers.items():
+        df[title] = values
+    return df
+
+
+WAVES = {
+    "1차": make_wave({
+        "Q1. 만족도는?": ["좋음", "좋음", "나쁨", "좋음", "나쁨", "좋음"],
+        "Q2. 재구매 의향": ["예", "아니오", "예", "예", "예", "아니오"],
+    }),
+    "2차": make_wave({
+        "Q1. 만족도는?": ["좋음"] * 6,
+    }),
+}
+
+
+@pytest.fixture(scope="module")
+def workbook() -> bytes:
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer) as writer:
+        for name, df in WAVES.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_load_sheets_matches_load_sheet(workbook, max_workers):
+    frames = ExcelDataLoader(io.BytesIO(workbook)).load_sheets(max_workers=max_workers)
+    single = ExcelDataLoader(io.BytesIO(workbook))
+
+    assert list(frames) == list(WAVES)
+    for name, df in frames.items():
+        pd.testing.assert_frame_equal(df, single.load_sheet(name))
+
+
+def test_compare_waves_missing_question_and_unchosen_answer():
+    waves = {name: build_dataset_from_frame(df.copy()) for name, df in WAVES.items()}
+    table = compare_waves(waves)
+
+    # 2차에 없는 문항은 NaN
+    repurchase = table.loc["재구매 의향"]
+    assert repurchase[(COUNT_COL, "1차")].to_dict() == {"예": 4, "아니오": 2}
+    assert repurchase[(COUNT_COL, "2차")].isna().all()
+
+    # 2차에서 아무도 고르지 않은 응답은 0, 증감은 직전 차수 대비
+    satisfaction = table.loc["만족도는?"]
+    assert satisfaction.loc["나쁨", (COUNT_COL, "2차")] == 0
+    assert satisfaction.loc["나쁨", (COUNT_DELTA_COL, "2차")] == -2
+    assert satisfaction.loc["좋음", (PERCENT_COL, "2차")] == 100
+    assert np.isnan(satisfaction.loc["좋음", (COUNT_DELTA_COL, "1차")])